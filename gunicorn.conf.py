@@ -0,0 +1,37 @@
+"""
+Configuración de gunicorn
+=========================
+
+Uso:
+    gunicorn src.main:app -c gunicorn.conf.py
+
+Con varios workers las métricas Prometheus se comparten a través de
+PROMETHEUS_MULTIPROC_DIR (ver src/infrastructure/metrics/prometheus.py):
+- el directorio se vacía al arrancar el master (no mezclar corridas)
+- al terminar un worker se marca muerto para que sus gauges dejen de
+  sumar
+"""
+
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/pdf_exports/prometheus")
+
+from prometheus_client import multiprocess  # noqa: E402  (después de definir el directorio)
+
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WORKERS", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server):
+    """Vacía el directorio de métricas de una corrida anterior."""
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Descarta los gauges "live" del worker que terminó."""
+    multiprocess.mark_process_dead(worker.pid)
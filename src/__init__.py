@@ -2,8 +2,17 @@
 # Source Package
 # ================================
 # Punto de entrada del paquete src.
+#
+# `app` se resuelve al primer acceso (`from src import app`): importar
+# cualquier subpaquete (p.ej. src.domain en un proceso hijo del pool de
+# renders) no carga la aplicación web entera.
 # ================================
 
-from src.main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    if name == "app":
+        from src.main import app
+        return app
+    raise AttributeError(f"module 'src' has no attribute {name!r}")
@@ -0,0 +1,10 @@
+# ================================
+# Application Cache
+# ================================
+# Caché de PDFs generados, direccionada por contenido:
+# la clave es el hash canónico del DTO de entrada.
+# ================================
+
+from .pdf_output_cache import PDFOutputCache, CacheStats
+
+__all__ = ["PDFOutputCache", "CacheStats"]
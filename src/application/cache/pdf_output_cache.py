@@ -0,0 +1,163 @@
+"""
+PDF Output Cache
+================
+
+Caché en memoria de resultados de generación de PDF.
+
+Decisiones técnicas:
+- Direccionada por contenido: la clave es un hash canónico del DTO
+- Acotada por presupuesto total de bytes (no por cantidad de entradas)
+- Desalojo LRU usando OrderedDict
+- Thread-safe: los use cases se ejecutan en un thread pool
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Estadísticas de la caché.
+    
+    Atributos:
+        hits: Cantidad de aciertos
+        misses: Cantidad de fallos
+        evictions: Entradas desalojadas por falta de espacio
+        entries: Entradas actuales
+        size_bytes: Bytes ocupados por los PDFs cacheados
+        max_bytes: Presupuesto total de bytes
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Proporción de aciertos sobre el total de consultas."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convierte las estadísticas a un diccionario."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+class PDFOutputCache:
+    """
+    Caché LRU de resultados de PDF acotada por bytes.
+    
+    Guarda el objeto resultado del use case completo (contenido y
+    nombre de archivo). El tamaño de cada entrada es el tamaño del PDF.
+    
+    Ejemplo:
+        >>> cache = PDFOutputCache(max_bytes=64 * 1024 * 1024)
+        >>> cache.put(key, result)
+        >>> cache.get(key) is result
+        True
+    """
+    
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_bytes: Presupuesto total de bytes para los PDFs cacheados
+        """
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def max_entry_bytes(self) -> int:
+        """Tamaño máximo de un PDF cacheable (los más grandes no se guardan)."""
+        return self._max_bytes
+    
+    def get(self, key: str) -> Any | None:
+        """
+        Obtiene un resultado cacheado y lo marca como usado recientemente.
+        
+        Args:
+            key: Clave (hash canónico)
+            
+        Returns:
+            El resultado cacheado, o None si no existe
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+    
+    def __contains__(self, key: str) -> bool:
+        """True si la clave está cacheada (sin contar acierto ni reordenar)."""
+        with self._lock:
+            return key in self._entries
+    
+    def put(self, key: str, result: Any) -> None:
+        """
+        Guarda un resultado, desalojando los menos usados si hace falta.
+        
+        Los resultados más grandes que el presupuesto total no se guardan.
+        
+        Args:
+            key: Clave (hash canónico)
+            result: Resultado del use case (debe tener atributo `content`)
+        """
+        size = len(result.content)
+        if size > self.max_entry_bytes:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            
+            while self._entries and self._size_bytes + size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+            
+            self._entries[key] = (result, size)
+            self._size_bytes += size
+    
+    def clear(self) -> None:
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+    
+    def stats(self) -> CacheStats:
+        """Retorna una foto de las estadísticas actuales."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
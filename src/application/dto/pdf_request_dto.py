@@ -31,10 +31,12 @@ class PDFTableDTO:
         headers: Encabezados de la tabla
         rows: Filas de datos
         title: Título opcional de la tabla
+        columns: Datos por columna (alternativa compacta a `rows`)
     """
     headers: list[str]
     rows: list[list[str]]
     title: str | None = None
+    columns: list[list[str]] | None = None
 
 
 @dataclass
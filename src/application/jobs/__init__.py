@@ -0,0 +1,10 @@
+# ================================
+# Application Jobs
+# ================================
+# Generación asíncrona de PDFs: cola persistente de jobs
+# procesada por workers dentro del mismo proceso.
+# ================================
+
+from .job_worker_pool import JobWorkerPool
+
+__all__ = ["JobWorkerPool"]
@@ -0,0 +1,318 @@
+"""
+Job Worker Pool
+===============
+
+Workers en proceso que ejecutan los jobs de render asíncronos.
+
+Flujo:
+1. `submit` guarda el job como PENDING y lo encola; el endpoint
+   responde el ID sin esperar al render
+2. Cada worker toma un ID, marca el job RUNNING y renderiza en el
+   executor de renders (el mismo que usan los endpoints síncronos)
+3. El PDF y el estado final se guardan juntos en el repositorio
+
+Repositorio:
+- Las operaciones del repositorio (SQLite) bloquean: desde el event
+  loop corren en un thread (`asyncio.to_thread`), así guardar o leer
+  un PDF grande no frena a los demás requests
+
+Reinicios:
+- Al arrancar, los jobs que quedaron RUNNING (el proceso se detuvo a
+  mitad del render) vuelven a PENDING y todos los pendientes se
+  encolan de nuevo. Solo los abandonados: su proceso dueño murió o
+  lo tomó hace más de `lease`; los que renderiza otro worker de
+  gunicorn vivo siguen siendo suyos
+- Un job que ya agotó `max_attempts` se marca FAILED en lugar de
+  reintentarse para siempre (p.ej. uno que tira abajo el proceso)
+
+Errores:
+- Errores de dominio (datos inválidos): FAILED, reintentar no cambia nada
+- Executor saturado: se espera `retry_after` y se reintenta sin
+  consumir un intento
+- Otros errores: se reintenta hasta `max_attempts`, esperando
+  `retry_backoff * intentos` antes de reencolar (un fallo transitorio
+  no consume todos los intentos en milisegundos)
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from src.domain.entities import JobStatus, RenderJob
+from src.domain.exceptions import (
+    DocumentNotFoundError,
+    DomainException,
+    JobNotReadyError,
+    ServiceOverloadedError,
+)
+from src.domain.interfaces import IJobRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorkerPool:
+    """
+    Cola persistente de renders con N workers asyncio.
+
+    Ejemplo:
+        >>> pool = JobWorkerPool(
+        ...     repository,
+        ...     handlers={"comprobante_postulacion": render_postulacion},
+        ...     executor=render_executor,
+        ... )
+        >>> await pool.start()
+        >>> job = await pool.submit("comprobante_postulacion", payload)
+        >>> (await pool.get(job.id)).status
+        <JobStatus.PENDING: 'pending'>
+    """
+
+    def __init__(
+        self,
+        repository: IJobRepository,
+        handlers: dict[str, Callable[[dict[str, Any]], Any]],
+        executor: Any,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retention: timedelta | None = None,
+        lease: timedelta = timedelta(minutes=15),
+        retry_backoff: float = 2.0,
+    ) -> None:
+        """
+        Inicializa el pool (los workers arrancan con `start`).
+
+        Args:
+            repository: Repositorio persistente de jobs
+            handlers: Por tipo de job, función que recibe el payload y
+                      retorna un resultado con `content` y `filename`
+            executor: Executor de renders (expone `async run(fn, *args)`)
+            workers: Jobs renderizándose a la vez
+            max_attempts: Intentos máximos por job
+            retention: Antigüedad a partir de la cual se borran los jobs
+                       terminados al arrancar (None = no se borran)
+            lease: Tiempo tras el cual un job RUNNING de otro proceso
+                   se considera abandonado y se retoma al arrancar
+            retry_backoff: Segundos de espera por intento antes de
+                           reintentar un job que falló
+        """
+        self._repository = repository
+        self._handlers = handlers
+        self._executor = executor
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retention = retention
+        self._lease = lease
+        self._retry_backoff = retry_backoff
+        # La cola se crea en `start`, dentro del event loop que la usa
+        self._queue: asyncio.Queue[str] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._running = 0
+
+    @property
+    def started(self) -> bool:
+        """True si los workers están corriendo."""
+        return bool(self._tasks)
+
+    # ================================
+    # Ciclo de vida
+    # ================================
+
+    async def start(self) -> None:
+        """Recupera los jobs pendientes y arranca los workers."""
+        if self._tasks:
+            return
+        if self._retention is not None:
+            purged = await asyncio.to_thread(
+                self._repository.purge_finished,
+                datetime.now(timezone.utc) - self._retention,
+            )
+            if purged:
+                logger.info("Jobs terminados borrados: %d", purged)
+        self._queue = asyncio.Queue()
+        requeued = await asyncio.to_thread(self._repository.requeue_running, self._lease)
+        if requeued:
+            logger.info("Jobs interrumpidos devueltos a la cola: %d", requeued)
+        for job_id in await asyncio.to_thread(self._repository.pending_ids):
+            self._queue.put_nowait(job_id)
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"pdf-job-worker-{i}")
+            for i in range(self._workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Detiene los workers.
+
+        Los jobs en curso quedan RUNNING en el repositorio y se
+        reintentan en el próximo `start`.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    # ================================
+    # API
+    # ================================
+
+    async def submit(self, tipo: str, payload: dict[str, Any]) -> RenderJob:
+        """
+        Crea un job PENDING y lo encola.
+
+        Si los workers no arrancaron, el job queda guardado y se
+        encola en el próximo `start`.
+
+        Args:
+            tipo: Tipo de comprobante (debe tener un handler)
+            payload: Datos validados del request
+
+        Returns:
+            El job creado
+        """
+        if tipo not in self._handlers:
+            raise ValueError(f"Tipo de job desconocido: {tipo}")
+        job = RenderJob(tipo=tipo, payload=payload)
+        await asyncio.to_thread(self._repository.save, job)
+        if self._queue is not None:
+            self._queue.put_nowait(job.id)
+        return job
+
+    def store_result(
+        self,
+        tipo: str,
+        payload: dict[str, Any],
+        content: bytes,
+        filename: str,
+    ) -> RenderJob:
+        """
+        Guarda un PDF ya renderizado como job terminado.
+
+        Para endpoints que renderizan por su cuenta pero devuelven una
+        referencia descargable (`get_result`) en lugar del contenido.
+        Es bloqueante: se llama desde el thread de render, no desde el
+        event loop.
+
+        Args:
+            tipo: Tipo de comprobante
+            payload: Datos validados del request
+            content: PDF generado
+            filename: Nombre del PDF
+
+        Returns:
+            El job creado, ya SUCCEEDED
+        """
+        job = RenderJob(tipo=tipo, payload=payload, attempts=1)
+        job.mark_succeeded(filename)
+        self._repository.save(job)
+        self._repository.save_result(job, content)
+        return job
+
+    async def get(self, job_id: str) -> RenderJob:
+        """
+        Retorna el estado de un job.
+
+        Raises:
+            DocumentNotFoundError: Si el job no existe
+        """
+        job = await asyncio.to_thread(self._repository.get, job_id)
+        if job is None:
+            raise DocumentNotFoundError("Job no encontrado", details={"job_id": job_id})
+        return job
+
+    async def get_result(self, job_id: str) -> tuple[RenderJob, bytes]:
+        """
+        Retorna el job terminado y su PDF.
+
+        Raises:
+            DocumentNotFoundError: Si el job no existe
+            JobNotReadyError: Si el job no terminó bien
+        """
+        job = await self.get(job_id)
+        content = (
+            await asyncio.to_thread(self._repository.get_result, job_id)
+            if job.status == JobStatus.SUCCEEDED
+            else None
+        )
+        if content is None:
+            raise JobNotReadyError(
+                details={"job_id": job_id, "status": job.status.value, "error": job.error},
+            )
+        return job, content
+
+    def stats(self) -> dict[str, int]:
+        """Jobs esperando y renderizándose en este proceso."""
+        return {
+            "workers": self._workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+        }
+
+    # ================================
+    # Workers
+    # ================================
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error inesperado procesando el job %s", job_id)
+
+    async def _process(self, job_id: str) -> None:
+        # Atómico: otro worker (u otro proceso) pudo haberlo tomado
+        job = await asyncio.to_thread(self._repository.claim, job_id)
+        if job is None:
+            return
+
+        if job.attempts > self._max_attempts:
+            job.mark_failed({
+                "error": "MAX_ATTEMPTS_EXCEEDED",
+                "message": "El job se interrumpió demasiadas veces",
+                "details": {"attempts": job.attempts - 1},
+            })
+            await asyncio.to_thread(self._repository.save, job)
+            return
+
+        self._running += 1
+        try:
+            result = await self._render(job)
+        finally:
+            self._running -= 1
+
+        if result is None:
+            return
+        job.mark_succeeded(result.filename)
+        await asyncio.to_thread(self._repository.save_result, job, result.content)
+
+    async def _render(self, job: RenderJob) -> Any:
+        """Renderiza el job; retorna None si terminó en error o se reencoló."""
+        handler = self._handlers[job.tipo]
+        while True:
+            try:
+                return await self._executor.run(handler, job.payload)
+            except ServiceOverloadedError as e:
+                await asyncio.sleep(e.retry_after)
+            except DomainException as e:
+                job.mark_failed(e.to_dict())
+                await asyncio.to_thread(self._repository.save, job)
+                return None
+            except Exception as e:
+                logger.warning("Job %s falló (intento %d): %s", job.id, job.attempts, e)
+                if job.attempts >= self._max_attempts:
+                    job.mark_failed({"error": "INTERNAL_ERROR", "message": str(e), "details": {}})
+                    await asyncio.to_thread(self._repository.save, job)
+                else:
+                    job.mark_pending()
+                    await asyncio.to_thread(self._repository.save, job)
+                    # Sin ocupar el worker mientras espera; si el pool se
+                    # detiene antes, el job sigue PENDING y se retoma al arrancar
+                    asyncio.get_running_loop().call_later(
+                        self._retry_backoff * job.attempts, self._queue.put_nowait, job.id
+                    )
+                return None
@@ -0,0 +1,174 @@
+"""
+Cached Comprobante Use Case
+===========================
+
+Decorador de los casos de uso de comprobantes que agrega una caché
+de salida direccionada por contenido.
+
+El backend Golang suele pedir varias veces el mismo comprobante
+(reintentos, descargas repetidas). Un acierto de caché retorna los
+bytes y el nombre de archivo guardados sin tocar ReportLab.
+
+Funciona con cualquier use case que exponga:
+- execute(comprobante, style) -> resultado con `content` y `document_id`
+- execute_to_stream(comprobante, stream, style) -> document_id
+- filename_for(comprobante) -> nombre del archivo
+- build_result(comprobante, content, document_id) -> resultado
+"""
+
+from io import BytesIO
+from typing import Any, BinaryIO
+
+from src.domain.value_objects import PDFStyle
+from src.application.cache import PDFOutputCache
+from src.application.utils.hash_utils import canonical_hash
+
+
+class CachedComprobanteUseCase:
+    """
+    Envuelve un caso de uso de comprobante con una caché de salida.
+
+    La clave es el hash canónico de (namespace, DTO, estilo). El
+    namespace separa tipos de documento que podrían compartir DTOs.
+
+    Ejemplo:
+        >>> cache = PDFOutputCache(max_bytes=64 * 1024 * 1024)
+        >>> use_case = CachedComprobanteUseCase(
+        ...     GenerarComprobantePostulacionUseCase(generator),
+        ...     cache,
+        ...     namespace="comprobante_postulacion",
+        ... )
+        >>> result = use_case.execute(comprobante_dto)
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        cache: PDFOutputCache,
+        namespace: str,
+    ) -> None:
+        """
+        Inicializa el decorador.
+
+        Args:
+            inner: Caso de uso real que genera el PDF
+            cache: Caché de salida compartida
+            namespace: Identificador del tipo de documento
+        """
+        self._inner = inner
+        self._cache = cache
+        self._namespace = namespace
+
+    @property
+    def inner(self) -> Any:
+        """Caso de uso envuelto."""
+        return self._inner
+
+    @property
+    def TEMPLATE_VERSION(self) -> str:
+        """Versión de plantilla del caso de uso envuelto (para el ETag)."""
+        return self._inner.TEMPLATE_VERSION
+
+    def filename_for(self, comprobante: Any) -> str:
+        """Nombre del archivo PDF del caso de uso envuelto."""
+        return self._inner.filename_for(comprobante)
+
+    def cache_key(self, comprobante: Any, style: PDFStyle | None = None) -> str:
+        """Calcula la clave de caché para un DTO y un estilo."""
+        return canonical_hash({
+            "namespace": self._namespace,
+            "comprobante": comprobante,
+            "style": style,
+        })
+
+    def is_cached(self, comprobante: Any, style: PDFStyle | None = None) -> bool:
+        """True si el PDF del comprobante ya está en la caché."""
+        return self.cache_key(comprobante, style) in self._cache
+
+    def execute(self, comprobante: Any, style: PDFStyle | None = None) -> Any:
+        """
+        Ejecuta el caso de uso, usando la caché si es posible.
+
+        Args:
+            comprobante: DTO del comprobante
+            style: Estilos opcionales del PDF
+
+        Returns:
+            El resultado cacheado o recién generado
+        """
+        key = self.cache_key(comprobante, style)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._inner.execute(comprobante, style)
+        self._cache.put(key, result)
+        return result
+
+    def execute_to_stream(
+        self,
+        comprobante: Any,
+        stream: BinaryIO,
+        style: PDFStyle | None = None,
+    ) -> str:
+        """
+        Ejecuta el caso de uso escribiendo a un stream.
+
+        En un acierto se escriben los bytes cacheados; en un fallo
+        se delega al caso de uso real copiando lo escrito para
+        cachearlo al terminar. Si el PDF supera el tamaño máximo de
+        una entrada, se deja de copiar y no se cachea.
+
+        Returns:
+            El ID del documento generado
+        """
+        key = self.cache_key(comprobante, style)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            stream.write(cached.content)
+            return cached.document_id
+
+        tee = _TeeStream(stream, max_bytes=self._cache.max_entry_bytes)
+        document_id = self._inner.execute_to_stream(comprobante, tee, style)
+        if not tee.overflowed:
+            self._cache.put(
+                key,
+                self._inner.build_result(comprobante, tee.getvalue(), document_id),
+            )
+        return document_id
+
+
+class _TeeStream:
+    """
+    Stream que escribe en el destino y guarda una copia en memoria.
+
+    La copia se descarta en cuanto supera `max_bytes`: el PDF no
+    entraría en la caché y no vale la pena retenerlo.
+    """
+
+    def __init__(self, target: BinaryIO, max_bytes: int) -> None:
+        self._target = target
+        self._copy: BytesIO | None = BytesIO()
+        self._max_bytes = max_bytes
+
+    @property
+    def overflowed(self) -> bool:
+        """True si lo escrito superó `max_bytes` (no hay copia)."""
+        return self._copy is None
+
+    def write(self, data: bytes) -> int:
+        self._target.write(data)
+        if self._copy is not None:
+            if self._copy.tell() + len(data) > self._max_bytes:
+                self._copy = None
+            else:
+                self._copy.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def getvalue(self) -> bytes:
+        return self._copy.getvalue() if self._copy is not None else b""
@@ -18,12 +18,14 @@ Estructura del contrato:
 
 from dataclasses import dataclass
 from typing import BinaryIO
-import os
 
 from src.domain.entities import PDFDocument, PDFSection, PDFTable
 from src.domain.exceptions import InvalidDocumentError, PDFGenerationError
 from src.domain.interfaces import IPDFGenerator
 from src.domain.value_objects import PDFStyle
+from src.application.utils.assets import get_logo_path
+from src.application.utils.hash_utils import content_uuid
+from src.application.utils.stage_timing import stage
 from src.application.dto import ComprobanteContratoDTO
 
 
@@ -68,14 +70,25 @@ class GenerarComprobanteContratoUseCase:
         >>> pdf_bytes = result.content
     """
     
-    def __init__(self, pdf_generator: IPDFGenerator) -> None:
+    # Versión de la plantilla del documento. Incrementarla cuando cambie
+    # el layout o el texto, para invalidar ETags y cachés de clientes.
+    TEMPLATE_VERSION = "1"
+    
+    def __init__(
+        self,
+        pdf_generator: IPDFGenerator,
+        deterministic: bool = False,
+    ) -> None:
         """
         Inicializa el caso de uso.
         
         Args:
             pdf_generator: Implementación del generador de PDF
+            deterministic: Si es True, el ID del documento se deriva del
+                           contenido del DTO (renderizado reproducible)
         """
         self._generator = pdf_generator
+        self._deterministic = deterministic
     
     def execute(
         self,
@@ -100,10 +113,11 @@ class GenerarComprobanteContratoUseCase:
         self._validate_comprobante(comprobante)
         
         # 2. Construir el documento PDF
-        document = self._build_document(comprobante)
+        with stage("build_document"):
+            document = self._build_document(comprobante)
         
-        # 3. Usar estilo predeterminado si no se proporciona
-        pdf_style = style or PDFStyle.default()
+        # 3. Usar el estilo institucional si no se proporciona
+        pdf_style = style or PDFStyle.institutional()
         
         # 4. Generar el PDF
         try:
@@ -121,10 +135,23 @@ class GenerarComprobanteContratoUseCase:
         document.mark_as_generated()
         
         # 6. Retornar resultado
+        return self.build_result(comprobante, content, str(document.id))
+    
+    def filename_for(self, comprobante: ComprobanteContratoDTO) -> str:
+        """Nombre del archivo PDF (se conoce antes de renderizar)."""
+        return f"contrato_pasantia_{comprobante.contrato.numero}.pdf"
+    
+    def build_result(
+        self,
+        comprobante: ComprobanteContratoDTO,
+        content: bytes,
+        document_id: str,
+    ) -> GenerarContratoResult:
+        """Arma el resultado a partir de bytes ya generados (p.ej. por streaming)."""
         return GenerarContratoResult(
             content=content,
-            filename=f"contrato_pasantia_{comprobante.contrato.numero}.pdf",
-            document_id=str(document.id),
+            filename=self.filename_for(comprobante),
+            document_id=document_id,
             numero_contrato=comprobante.contrato.numero,
         )
     
@@ -148,8 +175,9 @@ class GenerarComprobanteContratoUseCase:
             El ID del documento generado
         """
         self._validate_comprobante(comprobante)
-        document = self._build_document(comprobante)
-        pdf_style = style or PDFStyle.default()
+        with stage("build_document"):
+            document = self._build_document(comprobante)
+        pdf_style = style or PDFStyle.institutional()
         
         try:
             self._generator.generate_to_stream(document, stream, pdf_style)
@@ -187,9 +215,7 @@ class GenerarComprobanteContratoUseCase:
     
     def _build_document(self, comprobante: ComprobanteContratoDTO) -> PDFDocument:
         """Construye el PDFDocument con estructura de contrato formal."""
-        # Obtener ruta del logo
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        logo_path = os.path.join(base_dir, "utils", "images", "logoUTN.png")
+        logo_path = get_logo_path()
         
         document = PDFDocument(
             title="CONTRATO DE PASANTÍA",
@@ -200,7 +226,7 @@ class GenerarComprobanteContratoUseCase:
                 "numero_contrato": comprobante.contrato.numero,
                 "tipo_documento": "contrato_pasantia",
                 "estudiante_dni": comprobante.estudiante.dni,
-                "logo_path": logo_path if os.path.exists(logo_path) else None,
+                "logo_path": logo_path,
                 "universidad_nombre": comprobante.universidad.nombre,
                 "universidad_correo": comprobante.universidad.correo,
                 "empresa_nombre": comprobante.empresa.nombre,
@@ -208,6 +234,10 @@ class GenerarComprobanteContratoUseCase:
             },
         )
         
+        # Modo determinístico: el ID depende solo del contenido del DTO
+        if self._deterministic:
+            document.id = content_uuid(comprobante)
+        
         # 1. Sección Header - Universidad
         document.add_section(self._build_header_universidad(comprobante))
         
@@ -19,6 +19,9 @@ from src.domain.entities import PDFDocument, PDFSection, PDFTable
 from src.domain.exceptions import InvalidDocumentError, PDFGenerationError
 from src.domain.interfaces import IPDFGenerator
 from src.domain.value_objects import PDFStyle
+from src.application.utils.assets import get_logo_path
+from src.application.utils.hash_utils import content_uuid
+from src.application.utils.stage_timing import stage
 from src.application.dto import ComprobantePostulacionDTO
 
 
@@ -61,14 +64,25 @@ class GenerarComprobantePostulacionUseCase:
         >>> pdf_bytes = result.content
     """
     
-    def __init__(self, pdf_generator: IPDFGenerator) -> None:
+    # Versión de la plantilla del documento. Incrementarla cuando cambie
+    # el layout o el texto, para invalidar ETags y cachés de clientes.
+    TEMPLATE_VERSION = "1"
+    
+    def __init__(
+        self,
+        pdf_generator: IPDFGenerator,
+        deterministic: bool = False,
+    ) -> None:
         """
         Inicializa el caso de uso.
         
         Args:
             pdf_generator: Implementación del generador de PDF
+            deterministic: Si es True, el ID del documento se deriva del
+                           contenido del DTO (renderizado reproducible)
         """
         self._generator = pdf_generator
+        self._deterministic = deterministic
     
     def execute(
         self,
@@ -93,10 +107,11 @@ class GenerarComprobantePostulacionUseCase:
         self._validate_comprobante(comprobante)
         
         # 2. Construir el documento PDF
-        document = self._build_document(comprobante)
+        with stage("build_document"):
+            document = self._build_document(comprobante)
         
-        # 3. Usar estilo predeterminado si no se proporciona
-        pdf_style = style or PDFStyle.default()
+        # 3. Usar el estilo institucional si no se proporciona
+        pdf_style = style or PDFStyle.institutional()
         
         # 4. Generar el PDF
         try:
@@ -114,10 +129,23 @@ class GenerarComprobantePostulacionUseCase:
         document.mark_as_generated()
         
         # 6. Retornar resultado
+        return self.build_result(comprobante, content, str(document.id))
+    
+    def filename_for(self, comprobante: ComprobantePostulacionDTO) -> str:
+        """Nombre del archivo PDF (se conoce antes de renderizar)."""
+        return f"comprobante_postulacion_{comprobante.postulacion.numero}.pdf"
+    
+    def build_result(
+        self,
+        comprobante: ComprobantePostulacionDTO,
+        content: bytes,
+        document_id: str,
+    ) -> GenerarComprobanteResult:
+        """Arma el resultado a partir de bytes ya generados (p.ej. por streaming)."""
         return GenerarComprobanteResult(
             content=content,
-            filename=f"comprobante_postulacion_{comprobante.postulacion.numero}.pdf",
-            document_id=str(document.id),
+            filename=self.filename_for(comprobante),
+            document_id=document_id,
             numero_postulacion=comprobante.postulacion.numero,
         )
     
@@ -141,8 +169,9 @@ class GenerarComprobantePostulacionUseCase:
             El ID del documento generado
         """
         self._validate_comprobante(comprobante)
-        document = self._build_document(comprobante)
-        pdf_style = style or PDFStyle.default()
+        with stage("build_document"):
+            document = self._build_document(comprobante)
+        pdf_style = style or PDFStyle.institutional()
         
         try:
             self._generator.generate_to_stream(document, stream, pdf_style)
@@ -180,11 +209,7 @@ class GenerarComprobantePostulacionUseCase:
     
     def _build_document(self, comprobante: ComprobantePostulacionDTO) -> PDFDocument:
         """Construye el PDFDocument con estructura narrativa profesional."""
-        import os
-        
-        # Obtener ruta del logo
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        logo_path = os.path.join(base_dir, "utils", "images", "logoUTN.png")
+        logo_path = get_logo_path()
         
         document = PDFDocument(
             title=f"Comprobante de Postulación N° {comprobante.postulacion.numero}",
@@ -195,7 +220,7 @@ class GenerarComprobantePostulacionUseCase:
                 "numero_postulacion": comprobante.postulacion.numero,
                 "tipo_documento": "comprobante_postulacion",
                 "estudiante_dni": comprobante.estudiante.dni,
-                "logo_path": logo_path if os.path.exists(logo_path) else None,
+                "logo_path": logo_path,
                 "universidad_nombre": comprobante.universidad.nombre,
                 "universidad_correo": comprobante.universidad.correo,
                 "empresa_nombre": comprobante.empresa.nombre,
@@ -203,6 +228,10 @@ class GenerarComprobantePostulacionUseCase:
             },
         )
         
+        # Modo determinístico: el ID depende solo del contenido del DTO
+        if self._deterministic:
+            document.id = content_uuid(comprobante)
+        
         # 1. Sección Principal - Tabla compacta con datos clave
         document.add_section(self._build_tabla_datos_clave(comprobante))
         
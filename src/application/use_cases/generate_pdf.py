@@ -20,10 +20,12 @@ Este caso de uso:
 from dataclasses import dataclass
 from typing import BinaryIO
 
-from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.domain.entities import ColumnarTable, PDFDocument, PDFSection, PDFTable
 from src.domain.exceptions import InvalidDocumentError, PDFGenerationError
 from src.domain.interfaces import IPDFGenerator
 from src.domain.value_objects import PDFStyle, ColorConfig, FontConfig, MarginConfig
+from src.application.utils.hash_utils import content_uuid
+from src.application.utils.stage_timing import stage
 from src.application.dto import PDFRequestDTO, PDFSectionDTO, PDFTableDTO, PDFStyleDTO
 
 
@@ -60,15 +62,22 @@ class GeneratePDFUseCase:
         >>> pdf_bytes = result.content
     """
     
-    def __init__(self, pdf_generator: IPDFGenerator) -> None:
+    def __init__(
+        self,
+        pdf_generator: IPDFGenerator,
+        deterministic: bool = False,
+    ) -> None:
         """
         Inicializa el caso de uso.
         
         Args:
             pdf_generator: Implementación del generador de PDF
                           (inyectada por el contenedor de dependencias)
+            deterministic: Si es True, el ID del documento se deriva del
+                           contenido del DTO (renderizado reproducible)
         """
         self._generator = pdf_generator
+        self._deterministic = deterministic
     
     def execute(
         self, 
@@ -93,7 +102,8 @@ class GeneratePDFUseCase:
         self._validate_request(request)
         
         # 2. Construir el documento del dominio
-        document = self._build_document(request)
+        with stage("build_document"):
+            document = self._build_document(request)
         
         # 3. Convertir estilo DTO a value object si es necesario
         pdf_style: PDFStyle
@@ -143,7 +153,8 @@ class GeneratePDFUseCase:
             El ID del documento generado
         """
         self._validate_request(request)
-        document = self._build_document(request)
+        with stage("build_document"):
+            document = self._build_document(request)
         
         # Convertir estilo DTO a value object si es necesario
         pdf_style: PDFStyle
@@ -189,6 +200,10 @@ class GeneratePDFUseCase:
             metadata=request.metadata or {},
         )
         
+        # Modo determinístico: el ID depende solo del contenido del DTO
+        if self._deterministic:
+            document.id = content_uuid(request)
+        
         # Agregar secciones
         for section_dto in request.sections:
             section = self._build_section(section_dto)
@@ -212,8 +227,14 @@ class GeneratePDFUseCase:
         
         return section
     
-    def _build_table(self, table_dto: PDFTableDTO) -> PDFTable:
-        """Construye una PDFTable a partir del DTO."""
+    def _build_table(self, table_dto: PDFTableDTO) -> PDFTable | ColumnarTable:
+        """Construye una PDFTable (o ColumnarTable si viene por columnas) a partir del DTO."""
+        if table_dto.columns is not None:
+            return ColumnarTable(
+                headers=table_dto.headers,
+                columns=table_dto.columns,
+                title=table_dto.title,
+            )
         return PDFTable(
             headers=table_dto.headers,
             rows=table_dto.rows,
@@ -264,13 +285,24 @@ class GeneratePDFUseCase:
         
         return PDFStyle(colors=colors, fonts=fonts, margins=margins)
     
+    def filename_for(self, request: PDFRequestDTO) -> str:
+        """
+        Nombre del archivo PDF conocido antes de renderizar (streaming).
+        
+        El ID del documento recién se conoce al construirlo, así que
+        solo se usa el título.
+        """
+        return f"{self._safe_title(request.title) or 'documento'}.pdf"
+    
     def _generate_filename(self, document: PDFDocument) -> str:
         """Genera un nombre de archivo para el PDF."""
-        # Sanitizar el título para usarlo como nombre de archivo
+        return f"{self._safe_title(document.title)}_{document.id}.pdf"
+    
+    @staticmethod
+    def _safe_title(title: str) -> str:
+        """Sanitiza el título para usarlo como nombre de archivo."""
         safe_title = "".join(
-            c for c in document.title 
+            c for c in title
             if c.isalnum() or c in (" ", "-", "_")
         ).strip()
-        safe_title = safe_title.replace(" ", "_")
-        
-        return f"{safe_title}_{document.id}.pdf"
+        return safe_title.replace(" ", "_")
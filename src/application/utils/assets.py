@@ -0,0 +1,27 @@
+"""
+Asset Utilities
+===============
+
+Rutas de recursos estáticos (imágenes) usados por los comprobantes.
+
+Las rutas se resuelven una sola vez por proceso: los archivos vienen
+empaquetados con el servicio y no cambian en tiempo de ejecución.
+"""
+
+import os
+from functools import lru_cache
+
+
+_IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
+
+@lru_cache(maxsize=1)
+def get_logo_path() -> str | None:
+    """
+    Retorna la ruta absoluta del logo UTN.
+
+    Returns:
+        Ruta del logo, o None si el archivo no existe
+    """
+    logo_path = os.path.join(_IMAGES_DIR, "logoUTN.png")
+    return logo_path if os.path.exists(logo_path) else None
@@ -0,0 +1,84 @@
+"""
+Hash Utilities
+==============
+
+Utilidades para calcular hashes canónicos de DTOs y value objects.
+
+Un hash canónico depende SOLO del contenido: dos DTOs con los mismos
+valores producen el mismo hash, sin importar el orden de los campos
+ni la identidad de los objetos.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, time
+from typing import Any
+from uuid import UUID, uuid5
+
+
+# Namespace fijo para derivar UUIDs a partir del contenido
+CONTENT_NAMESPACE = UUID("6f1c2b1e-8f5e-4f7a-9c55-3b0d2f0e7a10")
+
+
+def _to_canonical(value: Any) -> Any:
+    """
+    Convierte un valor a estructuras JSON-serializables, recursivamente.
+    
+    Dataclasses (también dentro de dicts, listas y tuplas) con asdict(),
+    tuplas como listas y fechas como strings ISO 8601.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    if isinstance(value, dict):
+        return {str(key): _to_canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_canonical(item) for item in value]
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def canonical_json(value: Any) -> str:
+    """
+    Serializa un valor a JSON canónico.
+    
+    - Claves ordenadas y sin espacios
+    - Dataclasses convertidas con asdict(), en cualquier nivel
+    - Fechas y horas como strings ISO 8601
+    - Otros tipos no JSON (UUID, Decimal) convertidos con str()
+    
+    Args:
+        value: Dataclass, dict, lista o escalar
+        
+    Returns:
+        String JSON determinístico
+    """
+    return json.dumps(
+        _to_canonical(value),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def canonical_hash(value: Any) -> str:
+    """
+    Calcula el hash SHA-256 (hex) del JSON canónico de un valor.
+    
+    Examples:
+        >>> canonical_hash({"b": 1, "a": 2}) == canonical_hash({"a": 2, "b": 1})
+        True
+    """
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
+
+
+def content_uuid(value: Any) -> UUID:
+    """
+    Deriva un UUID determinístico (versión 5) a partir del contenido.
+    
+    Se usa como ID de documento en el modo de renderizado determinístico:
+    el mismo DTO siempre produce el mismo ID.
+    """
+    return uuid5(CONTENT_NAMESPACE, canonical_hash(value))
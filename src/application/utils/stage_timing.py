@@ -0,0 +1,219 @@
+"""
+Stage Timing
+============
+
+Medición liviana del tiempo de cada etapa de un request.
+
+Etapas típicas de un render:
+- validation: parseo del body y validación pydantic
+- mapping: schema → DTO
+- queue_wait: espera por un thread del RenderExecutor
+- build_document: DTO → PDFDocument (use case)
+- build_elements: PDFDocument → flowables (acumulado por sección)
+- doc_build: layout y escritura del PDF (incluye build_elements de las
+  secciones perezosas)
+- canvas_render / canvas_save: render directo sobre el Canvas (fast-path)
+  y escritura del PDF
+
+El `StageTimer` del request viaja en un ContextVar: el middleware lo
+crea, y el router, los use cases y el generador solo llaman a
+`stage("nombre")`. Sin timer activo (medición desactivada) `stage`
+retorna un context manager vacío: el costo es una lectura de
+ContextVar.
+
+Los threads del RenderExecutor corren con una copia del contexto del
+request, así que registran en el mismo timer.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any
+
+
+# Límites superiores de los buckets de los histogramas (milisegundos)
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class StageTimer:
+    """
+    Tiempos de las etapas de un request.
+
+    Una etapa registrada varias veces (p.ej. una por sección) acumula.
+    """
+
+    __slots__ = ("started_at", "_stages", "_lock")
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self._stages: dict[str, float] = {}
+        # Los renders de un lote registran desde varios threads a la vez
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Suma `seconds` a la etapa `name`."""
+        with self._lock:
+            self._stages[name] = self._stages.get(name, 0.0) + seconds
+
+    def mark(self, name: str) -> None:
+        """Registra como etapa el tiempo desde que arrancó el request."""
+        self.record(name, time.perf_counter() - self.started_at)
+
+    def stages(self) -> dict[str, float]:
+        """Copia de las etapas registradas hasta ahora (segundos)."""
+        with self._lock:
+            return dict(self._stages)
+
+    def server_timing(self) -> str:
+        """Valor del header Server-Timing (duraciones en ms)."""
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.stages().items()
+        )
+
+
+class _Stage:
+    """Context manager que mide una etapa en el timer dado."""
+
+    __slots__ = ("_timer", "_name", "_start")
+
+    def __init__(self, timer: StageTimer, name: str) -> None:
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._timer.record(self._name, time.perf_counter() - self._start)
+
+
+class _NoStage:
+    """Context manager vacío (medición desactivada)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NO_STAGE = _NoStage()
+_current_timer: ContextVar[StageTimer | None] = ContextVar("pdf_stage_timer", default=None)
+
+
+def start_timer() -> StageTimer:
+    """Crea el timer del request actual y lo deja activo en el contexto."""
+    timer = StageTimer()
+    _current_timer.set(timer)
+    return timer
+
+
+def stop_timer() -> None:
+    """Desactiva el timer del contexto actual."""
+    _current_timer.set(None)
+
+
+def current_timer() -> StageTimer | None:
+    """Timer activo (None si la medición está desactivada)."""
+    return _current_timer.get()
+
+
+def stage(name: str) -> _Stage | _NoStage:
+    """
+    Mide el bloque como la etapa `name` del request actual.
+
+    Ejemplo:
+        >>> with stage("build_document"):
+        ...     document = self._build_document(dto)
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        return _NO_STAGE
+    return _Stage(timer, name)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """Registra una duración ya medida en el timer activo (si hay)."""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.record(name, seconds)
+
+
+def mark_stage(name: str) -> None:
+    """Registra como etapa lo transcurrido desde el inicio del request (si hay timer)."""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.mark(name)
+
+
+class StageHistograms:
+    """
+    Histogramas por etapa, acumulados en el proceso.
+
+    Thread-safe. Buckets acumulativos al estilo Prometheus (ver
+    BUCKETS_MS).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, list] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Agrega una duración a la etapa `name`."""
+        milliseconds = seconds * 1000
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                # [conteos por bucket (+Inf al final), cantidad, suma en ms]
+                histogram = self._histograms[name] = [[0] * (len(BUCKETS_MS) + 1), 0, 0.0]
+            histogram[0][bisect_left(BUCKETS_MS, milliseconds)] += 1
+            histogram[1] += 1
+            histogram[2] += milliseconds
+
+    def observe_timer(self, timer: StageTimer, total_seconds: float | None = None) -> None:
+        """Agrega todas las etapas de un request (y su total, si se indica)."""
+        for name, seconds in timer.stages().items():
+            self.observe(name, seconds)
+        if total_seconds is not None:
+            self.observe("total", total_seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Estado de cada histograma.
+
+        Returns:
+            Por etapa: count, sum_ms, avg_ms y buckets acumulativos
+            ({"le_ms": límite, "count": n}, el último con límite "+Inf")
+        """
+        with self._lock:
+            copies = {
+                name: (list(counts), count, total)
+                for name, (counts, count, total) in self._histograms.items()
+            }
+
+        snapshot = {}
+        for name, (counts, count, total) in copies.items():
+            cumulative = 0
+            buckets = []
+            for bound, bucket_count in zip((*BUCKETS_MS, "+Inf"), counts):
+                cumulative += bucket_count
+                buckets.append({"le_ms": bound, "count": cumulative})
+            snapshot[name] = {
+                "count": count,
+                "sum_ms": round(total, 3),
+                "avg_ms": round(total / count, 3) if count else 0.0,
+                "buckets": buckets,
+            }
+        return snapshot
+
+    def clear(self) -> None:
+        """Descarta todas las observaciones."""
+        with self._lock:
+            self._histograms.clear()
+
+
+# Histogramas del proceso (los alimenta el middleware de timing)
+stage_histograms = StageHistograms()
@@ -5,6 +5,21 @@
 # Ejemplo: un PDFDocument tiene un ID único.
 # ================================
 
-from .pdf_document import PDFDocument, PDFSection, PDFTable
+from .pdf_document import (
+    ColumnarTable,
+    PDFDocument,
+    PDFSection,
+    PDFTable,
+    TableRowsView,
+)
+from .render_job import JobStatus, RenderJob
 
-__all__ = ["PDFDocument", "PDFSection", "PDFTable"]
+__all__ = [
+    "PDFDocument",
+    "PDFSection",
+    "PDFTable",
+    "ColumnarTable",
+    "TableRowsView",
+    "JobStatus",
+    "RenderJob",
+]
@@ -16,6 +16,8 @@ Decisiones técnicas:
 - Se incluyen métodos de validación del dominio
 """
 
+from collections.abc import Iterator, Sequence
+from itertools import chain
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -87,6 +89,93 @@ class PDFTable:
                 )
 
 
+class TableRowsView(Sequence):
+    """
+    Vista por filas de una tabla guardada por columnas.
+    
+    No copia nada al crearse: cada fila (o slice de filas) se arma
+    recién cuando se pide, así el renderer recorre la tabla de a una
+    página sin materializar todas las filas.
+    """
+    
+    __slots__ = ("_columns", "_length")
+    
+    def __init__(self, columns: Sequence[Sequence[str]], length: int) -> None:
+        self._columns = columns
+        self._length = length
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self):
+        return map(list, zip(*self._columns))
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [list(row) for row in zip(*(column[index] for column in self._columns))]
+        return [column[index] for column in self._columns]
+
+
+class ColumnarTable:
+    """
+    Tabla compacta guardada por columnas.
+    
+    Alternativa a PDFTable para reportes grandes: en lugar de una lista
+    por fila (100k filas = 100k listas) guarda una lista por columna.
+    Se valida una sola vez, comparando el largo de las columnas, y el
+    renderer la lee por filas con `rows` (TableRowsView, perezosa).
+    
+    Atributos:
+        headers: Encabezados de la tabla
+        columns: Valores de cada columna (mismo orden que headers)
+        title: Título opcional de la tabla
+    """
+    
+    __slots__ = ("headers", "columns", "title", "_row_count")
+    
+    def __init__(
+        self,
+        headers: list[str],
+        columns: Sequence[Sequence[str]],
+        title: str | None = None,
+    ) -> None:
+        """
+        Crea la tabla validando su forma.
+        
+        Raises:
+            ValueError: Si no hay headers, si la cantidad de columnas no
+                        coincide con los headers o si las columnas tienen
+                        distinto largo
+        """
+        if not headers:
+            raise ValueError("La tabla debe tener al menos un header")
+        if len(columns) != len(headers):
+            raise ValueError(
+                f"La tabla tiene {len(columns)} columnas, "
+                f"pero se esperaban {len(headers)}"
+            )
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Las columnas tienen distinta cantidad de filas: {sorted(lengths)}"
+            )
+        
+        self.headers = headers
+        self.columns = columns
+        self.title = title
+        self._row_count = lengths.pop()
+    
+    @property
+    def row_count(self) -> int:
+        """Cantidad de filas."""
+        return self._row_count
+    
+    @property
+    def rows(self) -> TableRowsView:
+        """Filas de la tabla, armadas a demanda."""
+        return TableRowsView(self.columns, self._row_count)
+
+
 @dataclass
 class PDFDocument:
     """
@@ -103,7 +192,8 @@ class PDFDocument:
         created_at: Fecha de creación
         page_size: Tamaño de página
         orientation: Orientación de la página
-        sections: Lista de secciones del documento
+        sections: Lista de secciones del documento (o un iterable que
+                  las produzca a demanda, ver `iter_sections`)
         metadata: Metadatos adicionales
     
     Ejemplo de uso:
@@ -112,6 +202,13 @@ class PDFDocument:
         ...     author="Sistema"
         ... )
         >>> doc.add_section(PDFSection(title="Introducción", content="..."))
+    
+    Secciones perezosas (reportes largos):
+        >>> doc = PDFDocument(
+        ...     title="Reporte Anual",
+        ...     sections=(build_section(mes) for mes in meses),
+        ... )
+        >>> # el generador pide cada sección recién cuando el layout llega a ella
     """
     
     # Atributos requeridos
@@ -128,11 +225,17 @@ class PDFDocument:
     
     # Atributos privados para estado interno
     _is_generated: bool = field(default=False, repr=False)
+    _section_source: Iterator[PDFSection] | None = field(default=None, repr=False)
     
     def __post_init__(self) -> None:
         """Validaciones del dominio al crear la entidad."""
         if not self.title or not self.title.strip():
             raise ValueError("El título del documento es requerido")
+        
+        # Un iterable que no es lista se consume a demanda (iter_sections)
+        if not isinstance(self.sections, list):
+            self._section_source = iter(self.sections)
+            self.sections = []
     
     # ================================
     # Métodos de comportamiento
@@ -150,9 +253,40 @@ class PDFDocument:
         """
         if self._is_generated:
             raise ValueError("No se pueden agregar secciones a un documento generado")
-        self.sections.append(section)
+        if self._section_source is not None:
+            # Va después de las secciones perezosas que todavía no se produjeron
+            self._section_source = chain(self._section_source, [section])
+        else:
+            self.sections.append(section)
+    
+    def iter_sections(self) -> Iterator[PDFSection]:
+        """
+        Recorre las secciones en orden, produciendo las perezosas a demanda.
+        
+        Las secciones perezosas se consumen una sola vez: un segundo
+        recorrido solo ve las de `sections`.
+        """
+        yield from self.sections
+        if self._section_source is not None:
+            source, self._section_source = self._section_source, None
+            yield from source
+    
+    @property
+    def has_lazy_sections(self) -> bool:
+        """Indica si quedan secciones perezosas sin producir."""
+        return self._section_source is not None
+    
+    def materialize_sections(self) -> None:
+        """Produce todas las secciones perezosas y las guarda en `sections`."""
+        if self._section_source is not None:
+            source, self._section_source = self._section_source, None
+            self.sections.extend(source)
     
-    def add_table(self, table: PDFTable, section_index: int | None = None) -> None:
+    def add_table(
+        self,
+        table: PDFTable | ColumnarTable,
+        section_index: int | None = None,
+    ) -> None:
         """
         Agrega una tabla al documento.
         
@@ -187,7 +321,7 @@ class PDFDocument:
     
     @property
     def section_count(self) -> int:
-        """Retorna el número de secciones."""
+        """Retorna el número de secciones (sin contar las perezosas pendientes)."""
         return len(self.sections)
     
     def to_dict(self) -> dict[str, Any]:
@@ -0,0 +1,96 @@
+"""
+Render Job Entity
+=================
+
+Entidad que representa una generación de PDF asíncrona.
+
+El cliente crea el job y recibe su ID de inmediato; el render ocurre
+en segundo plano y el cliente consulta el estado hasta que el PDF
+está listo para descargar.
+
+Ciclo de vida:
+    PENDING → RUNNING → SUCCEEDED
+                     ↘ FAILED
+    RUNNING → PENDING (reintento tras un reinicio o un error transitorio)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+from uuid import uuid4
+
+
+class JobStatus(str, Enum):
+    """Estados de un job de render."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class RenderJob:
+    """
+    Job de generación de un comprobante.
+
+    Atributos:
+        tipo: Tipo de comprobante (comprobante_postulacion, etc.)
+        payload: Datos validados del request (JSON serializable)
+        id: Identificador único del job
+        status: Estado actual
+        attempts: Veces que se empezó a renderizar
+        filename: Nombre del PDF (cuando terminó bien)
+        error: Error serializado (cuando falló)
+        created_at: Fecha de creación (UTC)
+        updated_at: Fecha del último cambio de estado (UTC)
+    """
+    tipo: str
+    payload: dict[str, Any]
+    id: str = field(default_factory=lambda: uuid4().hex)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    filename: str | None = None
+    error: dict[str, Any] | None = None
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+
+    def mark_pending(self) -> None:
+        """Vuelve a la cola (reintento)."""
+        self.status = JobStatus.PENDING
+        self.updated_at = _now()
+
+    def mark_succeeded(self, filename: str) -> None:
+        """El PDF quedó guardado."""
+        self.status = JobStatus.SUCCEEDED
+        self.filename = filename
+        self.error = None
+        self.updated_at = _now()
+
+    def mark_failed(self, error: dict[str, Any]) -> None:
+        """El render falló de forma definitiva."""
+        self.status = JobStatus.FAILED
+        self.error = error
+        self.updated_at = _now()
+
+    @property
+    def is_finished(self) -> bool:
+        """True si el job ya no va a cambiar de estado."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Estado del job para serialización (sin el payload)."""
+        return {
+            "id": self.id,
+            "tipo": self.tipo,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "filename": self.filename,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
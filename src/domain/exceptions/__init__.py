@@ -11,6 +11,10 @@ from .domain_exceptions import (
     InvalidDocumentError,
     InvalidStyleError,
     DocumentNotFoundError,
+    ServiceOverloadedError,
+    JobNotReadyError,
+    PayloadTooLargeError,
+    ForbiddenError,
 )
 
 __all__ = [
@@ -19,4 +23,8 @@ __all__ = [
     "InvalidDocumentError",
     "InvalidStyleError",
     "DocumentNotFoundError",
+    "ServiceOverloadedError",
+    "JobNotReadyError",
+    "PayloadTooLargeError",
+    "ForbiddenError",
 ]
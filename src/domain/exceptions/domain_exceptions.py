@@ -15,7 +15,11 @@ Jerarquía de excepciones:
     ├── PDFGenerationError
     ├── InvalidDocumentError
     ├── InvalidStyleError
-    └── DocumentNotFoundError
+    ├── DocumentNotFoundError
+    ├── ServiceOverloadedError
+    ├── JobNotReadyError
+    ├── PayloadTooLargeError
+    └── ForbiddenError
 """
 
 
@@ -140,3 +144,107 @@ class DocumentNotFoundError(DomainException):
             code="DOCUMENT_NOT_FOUND",
             details=details or {},
         )
+
+
+class ServiceOverloadedError(DomainException):
+    """
+    Error de capacidad: no hay lugar para aceptar más trabajo.
+    
+    Se lanza cuando la cola de renders está llena. Se traduce a un
+    503 con `Retry-After` para que el cliente reintente más tarde en
+    lugar de esperar hasta su timeout.
+    
+    Ejemplo:
+        >>> raise ServiceOverloadedError(
+        ...     "Cola de renders llena",
+        ...     retry_after=2,
+        ...     details={"queued": 32},
+        ... )
+    """
+    
+    def __init__(
+        self,
+        message: str = "Servicio saturado, reintente más tarde",
+        retry_after: int = 1,
+        details: dict | None = None,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            message=message,
+            code="SERVICE_OVERLOADED",
+            details={"retry_after_seconds": retry_after, **(details or {})},
+        )
+
+
+class JobNotReadyError(DomainException):
+    """
+    Error de job sin resultado disponible.
+    
+    Se lanza al pedir el PDF de un job que todavía no terminó o que
+    terminó con error.
+    
+    Ejemplo:
+        >>> raise JobNotReadyError(
+        ...     details={"job_id": "3f2a...", "status": "running"}
+        ... )
+    """
+    
+    def __init__(
+        self,
+        message: str = "El job todavía no tiene un PDF disponible",
+        details: dict | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            code="JOB_NOT_READY",
+            details=details or {},
+        )
+
+
+class PayloadTooLargeError(DomainException):
+    """
+    Error de request que supera los límites de tamaño.
+    
+    Se lanza cuando el body o el documento pedido (p.ej. la cantidad
+    de celdas de sus tablas) excede lo que el servicio acepta renderizar.
+    
+    Ejemplo:
+        >>> raise PayloadTooLargeError(
+        ...     "Las tablas superan el máximo de celdas",
+        ...     details={"cells": 2_000_000, "max_cells": 1_000_000},
+        ... )
+    """
+    
+    def __init__(
+        self,
+        message: str = "El request supera el tamaño máximo permitido",
+        details: dict | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            code="PAYLOAD_TOO_LARGE",
+            details=details or {},
+        )
+
+
+class ForbiddenError(DomainException):
+    """
+    Error de acceso a una operación restringida.
+    
+    Se lanza cuando un endpoint de administración se llama sin el
+    token correcto (o sin token configurado en el servicio).
+    
+    Ejemplo:
+        >>> raise ForbiddenError("Token de administración inválido")
+    """
+    
+    def __init__(
+        self,
+        message: str = "Acceso denegado",
+        details: dict | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            code="FORBIDDEN",
+            details=details or {},
+        )
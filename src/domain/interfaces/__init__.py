@@ -7,5 +7,6 @@
 # ================================
 
 from .pdf_generator_interface import IPDFGenerator
+from .job_repository_interface import IJobRepository
 
-__all__ = ["IPDFGenerator"]
+__all__ = ["IPDFGenerator", "IJobRepository"]
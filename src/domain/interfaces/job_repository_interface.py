@@ -0,0 +1,95 @@
+"""
+Job Repository Interface (Port)
+===============================
+
+Define el contrato de persistencia de los jobs de render.
+
+El repositorio guarda el estado de cada job y el PDF resultante, de
+modo que los jobs pendientes sobreviven a un reinicio del proceso.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+from src.domain.entities import RenderJob
+
+
+class IJobRepository(ABC):
+    """
+    Interfaz abstracta para repositorios de jobs.
+
+    Métodos:
+        save: Crea o actualiza un job
+        get: Busca un job por ID
+        claim: Toma un job pendiente (PENDING → RUNNING) de forma atómica
+        save_result: Guarda el PDF y marca el job como terminado
+        get_result: Retorna el PDF de un job terminado
+        pending_ids: IDs de los jobs pendientes, en orden de llegada
+        requeue_running: Devuelve a pendientes los jobs interrumpidos
+        purge_finished: Borra jobs terminados antiguos
+    """
+
+    @abstractmethod
+    def save(self, job: RenderJob) -> None:
+        """Crea o actualiza un job (sin tocar su resultado)."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> RenderJob | None:
+        """Retorna el job o None si no existe."""
+        pass
+
+    @abstractmethod
+    def claim(self, job_id: str) -> RenderJob | None:
+        """
+        Pasa el job de PENDING a RUNNING e incrementa sus intentos.
+
+        Es atómico: si varios workers (o procesos) intentan tomar el
+        mismo job, solo uno lo obtiene.
+
+        Returns:
+            El job actualizado, o None si no estaba pendiente
+        """
+        pass
+
+    @abstractmethod
+    def save_result(self, job: RenderJob, content: bytes) -> None:
+        """Guarda el PDF y el estado del job en una sola operación."""
+        pass
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> bytes | None:
+        """Retorna el PDF del job o None si no hay resultado."""
+        pass
+
+    @abstractmethod
+    def pending_ids(self) -> list[str]:
+        """IDs de los jobs en estado PENDING, del más antiguo al más nuevo."""
+        pass
+
+    @abstractmethod
+    def requeue_running(self, lease: timedelta) -> int:
+        """
+        Pasa a PENDING los jobs RUNNING abandonados.
+
+        Se llama al arrancar. Un job RUNNING está abandonado si el
+        proceso que lo tomó ya no corre o si lo tomó hace más de
+        `lease`; los que renderiza otro proceso vivo no se tocan.
+
+        Args:
+            lease: Tiempo máximo que un job puede estar RUNNING
+
+        Returns:
+            Cantidad de jobs devueltos a la cola
+        """
+        pass
+
+    @abstractmethod
+    def purge_finished(self, older_than: datetime) -> int:
+        """
+        Borra los jobs terminados antes de `older_than`.
+
+        Returns:
+            Cantidad de jobs borrados
+        """
+        pass
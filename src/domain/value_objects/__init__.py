@@ -6,6 +6,6 @@
 # valores son considerados iguales.
 # ================================
 
-from .pdf_style import PDFStyle, FontConfig, ColorConfig, MarginConfig
+from .pdf_style import PDFStyle, FontConfig, FontFamily, ColorConfig, MarginConfig
 
-__all__ = ["PDFStyle", "FontConfig", "ColorConfig", "MarginConfig"]
+__all__ = ["PDFStyle", "FontConfig", "FontFamily", "ColorConfig", "MarginConfig"]
@@ -290,3 +290,22 @@ class PDFStyle:
             ),
             margins=MarginConfig.from_inches(1.0, 1.0, 1.25, 1.25),
         )
+    
+    @classmethod
+    def institutional(cls) -> "PDFStyle":
+        """Retorna el estilo de los comprobantes (Times, negro, look formal)."""
+        return cls(
+            colors=ColorConfig(
+                primary="#000000",
+                secondary="#808080",
+                text="#000000",
+            ),
+            fonts=FontConfig(
+                family=FontFamily.TIMES,
+                size_title=14,
+                size_heading=10,
+                size_body=10,
+                size_small=8,
+                line_height=1.4,
+            ),
+        )
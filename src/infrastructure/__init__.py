@@ -8,4 +8,7 @@
 # - pdf: Implementación del generador de PDF (ReportLab)
 # - persistence: Repositorios (si se necesitan)
 # - config: Configuración de la aplicación
+# - concurrency: Executor acotado para los renders
+# - metrics: Métricas Prometheus (GET /metrics)
+# - profiling: Perfilado a demanda de renders
 # ================================
@@ -0,0 +1,12 @@
+# ================================
+# Concurrency Infrastructure
+# ================================
+# Executors dedicados para el trabajo CPU-bound (renders de PDF).
+# ================================
+
+from .render_executor import RenderExecutor, RenderExecutorStats
+
+__all__ = [
+    "RenderExecutor",
+    "RenderExecutorStats",
+]
@@ -0,0 +1,252 @@
+"""
+Render Executor
+===============
+
+Executor dedicado y acotado para los renders de PDF.
+
+Problema:
+- Los endpoints usaban `asyncio.to_thread`, que comparte el executor
+  por defecto de asyncio con todo lo demás y encola sin límite. Bajo
+  carga la cola crece, la latencia crece con ella y los clientes
+  terminan en timeout esperando un PDF que igual se va a generar
+
+Solución:
+- Un ThreadPoolExecutor propio con N workers (`pdf_render_workers`)
+- Control de admisión: a lo sumo `pdf_render_max_queue` renders
+  esperando worker. Con la cola llena se rechaza de inmediato con
+  `ServiceOverloadedError` (503 + Retry-After)
+- Métricas para dimensionar: renders activos, cola, tiempo de espera
+  en cola (promedio, máximo, p50/p95 de las últimas muestras),
+  completados y rechazados. La cola y los rechazos también se publican
+  en Prometheus (pdf_render_queue_depth, pdf_render_rejected_total)
+
+Decisiones técnicas:
+- La admisión se decide en el event loop antes de encolar; el lock
+  solo protege contadores (el costo es despreciable frente al render)
+- Con el backend "process_pool" los workers de este executor solo
+  esperan al proceso hijo: conviene igualarlos a `pdf_process_workers`
+- `run_in_executor` no propaga contextvars: el render corre dentro de
+  una copia del contexto del request para que el timer de etapas (ver
+  stage_timing) registre `queue_wait` y las etapas del render
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable
+
+from src.domain.exceptions import ServiceOverloadedError
+from src.application.utils.stage_timing import record_stage
+from src.infrastructure.metrics.prometheus import RENDER_QUEUE_DEPTH, RENDER_REJECTED
+
+
+# Muestras de tiempo de espera usadas para los percentiles
+_WAIT_SAMPLES = 1024
+
+
+@dataclass(frozen=True)
+class RenderExecutorStats:
+    """
+    Foto de las métricas del executor.
+
+    Atributos:
+        workers: Threads de render
+        max_queue: Máximo de renders esperando worker
+        active: Renders ejecutándose
+        queued: Renders esperando worker
+        completed: Renders terminados (con o sin error)
+        rejected: Renders rechazados por cola llena
+        wait_avg_ms: Espera promedio en cola
+        wait_max_ms: Espera máxima en cola
+        wait_p50_ms: Mediana de las últimas esperas
+        wait_p95_ms: Percentil 95 de las últimas esperas
+    """
+    workers: int
+    max_queue: int
+    active: int
+    queued: int
+    completed: int
+    rejected: int
+    wait_avg_ms: float
+    wait_max_ms: float
+    wait_p50_ms: float
+    wait_p95_ms: float
+
+    def to_dict(self) -> dict:
+        """Convierte las métricas a diccionario (para /health)."""
+        return asdict(self)
+
+
+class RenderExecutor:
+    """
+    Pool de threads acotado con control de admisión.
+
+    Ejemplo:
+        >>> executor = RenderExecutor(workers=4, max_queue=16)
+        >>> result = await executor.run(use_case.execute, dto)
+        >>> executor.stats().queued
+        0
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int = 32,
+        retry_after: int = 1,
+    ) -> None:
+        """
+        Inicializa el executor.
+
+        Args:
+            workers: Threads de render (None = cantidad de CPUs)
+            max_queue: Máximo de renders esperando worker (0 = sin cola)
+            retry_after: Segundos sugeridos al cliente al rechazar
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._max_queue = max_queue
+        self._retry_after = retry_after
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers,
+            thread_name_prefix="pdf-render",
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_samples: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+    @property
+    def workers(self) -> int:
+        """Threads de render."""
+        return self._workers
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """
+        Encola `fn(*args)` si hay capacidad.
+
+        Debe llamarse desde el event loop. El rechazo es inmediato:
+        no se espera a que se libere lugar.
+
+        Returns:
+            Future asyncio con el resultado de `fn`
+
+        Raises:
+            ServiceOverloadedError: Si todos los workers están ocupados
+                                    y la cola está llena
+        """
+        with self._lock:
+            busy = self._active + self._queued
+            if busy >= self._workers + self._max_queue:
+                self._rejected += 1
+                RENDER_REJECTED.inc()
+                raise ServiceOverloadedError(
+                    "Cola de renders llena, reintente más tarde",
+                    retry_after=self._retry_after,
+                    details={"active": self._active, "queued": self._queued},
+                )
+            self._queued += 1
+            RENDER_QUEUE_DEPTH.inc()
+
+        ticket = _Ticket(time.perf_counter())
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._pool, self._run, fn, args, ticket, context)
+        except RuntimeError:
+            # Executor cerrado (shutdown): deshacer la reserva
+            with self._lock:
+                self._queued -= 1
+                RENDER_QUEUE_DEPTH.dec()
+            raise
+        future.add_done_callback(partial(self._release_if_cancelled, ticket))
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Encola `fn(*args)` y espera su resultado."""
+        return await self.submit(fn, *args)
+
+    def _run(
+        self,
+        fn: Callable[..., Any],
+        args: tuple,
+        ticket: "_Ticket",
+        context: contextvars.Context,
+    ) -> Any:
+        waited = time.perf_counter() - ticket.submitted_at
+        with self._lock:
+            if ticket.cancelled:
+                return None
+            ticket.started = True
+            self._queued -= 1
+            RENDER_QUEUE_DEPTH.dec()
+            self._active += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._wait_samples.append(waited)
+        try:
+            context.run(record_stage, "queue_wait", waited)
+            return context.run(fn, *args)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _release_if_cancelled(self, ticket: "_Ticket", future: asyncio.Future) -> None:
+        """Libera el lugar en cola de un render cancelado antes de empezar."""
+        if not future.cancelled():
+            return
+        with self._lock:
+            if not ticket.started and not ticket.cancelled:
+                ticket.cancelled = True
+                self._queued -= 1
+                RENDER_QUEUE_DEPTH.dec()
+
+    def stats(self) -> RenderExecutorStats:
+        """Métricas actuales del executor."""
+        with self._lock:
+            started = self._completed + self._active
+            samples = sorted(self._wait_samples)
+            return RenderExecutorStats(
+                workers=self._workers,
+                max_queue=self._max_queue,
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_avg_ms=self._wait_total / started * 1000 if started else 0.0,
+                wait_max_ms=self._wait_max * 1000,
+                wait_p50_ms=_percentile(samples, 0.50) * 1000,
+                wait_p95_ms=_percentile(samples, 0.95) * 1000,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Detiene los threads de render."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class _Ticket:
+    """Estado de un render encolado (para descontar cancelaciones)."""
+
+    __slots__ = ("submitted_at", "started", "cancelled")
+
+    def __init__(self, submitted_at: float) -> None:
+        self.submitted_at = submitted_at
+        self.started = False
+        self.cancelled = False
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Percentil por rango más cercano (0.0 si no hay muestras)."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
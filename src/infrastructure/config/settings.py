@@ -108,6 +108,149 @@ class Settings(BaseSettings):
         default="/tmp/pdf_exports",
         description="Directorio temporal para PDFs",
     )
+    pdf_backend: Literal["reportlab", "process_pool"] = Field(
+        default="reportlab",
+        description="Backend de renderizado (reportlab en threads o pool de procesos)",
+    )
+    pdf_process_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Procesos del pool de renderizado (0 = cantidad de CPUs)",
+    )
+    pdf_fast_path: bool = Field(
+        default=True,
+        description="Dibuja los documentos de layout fijo directo sobre el Canvas",
+    )
+    pdf_template_mode: bool = Field(
+        default=True,
+        description="Reutiliza el parseo y corte de líneas de los textos fijos de plantilla",
+    )
+    pdf_template_cache_entries: int = Field(
+        default=512,
+        ge=0,
+        description="Máximo de párrafos cacheados en modo plantilla",
+    )
+    pdf_string_width_cache_entries: int = Field(
+        default=8192,
+        ge=0,
+        description="Máximo de anchos de texto memoizados para el layout (0 desactiva la caché)",
+    )
+    pdf_deterministic: bool = Field(
+        default=False,
+        description="Renderizado reproducible: mismos datos producen los mismos bytes",
+    )
+    pdf_cache_enabled: bool = Field(
+        default=True,
+        description="Habilita la caché de PDFs generados (por contenido del request)",
+    )
+    pdf_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Presupuesto total de bytes de la caché de PDFs",
+    )
+    pdf_stream_chunk_size: int = Field(
+        default=64 * 1024,
+        ge=1024,
+        description="Tamaño máximo de cada chunk al enviar un PDF por streaming",
+    )
+    pdf_stream_max_chunks: int = Field(
+        default=8,
+        ge=1,
+        description="Chunks en tránsito antes de frenar al render (backpressure)",
+    )
+    pdf_render_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Threads del executor de renders (0 = cantidad de CPUs)",
+    )
+    pdf_render_max_queue: int = Field(
+        default=32,
+        ge=0,
+        description="Renders esperando worker antes de responder 503",
+    )
+    pdf_render_retry_after: int = Field(
+        default=1,
+        ge=1,
+        description="Segundos de Retry-After al rechazar por cola llena",
+    )
+    pdf_batch_max_items: int = Field(
+        default=5000,
+        ge=1,
+        description="Máximo de documentos por request de generación por lotes",
+    )
+    pdf_ndjson_max_line_bytes: int = Field(
+        default=1_048_576,
+        ge=1024,
+        description="Largo máximo de una línea en la generación masiva NDJSON",
+    )
+    pdf_generate_max_body_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=1024,
+        description="Tamaño máximo del body de /pdf/generate (bytes)",
+    )
+    pdf_generate_max_table_cells: int = Field(
+        default=1_000_000,
+        ge=1,
+        description="Máximo de celdas sumando todas las tablas de un documento de /pdf/generate",
+    )
+    pdf_jobs_db_path: str = Field(
+        default="/tmp/pdf_exports/jobs.db",
+        description="Archivo SQLite de los jobs asíncronos (montarlo en un volumen para que sobrevivan al contenedor)",
+    )
+    pdf_job_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Jobs asíncronos renderizándose a la vez por proceso",
+    )
+    pdf_job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Intentos máximos de un job antes de marcarlo fallido",
+    )
+    pdf_job_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Horas que se conservan los jobs terminados (se purgan al arrancar)",
+    )
+    pdf_job_lease_seconds: int = Field(
+        default=900,
+        ge=1,
+        description="Segundos tras los cuales un job RUNNING de otro proceso se da por abandonado y se retoma al arrancar",
+    )
+    pdf_job_retry_backoff_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="Espera antes de reintentar un job fallido, multiplicada por el número de intento",
+    )
+    pdf_warmup_enabled: bool = Field(
+        default=True,
+        description="Renderiza documentos sintéticos al arrancar; GET /ready responde 503 hasta terminar",
+    )
+    
+    # ================================
+    # Observability Settings
+    # ================================
+    pdf_stage_timing: bool = Field(
+        default=True,
+        description="Mide cada etapa del request (header Server-Timing e histogramas en /health)",
+    )
+    pdf_metrics_enabled: bool = Field(
+        default=True,
+        description="Expone GET /metrics (Prometheus) y mide cada render",
+    )
+    pdf_profiling_enabled: bool = Field(
+        default=False,
+        description="Permite perfilar un render enviando el header X-PDF-Profile",
+    )
+    pdf_profile_max_entries: int = Field(
+        default=20,
+        ge=1,
+        description="Perfiles conservados en el anillo de disco (bajo pdf_temp_dir/profiles)",
+    )
+    pdf_admin_token: str = Field(
+        default="",
+        description="Token del header X-Admin-Token para /api/v1/admin (vacío = endpoints de admin deshabilitados)",
+    )
     
     # ================================
     # Logging Settings
@@ -0,0 +1,21 @@
+# ================================
+# Metrics Infrastructure
+# ================================
+# Métricas Prometheus del servicio (ver prometheus.py).
+# ================================
+
+from .prometheus import (
+    count_pages,
+    metrics_payload,
+    observe_rate_limited,
+    report_pages,
+)
+from .instrumented_generator import InstrumentedPDFGenerator
+
+__all__ = [
+    "InstrumentedPDFGenerator",
+    "count_pages",
+    "metrics_payload",
+    "observe_rate_limited",
+    "report_pages",
+]
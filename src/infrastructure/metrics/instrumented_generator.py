@@ -0,0 +1,131 @@
+"""
+Instrumented PDF Generator
+==========================
+
+Decorator de IPDFGenerator que registra las métricas Prometheus de cada
+render: duración, bytes, páginas, errores y renders en curso.
+
+Envuelve a cualquier generador (ReportLab, Canvas, pool de procesos):
+los use cases no cambian. Las páginas las informa el generador
+envuelto con `report_pages` (ver prometheus.count_pages).
+"""
+
+import os
+import time
+from typing import BinaryIO
+
+from src.domain.entities import PDFDocument
+from src.domain.exceptions import PDFGenerationError
+from src.domain.interfaces import IPDFGenerator
+from src.domain.value_objects import PDFStyle
+from src.infrastructure.metrics.prometheus import (
+    RENDER_DURATION,
+    RENDER_ERRORS,
+    RENDER_OUTPUT_BYTES,
+    RENDER_PAGES,
+    RENDERS_IN_FLIGHT,
+    count_pages,
+)
+
+
+# Etiqueta de los documentos sin `tipo_documento` (POST /pdf/generate)
+GENERIC_DOCUMENT = "generico"
+
+
+class InstrumentedPDFGenerator(IPDFGenerator):
+    """
+    Generador que mide cada render del generador envuelto.
+
+    Ejemplo:
+        >>> generator = InstrumentedPDFGenerator(ReportLabGenerator())
+        >>> pdf_bytes = generator.generate(document)
+    """
+
+    def __init__(self, inner: IPDFGenerator) -> None:
+        self._inner = inner
+
+    @property
+    def inner(self) -> IPDFGenerator:
+        """Generador envuelto."""
+        return self._inner
+
+    def generate(
+        self,
+        document: PDFDocument,
+        style: PDFStyle | None = None,
+    ) -> bytes:
+        """Genera el PDF con el generador envuelto y registra las métricas."""
+        return self._measure(document, lambda: self._inner.generate(document, style))
+
+    def generate_to_file(
+        self,
+        document: PDFDocument,
+        output_path: str,
+        style: PDFStyle | None = None,
+    ) -> str:
+        """Genera el PDF en un archivo y registra las métricas."""
+        return self._measure(
+            document,
+            lambda: self._inner.generate_to_file(document, output_path, style),
+        )
+
+    def generate_to_stream(
+        self,
+        document: PDFDocument,
+        stream: BinaryIO,
+        style: PDFStyle | None = None,
+    ) -> None:
+        """Genera el PDF en el stream (contando los bytes) y registra las métricas."""
+        counting = _CountingStream(stream)
+        self._measure(
+            document,
+            lambda: self._inner.generate_to_stream(document, counting, style),
+            counting,
+        )
+
+    def _measure(self, document: PDFDocument, render, counting: "_CountingStream | None" = None):
+        """Ejecuta `render` midiendo duración, tamaño, páginas y errores."""
+        tipo = document.metadata.get("tipo_documento") or GENERIC_DOCUMENT
+        start = time.perf_counter()
+        try:
+            with RENDERS_IN_FLIGHT.track_inprogress(), count_pages() as counted:
+                result = render()
+        except Exception as e:
+            RENDER_ERRORS.labels(tipo_documento=tipo, exception=_error_type(e)).inc()
+            raise
+
+        RENDER_DURATION.labels(tipo_documento=tipo).observe(time.perf_counter() - start)
+        if counting is not None:
+            size = counting.written
+        elif isinstance(result, bytes):
+            size = len(result)
+        else:
+            size = os.path.getsize(result)
+        RENDER_OUTPUT_BYTES.labels(tipo_documento=tipo).observe(size)
+        if counted.pages is not None:
+            RENDER_PAGES.labels(tipo_documento=tipo).observe(counted.pages)
+        return result
+
+
+def _error_type(error: Exception) -> str:
+    """Nombre de la excepción; si es un PDFGenerationError que envuelve otra, el de la original."""
+    if isinstance(error, PDFGenerationError):
+        cause = error.__cause__ or error.__context__
+        if cause is not None:
+            return type(cause).__name__
+    return type(error).__name__
+
+
+class _CountingStream:
+    """Stream que cuenta los bytes escritos en el stream destino."""
+
+    def __init__(self, target: BinaryIO) -> None:
+        self._target = target
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self.written += len(data)
+        return self._target.write(data)
+
+    def flush(self) -> None:
+        self._target.flush()
@@ -0,0 +1,165 @@
+"""
+Prometheus Metrics
+==================
+
+Métricas del servicio en formato Prometheus (GET /metrics).
+
+Métricas:
+- pdf_render_duration_seconds{tipo_documento}: latencia de cada render
+- pdf_render_output_bytes{tipo_documento}: tamaño del PDF generado
+- pdf_render_pages{tipo_documento}: páginas del PDF generado
+- pdf_render_errors_total{tipo_documento, exception}: renders fallidos
+  por tipo de excepción (la causa original si fue envuelta en
+  PDFGenerationError)
+- pdf_renders_in_flight: renders en curso
+- pdf_render_queue_depth: renders esperando thread en el RenderExecutor
+- pdf_render_rejected_total: renders rechazados por cola llena (503)
+- pdf_rate_limit_rejections_total{endpoint}: requests rechazados por
+  rate limit (429), por función del endpoint
+
+Multi-worker (gunicorn):
+- Cada worker es un proceso con sus propias métricas: un scrape
+  atendido por un worker solo vería las suyas. Con la variable de
+  entorno `PROMETHEUS_MULTIPROC_DIR` prometheus_client guarda los
+  valores en archivos mmap de ese directorio y /metrics los agrega
+  entre todos los workers
+- Los gauges usan el modo "livesum": suman solo los procesos vivos.
+  gunicorn.conf.py limpia el directorio al arrancar y marca los
+  workers que terminan (`mark_process_dead`)
+- La variable debe estar definida antes de importar prometheus_client
+  (gunicorn.conf.py la define para master y workers)
+"""
+
+import os
+from contextvars import ContextVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# ================================
+# Métricas
+# ================================
+
+RENDER_DURATION = Histogram(
+    "pdf_render_duration_seconds",
+    "Duración de cada render de PDF",
+    ["tipo_documento"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+RENDER_OUTPUT_BYTES = Histogram(
+    "pdf_render_output_bytes",
+    "Tamaño en bytes de cada PDF generado",
+    ["tipo_documento"],
+    buckets=tuple(2**exponent for exponent in range(12, 28, 2)),  # 4 KiB .. 64 MiB
+)
+RENDER_PAGES = Histogram(
+    "pdf_render_pages",
+    "Páginas de cada PDF generado",
+    ["tipo_documento"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+)
+RENDER_ERRORS = Counter(
+    "pdf_render_errors_total",
+    "Renders de PDF fallidos por tipo de excepción",
+    ["tipo_documento", "exception"],
+)
+RENDERS_IN_FLIGHT = Gauge(
+    "pdf_renders_in_flight",
+    "Renders de PDF en curso",
+    multiprocess_mode="livesum",
+)
+RENDER_QUEUE_DEPTH = Gauge(
+    "pdf_render_queue_depth",
+    "Renders esperando un thread del RenderExecutor",
+    multiprocess_mode="livesum",
+)
+RENDER_REJECTED = Counter(
+    "pdf_render_rejected_total",
+    "Renders rechazados por la cola del RenderExecutor llena",
+)
+RATE_LIMIT_REJECTIONS = Counter(
+    "pdf_rate_limit_rejections_total",
+    "Requests rechazados por rate limit",
+    ["endpoint"],
+)
+
+
+# ================================
+# Páginas del render en curso
+# ================================
+
+class PageCount:
+    """Páginas reportadas por el generador durante un render."""
+
+    __slots__ = ("pages",)
+
+    def __init__(self) -> None:
+        self.pages: int | None = None
+
+
+_page_count: ContextVar[PageCount | None] = ContextVar("pdf_page_count", default=None)
+
+
+class count_pages:
+    """
+    Recoge las páginas que reporte el generador dentro del bloque.
+
+    Ejemplo:
+        >>> with count_pages() as counted:
+        ...     generator.generate_to_stream(document, stream)
+        >>> counted.pages
+        3
+    """
+
+    __slots__ = ("_counted", "_token")
+
+    def __enter__(self) -> PageCount:
+        self._counted = PageCount()
+        self._token = _page_count.set(self._counted)
+        return self._counted
+
+    def __exit__(self, *exc_info) -> None:
+        _page_count.reset(self._token)
+
+
+def report_pages(pages: int) -> None:
+    """Informa las páginas del PDF recién generado (no-op fuera de count_pages)."""
+    counted = _page_count.get()
+    if counted is not None:
+        counted.pages = pages
+
+
+# ================================
+# Exposición
+# ================================
+
+def observe_rate_limited(endpoint: str) -> None:
+    """Cuenta un request rechazado por rate limit."""
+    RATE_LIMIT_REJECTIONS.labels(endpoint=endpoint).inc()
+
+
+def metrics_payload() -> tuple[bytes, str]:
+    """
+    Métricas en formato de texto Prometheus.
+
+    En modo multi-proceso (PROMETHEUS_MULTIPROC_DIR) agrega las de
+    todos los workers; si no, las de este proceso.
+
+    Returns:
+        (cuerpo, content type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
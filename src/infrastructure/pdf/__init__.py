@@ -5,5 +5,18 @@
 # ================================
 
 from .reportlab_generator import ReportLabGenerator
+from .canvas_generator import CanvasPDFGenerator
+from .process_pool_generator import ProcessPoolPDFGenerator
+from .template_cache import TemplateLayoutCache
+from .stylesheet_registry import StylesheetRegistry, stylesheet_registry
+from .string_width_cache import StringWidthCache
 
-__all__ = ["ReportLabGenerator"]
+__all__ = [
+    "ReportLabGenerator",
+    "CanvasPDFGenerator",
+    "ProcessPoolPDFGenerator",
+    "TemplateLayoutCache",
+    "StylesheetRegistry",
+    "stylesheet_registry",
+    "StringWidthCache",
+]
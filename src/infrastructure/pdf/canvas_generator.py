@@ -0,0 +1,399 @@
+"""
+Canvas PDF Generator
+====================
+
+Generador con "fast-path" para documentos de layout fijo.
+
+Los comprobantes de postulación tienen siempre la misma estructura
+(título, tabla de datos clave, párrafo narrativo y bloque de firma),
+pero pasaban por toda la maquinaria de Platypus: flowables, frames,
+split y cálculo de espacios. Este generador dibuja ese layout
+directamente sobre el Canvas en coordenadas precalculadas y solo usa
+`Paragraph` para los textos que realmente necesitan wrapping.
+
+Decisiones técnicas:
+- Extiende ReportLabGenerator: reutiliza estilos, header/footer y modo
+  invariant, y delega en Platypus todo documento sin fast-path
+- Las coordenadas replican las de Platypus (frame con padding de 6pt,
+  altura de párrafo = leading, filas de tabla = leading + padding), de
+  modo que el resultado es visualmente equivalente
+- Si el contenido no entra en el layout previsto (textos muy largos,
+  celdas multilínea) se vuelve al render de Platypus: nada se escribe
+  en el stream hasta `canvas.save()`
+"""
+
+from dataclasses import dataclass
+from typing import BinaryIO, Callable
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.domain.exceptions import PDFGenerationError
+from src.domain.value_objects import PDFStyle
+from src.infrastructure.pdf.flowables import (
+    DATA_TABLE_PADDING,
+    KEY_VALUE_COL_WIDTHS,
+    PARAGRAPH_SPACE,
+    PUSH_TO_BOTTOM_SPACE,
+    SECTION_SPACE,
+    TABLE_SPACE,
+    TITLE_SPACE,
+)
+from src.infrastructure.pdf.reportlab_generator import ReportLabGenerator
+from src.infrastructure.pdf.stylesheet_registry import CompiledStylesheet
+from src.infrastructure.pdf.template_cache import TemplateLayoutCache
+from src.infrastructure.metrics.prometheus import report_pages
+from src.application.utils.stage_timing import stage
+
+
+# ================================
+# Constantes de layout
+# ================================
+# Espaciadores, anchos y tipografía de tablas vienen de flowables, los
+# mismos que usa el layout de Platypus (_build_elements / _build_table).
+
+# Padding por defecto de los Frame de Platypus
+FRAME_PADDING = 6
+
+# Tabla de datos: una línea por celda (leading por defecto de Table)
+TABLE_LINE_HEIGHT = 1.2
+
+
+class LayoutOverflow(Exception):
+    """El contenido no entra en el layout fijo; usar Platypus."""
+
+
+@dataclass
+class _PageGeometry:
+    """
+    Sustituto mínimo de SimpleDocTemplate para el header/footer.
+
+    `_draw_header_footer` solo lee los márgenes y el número de página.
+    """
+    leftMargin: float
+    rightMargin: float
+    topMargin: float
+    bottomMargin: float
+    page: int = 0
+
+
+class _CanvasLayout:
+    """
+    Cursor vertical sobre un Canvas con la semántica de un Frame.
+
+    Mantiene la posición `y` actual, crea páginas nuevas y dibuja
+    párrafos y tablas en las mismas coordenadas que Platypus.
+    """
+
+    def __init__(
+        self,
+        canvas: Canvas,
+        geometry: _PageGeometry,
+        page_size: tuple,
+        on_page: Callable[[Canvas, _PageGeometry], None] | None,
+        paragraph_factory: Callable[[str, ParagraphStyle], Paragraph],
+    ) -> None:
+        page_width, page_height = page_size
+        self.canvas = canvas
+        self._paragraph = paragraph_factory
+        self.geometry = geometry
+        self.x = geometry.leftMargin + FRAME_PADDING
+        self.width = page_width - geometry.leftMargin - geometry.rightMargin - 2 * FRAME_PADDING
+        self.top = page_height - geometry.topMargin - FRAME_PADDING
+        self.bottom = geometry.bottomMargin + FRAME_PADDING
+        self.y = self.top
+        self._on_page = on_page
+        self._begin_page()
+
+    def _begin_page(self) -> None:
+        """Inicia una página: header/footer y cursor arriba."""
+        self.geometry.page += 1
+        self.y = self.top
+        if self._on_page is not None:
+            self._on_page(self.canvas, self.geometry)
+
+    def new_page(self) -> None:
+        """Cierra la página actual y abre una nueva."""
+        self.canvas.showPage()
+        self._begin_page()
+
+    @property
+    def at_top(self) -> bool:
+        """True si todavía no se dibujó nada en la página."""
+        return self.y == self.top
+
+    def reserve(self, height: float) -> float:
+        """
+        Consume `height` puntos y retorna la `y` inferior del bloque.
+
+        Raises:
+            LayoutOverflow: Si el bloque no entra en la página actual
+        """
+        if self.y - height < self.bottom - 1e-6:
+            raise LayoutOverflow()
+        self.y -= height
+        return self.y
+
+    def space(self, height: float) -> None:
+        """Equivalente a un Spacer."""
+        self.reserve(height)
+
+    def paragraph(self, text: str, style: ParagraphStyle) -> None:
+        """
+        Dibuja un párrafo con la misma geometría que Paragraph.
+
+        Los textos de una línea sin markup se dibujan con drawString;
+        el resto se envuelve con Paragraph.
+        """
+        if not self.at_top:
+            self.space(style.spaceBefore)
+
+        if "<" not in text and "&" not in text and (
+            stringWidth(text, style.fontName, style.fontSize) <= self.width
+        ):
+            bottom = self.reserve(style.leading)
+            baseline = bottom + style.leading - style.fontSize
+            self.canvas.setFillColor(style.textColor)
+            self.canvas.setFont(style.fontName, style.fontSize, style.leading)
+            if style.alignment == TA_CENTER:
+                self.canvas.drawCentredString(self.x + self.width / 2, baseline, text)
+            elif style.alignment == TA_RIGHT:
+                self.canvas.drawRightString(self.x + self.width, baseline, text)
+            else:
+                self.canvas.drawString(self.x, baseline, text)
+        else:
+            para = self._paragraph(text, style)
+            _, height = para.wrap(self.width, self.y - self.bottom)
+            para.drawOn(self.canvas, self.x, self.reserve(height))
+
+        self.space(style.spaceAfter)
+
+    def table(self, table: PDFTable, styles: CompiledStylesheet) -> None:
+        """Dibuja una tabla de datos de dos columnas (estilo _build_table)."""
+        data = [table.headers] + table.rows
+        font_size = styles.table_font_size
+        leading = TABLE_LINE_HEIGHT * font_size
+        row_height = leading + 2 * DATA_TABLE_PADDING
+        bottom = self.reserve(len(data) * row_height)
+        total_width = sum(KEY_VALUE_COL_WIDTHS)
+        canvas = self.canvas
+
+        canvas.setFillColor(styles["body"].textColor)
+        canvas.setFont(styles.table_font, font_size, leading)
+        for index, row in enumerate(data):
+            row_y = bottom + (len(data) - 1 - index) * row_height
+            # VALIGN MIDDLE de una sola línea (ver Table._drawCell)
+            baseline = row_y + (row_height + leading) / 2 - font_size
+            col_x = self.x
+            for value, col_width in zip(row, KEY_VALUE_COL_WIDTHS):
+                canvas.drawString(col_x + DATA_TABLE_PADDING, baseline, value)
+                col_x += col_width
+
+        # LINEBELOW sutil en cada fila
+        canvas.saveState()
+        canvas.setLineCap(1)
+        canvas.setLineJoin(1)
+        canvas.setStrokeColor(colors.whitesmoke)
+        canvas.setLineWidth(0.25)
+        for index in range(len(data)):
+            row_y = bottom + (len(data) - 1 - index) * row_height
+            canvas.line(self.x, row_y, self.x + total_width, row_y)
+        canvas.restoreState()
+
+
+class CanvasPDFGenerator(ReportLabGenerator):
+    """
+    Generador con fast-path de Canvas para documentos de layout fijo.
+
+    Elige la estrategia según `document.metadata["tipo_documento"]`;
+    los tipos sin fast-path (o que no entran en el layout) se generan
+    con Platypus como en ReportLabGenerator.
+
+    Ejemplo:
+        >>> generator = CanvasPDFGenerator()
+        >>> pdf_bytes = generator.generate(comprobante_document, style)
+    """
+
+    def __init__(
+        self,
+        invariant: bool = False,
+        layout_cache: TemplateLayoutCache | None = None,
+    ) -> None:
+        """
+        Inicializa el generador.
+
+        Args:
+            invariant: Modo invariant de ReportLab (ver ReportLabGenerator)
+            layout_cache: Caché de textos de plantilla (ver ReportLabGenerator)
+        """
+        super().__init__(invariant=invariant, layout_cache=layout_cache)
+        self._fast_paths: dict[str, Callable[[_CanvasLayout, PDFDocument, CompiledStylesheet], None]] = {
+            "comprobante_postulacion": self._layout_comprobante_postulacion,
+        }
+
+    def has_fast_path(self, document: PDFDocument) -> bool:
+        """Indica si el tipo de documento tiene renderer de Canvas."""
+        return document.metadata.get("tipo_documento") in self._fast_paths
+
+    def generate_to_stream(
+        self,
+        document: PDFDocument,
+        stream: BinaryIO,
+        style: PDFStyle | None = None,
+    ) -> None:
+        """
+        Genera el PDF por el fast-path si existe, si no con Platypus.
+
+        Args:
+            document: Documento del dominio
+            stream: Stream binario de salida
+            style: Estilos opcionales
+        """
+        layout_fn = self._fast_paths.get(document.metadata.get("tipo_documento"))
+        if layout_fn is None:
+            return super().generate_to_stream(document, stream, style)
+
+        style = style or PDFStyle.default()
+
+        try:
+            with stage("canvas_render"):
+                canvas = self._render_canvas(document, stream, style, layout_fn)
+        except LayoutOverflow:
+            return super().generate_to_stream(document, stream, style)
+        except Exception as e:
+            raise PDFGenerationError(
+                f"Error al generar el PDF: {str(e)}",
+                details={"document_id": str(document.id)},
+            )
+
+        try:
+            with stage("canvas_save"):
+                canvas.save()
+            report_pages(canvas.getPageNumber() - 1)
+        except Exception as e:
+            raise PDFGenerationError(
+                f"Error al generar el PDF: {str(e)}",
+                details={"document_id": str(document.id)},
+            )
+
+    def _render_canvas(
+        self,
+        document: PDFDocument,
+        stream: BinaryIO,
+        style: PDFStyle,
+        layout_fn: Callable[[_CanvasLayout, PDFDocument, CompiledStylesheet], None],
+    ) -> Canvas:
+        """Dibuja el documento en un Canvas nuevo (sin guardarlo)."""
+        page_size = self._get_page_size(document)
+        canvas = Canvas(
+            stream,
+            pagesize=page_size,
+            invariant=True if self._invariant else None,
+        )
+        canvas.setAuthor(document.author)
+        canvas.setTitle(document.title)
+
+        geometry = _PageGeometry(
+            leftMargin=self.LEFT_MARGIN,
+            rightMargin=self.RIGHT_MARGIN,
+            topMargin=self.TOP_MARGIN,
+            bottomMargin=self.BOTTOM_MARGIN,
+        )
+
+        metadata = document.metadata
+        on_page = None
+        if metadata.get("logo_path") and metadata.get("universidad_nombre"):
+            def on_page(c, g):
+                self._draw_header_footer(
+                    c, g,
+                    metadata["logo_path"],
+                    metadata["universidad_nombre"],
+                    metadata.get("universidad_correo", ""),
+                    metadata.get("empresa_nombre", ""),
+                    metadata.get("empresa_email", ""),
+                    metadata.get("empresa_telefono", ""),
+                )
+
+        layout = _CanvasLayout(canvas, geometry, page_size, on_page, self._paragraph)
+        layout_fn(layout, document, self._create_styles(style))
+        return canvas
+
+    # ================================
+    # Layouts por tipo de documento
+    # ================================
+
+    def _layout_comprobante_postulacion(
+        self,
+        layout: _CanvasLayout,
+        document: PDFDocument,
+        styles: CompiledStylesheet,
+    ) -> None:
+        """
+        Layout del comprobante de postulación.
+
+        Estructura (ver GenerarComprobantePostulacionUseCase):
+        1. Título + fecha de postulación + tabla de datos clave
+        2. Mensaje narrativo (único texto con wrapping)
+        3. Bloque de firma empujado hacia abajo con un espaciador fijo
+        """
+        if len(document.sections) != 3:
+            raise LayoutOverflow()
+        datos, narrativa, firma = document.sections
+        if not firma.metadata.get("push_to_bottom"):
+            raise LayoutOverflow()
+
+        tables = [e for e in datos.elements if isinstance(e, PDFTable)]
+        if len(tables) != 1 or not self._is_simple_table(tables[0]):
+            raise LayoutOverflow()
+
+        # Título del documento
+        layout.paragraph(document.title, styles["title"])
+        layout.space(TITLE_SPACE)
+
+        # 1. Fecha de postulación y tabla de datos clave
+        self._layout_section_text(layout, datos, styles["subtitle"])
+        layout.table(tables[0], styles)
+        layout.space(TABLE_SPACE)
+        layout.space(SECTION_SPACE)
+
+        # 2. Mensaje narrativo
+        self._layout_section_text(layout, narrativa, styles["body"])
+        layout.space(SECTION_SPACE)
+
+        # 3. Firma: el espaciador pasa a la página siguiente si no entra
+        if layout.y - PUSH_TO_BOTTOM_SPACE < layout.bottom:
+            layout.new_page()
+        layout.space(PUSH_TO_BOTTOM_SPACE)
+        self._layout_section_text(layout, firma, styles["body"])
+        layout.space(SECTION_SPACE)
+
+    def _layout_section_text(
+        self,
+        layout: _CanvasLayout,
+        section: PDFSection,
+        paragraph_style: ParagraphStyle,
+    ) -> None:
+        """Dibuja el contenido de una sección sin título (igual que _build_section)."""
+        if section.title:
+            raise LayoutOverflow()
+        for para_text in (section.content or "").split("\n\n"):
+            if para_text.strip():
+                layout.paragraph(para_text.strip(), paragraph_style)
+                layout.space(PARAGRAPH_SPACE)
+
+    @staticmethod
+    def _is_simple_table(table: PDFTable) -> bool:
+        """Tabla de datos de 2 columnas con celdas de una línea."""
+        if table.title or len(table.headers) != 2:
+            return False
+        if all(not h.strip() for h in table.headers):
+            return False
+        return all(
+            len(row) == 2 and all(isinstance(v, str) and "\n" not in v for v in row)
+            for row in [table.headers] + table.rows
+        )
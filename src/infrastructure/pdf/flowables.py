@@ -0,0 +1,211 @@
+"""
+Flowable Factory
+================
+
+Tablas y espaciadores de Platypus armados a partir de piezas
+precompiladas, compartidas por todo el proceso.
+
+Problema:
+- `_build_table` creaba un `TableStyle` nuevo (~10 comandos) y una
+  lista de anchos de columna nueva para CADA tabla de CADA request,
+  aunque solo existen dos variantes fijas: firmas y datos clave
+- Cada párrafo, tabla y sección agregaba su propio `Spacer`, siempre
+  con los mismos tres o cuatro altos
+
+Solución:
+- Los estilos de tabla se arman una vez por tipografía (al importar
+  los de las plantillas, `DATA_TABLE_STYLE` y `SIGNATURE_TABLE_STYLE`;
+  al compilar la hoja de cada PDFStyle, los demás) y son inmutables
+  (`FrozenTableStyle`)
+- Los anchos de columna son tuplas constantes (Table las copia antes
+  de modificarlas)
+- `spacer(height)` retorna siempre la misma instancia por alto
+
+Decisiones técnicas:
+- Un flowable compartido no puede guardar estado del layout: Frame
+  le asigna `canv` y `_frame` mientras lo dibuja, y `_postponed` si no
+  entra en la página (un segundo `_postponed` en otro documento
+  dispararía LayoutError). `SharedSpacer` descarta esos atributos, así
+  se puede usar en varios documentos y threads a la vez
+- Solo se comparten espaciadores de alto fijo menor a una página: uno
+  que no entra se vuelve a intentar en la página siguiente, donde
+  siempre entra
+"""
+
+from functools import lru_cache
+from typing import Sequence
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch, mm
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from src.infrastructure.pdf.paged_table import PagedTable
+
+
+class FrozenTableStyle(TableStyle):
+    """TableStyle de solo lectura, compartido entre tablas y threads."""
+
+    def add(self, *cmd) -> None:
+        raise TypeError("FrozenTableStyle es inmutable: derivar con TableStyle(parent=...)")
+
+
+class SharedSpacer(Spacer):
+    """Spacer que no guarda estado del layout (ver docstring del módulo)."""
+
+    _LAYOUT_ATTRS = frozenset(("canv", "_frame", "_postponed"))
+
+    def __setattr__(self, name: str, value) -> None:
+        if name not in self._LAYOUT_ATTRS:
+            super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name not in self._LAYOUT_ATTRS:
+            super().__delattr__(name)
+
+
+# ================================
+# Estilos de tabla
+# ================================
+
+# Tipografía y padding de las tablas de datos de las plantillas (los
+# usa PagedTable para medir)
+DATA_TABLE_FONT = "Times-Roman"
+DATA_TABLE_FONT_SIZE = 10
+DATA_TABLE_PADDING = 4
+
+
+def data_table_style(font_name: str, font_size: float, text_color=colors.black) -> FrozenTableStyle:
+    """Estilo profesional de tabla de datos: líneas sutiles, sin fondo en header."""
+    return FrozenTableStyle([
+        # Tipografía
+        ("FONTNAME", (0, 0), (-1, -1), font_name),
+        ("FONTSIZE", (0, 0), (-1, -1), font_size),
+        ("TEXTCOLOR", (0, 0), (-1, -1), text_color),
+
+        # Alineación
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+
+        # Líneas sutiles con whitesmoke
+        ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.whitesmoke),
+
+        # Padding reducido para look más compacto
+        ("LEFTPADDING", (0, 0), (-1, -1), DATA_TABLE_PADDING),
+        ("RIGHTPADDING", (0, 0), (-1, -1), DATA_TABLE_PADDING),
+        ("TOPPADDING", (0, 0), (-1, -1), DATA_TABLE_PADDING),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), DATA_TABLE_PADDING),
+    ])
+
+
+def signature_table_style(font_name: str, font_size: float, text_color=colors.black) -> FrozenTableStyle:
+    """Estilo limpio de tabla de firmas: sin líneas, centrado."""
+    return FrozenTableStyle([
+        # Tipografía
+        ("FONTNAME", (0, 0), (-1, -1), font_name),
+        ("FONTSIZE", (0, 0), (-1, -1), font_size),
+        ("TEXTCOLOR", (0, 0), (-1, -1), text_color),
+
+        # Alineación centrada
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+
+        # Sin líneas
+        ("GRID", (0, 0), (-1, -1), 0, colors.white),
+
+        # Padding generoso para separación
+        ("LEFTPADDING", (0, 0), (-1, -1), 12),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+        ("TOPPADDING", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ])
+
+
+# Estilos por defecto (tipografía de las plantillas); las hojas de cada
+# PDFStyle arman los suyos en stylesheet_registry
+DATA_TABLE_STYLE = data_table_style(DATA_TABLE_FONT, DATA_TABLE_FONT_SIZE)
+SIGNATURE_TABLE_STYLE = signature_table_style(DATA_TABLE_FONT, DATA_TABLE_FONT_SIZE)
+
+
+# ================================
+# Anchos de columna
+# ================================
+
+# Anchos iguales para ambas columnas de firma
+SIGNATURE_COL_WIDTHS = (77.5 * mm, 77.5 * mm)
+
+# Tabla de datos clave: rótulo | valor
+KEY_VALUE_COL_WIDTHS = (45 * mm, 110 * mm)
+
+
+# ================================
+# Espaciadores
+# ================================
+
+# Espacio tras el título del documento
+TITLE_SPACE = 0.25 * inch
+
+# Espacio tras cada párrafo, tras el título de una tabla, tras una
+# tabla y al final de cada sección
+PARAGRAPH_SPACE = 6
+TABLE_TITLE_SPACE = 4
+TABLE_SPACE = 8
+SECTION_SPACE = 12
+
+# Espacio que empuja una sección hacia el final de la página (firmas).
+# 6.5 inches es aproximadamente el espacio de una página A4 menos márgenes
+PUSH_TO_BOTTOM_SPACE = 6.5 * inch
+
+
+@lru_cache(maxsize=32)
+def spacer(height: float) -> SharedSpacer:
+    """Espaciador vertical compartido de `height` puntos."""
+    return SharedSpacer(1, height)
+
+
+# ================================
+# Tablas
+# ================================
+
+def signature_table(
+    rows: Sequence[Sequence[str]],
+    columns: int,
+    style: TableStyle = SIGNATURE_TABLE_STYLE,
+) -> Table:
+    """Tabla de firmas: solo las filas, sin headers ni líneas."""
+    col_widths = SIGNATURE_COL_WIDTHS if columns == 2 else None
+    return Table(list(rows), colWidths=col_widths, hAlign="CENTER", style=style)
+
+
+def data_table(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    style: TableStyle = DATA_TABLE_STYLE,
+) -> Table:
+    """Tabla de datos con header; dos columnas usan los anchos de datos clave."""
+    data = [headers]
+    data.extend(rows)
+    col_widths = KEY_VALUE_COL_WIDTHS if len(headers) == 2 else None
+    return Table(data, colWidths=col_widths, hAlign="LEFT", style=style)
+
+
+def paged_data_table(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    style: TableStyle = DATA_TABLE_STYLE,
+    font_name: str = DATA_TABLE_FONT,
+    font_size: float = DATA_TABLE_FONT_SIZE,
+) -> PagedTable:
+    """
+    Tabla de datos grande: una página a la vez, header repetido en cada una.
+
+    `font_name` y `font_size` deben ser los del `style` (PagedTable
+    mide las filas con ellos).
+    """
+    return PagedTable(
+        headers,
+        rows,
+        style,
+        font_name=font_name,
+        font_size=font_size,
+        padding=DATA_TABLE_PADDING,
+    )
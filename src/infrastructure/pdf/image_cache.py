@@ -0,0 +1,147 @@
+"""
+Image Asset Cache
+=================
+
+Caché de imágenes (logo) listas para embeber en el PDF, compartida
+por todo el proceso.
+
+Problema:
+- `canvas.drawImage(path)` reutiliza la imagen dentro de un mismo
+  documento, pero en CADA documento nuevo vuelve a abrir el PNG,
+  decodificarlo, comprimirlo y codificarlo en ASCII85 (sin la
+  extensión C `_rl_accel` esa codificación es Python puro y domina
+  el costo: ~10ms por documento para el logo UTN)
+
+Solución:
+- La imagen se decodifica y codifica UNA sola vez a un
+  `PDFImageXObject` plantilla (incluida su máscara, si se pide)
+- Por documento se registra una copia superficial de esa plantilla
+  bajo el mismo nombre que usaría `drawImage(path)`; así `drawImage`
+  la encuentra ya registrada y solo emite el operador de dibujo
+
+Decisiones técnicas:
+- Se reutiliza el posicionamiento de `drawImage` (preserveAspectRatio,
+  anchor) en lugar de reimplementarlo
+- `functools.lru_cache` como caché del proceso (igual que estilos y fechas)
+- La copia por documento es necesaria porque ReportLab asigna la
+  referencia de la máscara (`smask`) en el objeto registrado
+"""
+
+import copy
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfbase.pdfdoc import PDFImageXObject
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    """
+    Imagen precodificada lista para embeber.
+
+    Atributos:
+        path: Ruta del archivo de imagen (la que se pasa a drawImage)
+        mask: Máscara con la que se dibuja (None o "auto")
+        name: Nombre interno que ReportLab asigna a (path, mask)
+        xobject: Plantilla PDFImageXObject ya codificada
+        width: Ancho en píxeles
+        height: Alto en píxeles
+    """
+    path: str
+    mask: str | None
+    name: str
+    xobject: PDFImageXObject
+    width: int
+    height: int
+
+
+@lru_cache(maxsize=8)
+def get_cached_image(path: str | None, mask: str | None = None) -> CachedImage | None:
+    """
+    Decodifica una imagen una sola vez por proceso.
+
+    Args:
+        path: Ruta del archivo de imagen
+        mask: Máscara de transparencia ("auto" usa el canal alfa)
+
+    Returns:
+        CachedImage, o None si la ruta no existe
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    # Mismo nombre que calcula canvas.drawImage para un filename
+    name = pdfdoc._digester(f"{path}{mask}".encode("utf-8"))
+
+    xobject = PDFImageXObject(name, path, mask=mask)
+    xobject.name = name
+
+    return CachedImage(
+        path=path,
+        mask=mask,
+        name=name,
+        xobject=xobject,
+        width=xobject.width,
+        height=xobject.height,
+    )
+
+
+def register_cached_image(canvas, image: CachedImage) -> None:
+    """
+    Registra la imagen en el documento del canvas si aún no lo está.
+
+    Después de esto `canvas.drawImage(image.path, mask=image.mask, ...)`
+    reutiliza el XObject registrado sin volver a leer el archivo.
+
+    Args:
+        canvas: Canvas de ReportLab
+        image: Imagen precodificada
+    """
+    doc = canvas._doc
+    reg_name = doc.getXObjectName(image.name)
+    if doc.idToObject.get(reg_name) is not None:
+        return
+
+    img_obj = copy.copy(image.xobject)
+    canvas._setXObjects(img_obj)
+    doc.Reference(img_obj, reg_name)
+    doc.addForm(image.name, img_obj)
+
+    smask = getattr(img_obj, "_smask", None)
+    if smask is not None:
+        mask_reg_name = doc.getXObjectName(smask.name)
+        if doc.idToObject.get(mask_reg_name) is None:
+            canvas._setXObjects(smask)
+            img_obj.smask = doc.Reference(smask, mask_reg_name)
+        else:
+            img_obj.smask = pdfdoc.PDFObjectReference(mask_reg_name)
+        del img_obj._smask
+
+
+def draw_cached_image(
+    canvas,
+    image: CachedImage,
+    x: float,
+    y: float,
+    width: float | None = None,
+    height: float | None = None,
+    **kwargs,
+):
+    """
+    Dibuja una imagen cacheada con la misma API que canvas.drawImage.
+
+    Args:
+        canvas: Canvas de ReportLab
+        image: Imagen precodificada
+        x, y, width, height: Posición y tamaño (igual que drawImage)
+        **kwargs: preserveAspectRatio, anchor, etc.
+
+    Returns:
+        El (ancho, alto) de la imagen, igual que drawImage
+    """
+    register_cached_image(canvas, image)
+    return canvas.drawImage(
+        image.path, x, y, width=width, height=height, mask=image.mask, **kwargs
+    )
@@ -0,0 +1,155 @@
+"""
+Paged Table
+===========
+
+Flowable para tablas de decenas de miles de filas.
+
+Con un `Table` de ReportLab cada salto de página vuelve a partir y a
+medir todas las filas que quedan, y antes de empezar se miden todas
+las celdas para calcular anchos y altos: el tiempo crece más que
+linealmente con las filas y toda la tabla vive en memoria como
+objetos de layout.
+
+`PagedTable` en cambio:
+- Fija los anchos de columna una sola vez, midiendo el header y una
+  muestra de las primeras filas
+- Usa un alto de fila fijo (celdas de una línea), así que las filas
+  que entran en una página se calculan con una división
+- Al partirse arma un `Table` chico solo con las filas de esa página
+  (más el header repetido) y deja el resto como otro `PagedTable`
+
+El costo por página es constante: el layout es lineal en la cantidad
+de filas y en memoria vive una página de tabla a la vez (más las filas
+de origen, que se recorren por slices).
+"""
+
+from typing import Sequence
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable, Table, TableStyle
+
+
+class PagedTable(Flowable):
+    """
+    Tabla que se arma de a una página.
+
+    Ejemplo:
+        >>> table = PagedTable(
+        ...     headers=["Legajo", "Nombre"],
+        ...     rows=rows,  # cualquier secuencia que soporte slices
+        ...     style=table_style,
+        ...     font_name="Times-Roman",
+        ...     font_size=10,
+        ...     padding=4,
+        ... )
+        >>> doc.build([table])
+    """
+
+    # Filas que se miden para fijar los anchos de columna
+    SAMPLE_ROWS = 200
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        rows: Sequence[Sequence[str]],
+        style: TableStyle,
+        font_name: str,
+        font_size: float,
+        padding: float,
+        start: int = 0,
+        col_widths: list[float] | None = None,
+        hAlign: str = "LEFT",
+    ) -> None:
+        """
+        Inicializa la tabla.
+
+        Args:
+            headers: Encabezados (se repiten en cada página)
+            rows: Filas de datos
+            style: Estilo aplicado a la tabla de cada página
+            font_name: Fuente de las celdas (para medir anchos)
+            font_size: Tamaño de fuente de las celdas
+            padding: Padding de cada lado de la celda (puntos)
+            start: Primera fila de `rows` que falta dibujar
+            col_widths: Anchos ya calculados (continuaciones)
+            hAlign: Alineación horizontal
+        """
+        super().__init__()
+        self._headers = list(headers)
+        self._rows = rows
+        self._style = style
+        self._font_name = font_name
+        self._font_size = font_size
+        self._padding = padding
+        self._start = start
+        self._col_widths = col_widths
+        self._row_height = font_size * 1.2 + 2 * padding
+        self.hAlign = hAlign
+
+    @property
+    def remaining_rows(self) -> int:
+        """Filas que faltan dibujar."""
+        return len(self._rows) - self._start
+
+    def wrap(self, availWidth: float, availHeight: float) -> tuple[float, float]:
+        if self._col_widths is None:
+            self._col_widths = self._measure_columns(availWidth)
+        self.width = sum(self._col_widths)
+        self.height = self._row_height * (1 + self.remaining_rows)
+        return self.width, self.height
+
+    def split(self, availWidth: float, availHeight: float) -> list[Flowable]:
+        self.wrap(availWidth, availHeight)
+        fit = int(availHeight // self._row_height) - 1  # el header ocupa una fila
+        if fit < 1:
+            return []
+
+        end = self._start + fit
+        if end >= len(self._rows):
+            return [self._page_table(self._start, len(self._rows))]
+        return [
+            self._page_table(self._start, end),
+            PagedTable(
+                self._headers,
+                self._rows,
+                self._style,
+                self._font_name,
+                self._font_size,
+                self._padding,
+                start=end,
+                col_widths=self._col_widths,
+                hAlign=self.hAlign,
+            ),
+        ]
+
+    def draw(self) -> None:
+        table = self._page_table(self._start, len(self._rows))
+        table.wrapOn(self.canv, self.width, self.height)
+        table.drawOn(self.canv, 0, 0)
+
+    def _page_table(self, start: int, end: int) -> Table:
+        """Tabla de ReportLab con el header y las filas [start, end)."""
+        data = [self._headers]
+        data.extend(self._rows[start:end])
+        return Table(
+            data,
+            colWidths=self._col_widths,
+            rowHeights=self._row_height,
+            style=self._style,
+            hAlign=self.hAlign,
+        )
+
+    def _measure_columns(self, availWidth: float) -> list[float]:
+        """Anchos según el header y una muestra de filas, escalados al ancho disponible."""
+        widths = [self._text_width(header) for header in self._headers]
+        for row in self._rows[: self.SAMPLE_ROWS]:
+            for i, cell in enumerate(row):
+                widths[i] = max(widths[i], self._text_width(cell))
+
+        total = sum(widths)
+        if total > availWidth:
+            widths = [width * availWidth / total for width in widths]
+        return widths
+
+    def _text_width(self, text: str) -> float:
+        return stringWidth(str(text), self._font_name, self._font_size) + 2 * self._padding
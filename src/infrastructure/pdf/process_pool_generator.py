@@ -0,0 +1,234 @@
+"""
+Process Pool PDF Generator
+==========================
+
+Implementación de IPDFGenerator que delega el renderizado a un pool
+de procesos hijos, cada uno con su propio ReportLabGenerator.
+
+ReportLab es 100% CPU-bound y Python puro en su mayor parte: con
+`asyncio.to_thread` todos los renders de un worker compiten por el
+mismo GIL, por lo que un proceso uvicorn usa como máximo ~1 core.
+Este adapter reparte los renders entre N procesos para escalar con
+los cores disponibles dentro de un mismo contenedor.
+
+Decisiones técnicas:
+- Se usa el contexto "spawn": es seguro aunque el proceso padre ya
+  tenga threads (uvicorn, thread pool de asyncio)
+- Cada proceso hijo crea un único ReportLabGenerator en su initializer
+  y precalienta los estilos (procesos "calientes")
+- PDFDocument y PDFStyle son dataclasses picklables; se envían tal cual
+- El hijo devuelve los bytes del PDF y sus páginas; el padre escribe
+  los bytes en el destino e informa las páginas (métricas)
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO
+
+from src.domain.entities import PDFDocument
+from src.domain.exceptions import PDFGenerationError
+from src.domain.interfaces import IPDFGenerator
+from src.domain.value_objects import PDFStyle
+from src.infrastructure.metrics.prometheus import count_pages, report_pages
+
+
+# ================================
+# Estado del proceso hijo
+# ================================
+
+# Generador propio de cada proceso hijo (se crea en el initializer)
+_worker_generator = None
+
+
+def _init_worker(
+    invariant: bool,
+    fast_path: bool,
+    template_cache_entries: int,
+    string_width_cache_entries: int = 0,
+) -> None:
+    """
+    Crea el generador del proceso hijo, compila los estilos preset e
+    instala la caché de anchos de texto del proceso.
+    """
+    global _worker_generator
+    from src.infrastructure.pdf.canvas_generator import CanvasPDFGenerator
+    from src.infrastructure.pdf.reportlab_generator import ReportLabGenerator
+    from src.infrastructure.pdf.string_width_cache import (
+        StringWidthCache,
+        install_string_width_cache,
+    )
+    from src.infrastructure.pdf.stylesheet_registry import stylesheet_registry
+    from src.infrastructure.pdf.template_cache import TemplateLayoutCache
+
+    generator_class = CanvasPDFGenerator if fast_path else ReportLabGenerator
+    layout_cache = (
+        TemplateLayoutCache(max_entries=template_cache_entries)
+        if template_cache_entries
+        else None
+    )
+    _worker_generator = generator_class(invariant=invariant, layout_cache=layout_cache)
+    stylesheet_registry.precompile_presets()
+    if string_width_cache_entries:
+        install_string_width_cache(StringWidthCache(max_entries=string_width_cache_entries))
+
+
+def _render_in_worker(document: PDFDocument, style: PDFStyle | None) -> tuple[bytes, int | None]:
+    """Renderiza el documento dentro del proceso hijo (bytes y páginas)."""
+    with count_pages() as counted:
+        content = _worker_generator.generate(document, style)
+    return content, counted.pages
+
+
+def _ping() -> int:
+    """Tarea vacía usada para levantar los procesos del pool."""
+    return os.getpid()
+
+
+class ProcessPoolPDFGenerator(IPDFGenerator):
+    """
+    Generador de PDF que renderiza en un pool de procesos.
+
+    Implementa IPDFGenerator, por lo que los casos de uso no notan
+    la diferencia con ReportLabGenerator.
+
+    Ejemplo:
+        >>> generator = ProcessPoolPDFGenerator(max_workers=4)
+        >>> pdf_bytes = generator.generate(document, style)
+        >>> generator.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        invariant: bool = False,
+        fast_path: bool = False,
+        template_cache_entries: int = 0,
+        string_width_cache_entries: int = 0,
+    ) -> None:
+        """
+        Inicializa el pool de procesos.
+
+        Args:
+            max_workers: Cantidad de procesos hijos. Si es None o 0 se usa
+                         la cantidad de CPUs disponibles.
+            invariant: Modo invariant de ReportLab en los procesos hijos
+                       (ver ReportLabGenerator)
+            fast_path: Si es True los procesos hijos usan CanvasPDFGenerator
+            template_cache_entries: Tamaño de la caché de plantillas de cada
+                                    proceso hijo (0 la desactiva)
+            string_width_cache_entries: Tamaño de la caché de anchos de
+                                        texto de cada proceso hijo (0 la
+                                        desactiva)
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(invariant, fast_path, template_cache_entries, string_width_cache_entries),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Cantidad de procesos hijos del pool."""
+        return self._max_workers
+
+    def warm_up(self) -> None:
+        """
+        Levanta todos los procesos hijos del pool.
+
+        Con "spawn" los procesos se crean bajo demanda; enviar una tarea
+        por worker evita que el primer request pague el arranque.
+        """
+        futures = [self._executor.submit(_ping) for _ in range(self._max_workers)]
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Detiene el pool de procesos esperando los renders en curso."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def generate(
+        self,
+        document: PDFDocument,
+        style: PDFStyle | None = None
+    ) -> bytes:
+        """
+        Genera un PDF en un proceso hijo y retorna los bytes.
+
+        Args:
+            document: Documento del dominio a convertir
+            style: Estilos opcionales
+
+        Returns:
+            Contenido del PDF como bytes
+        """
+        # Un generador de secciones no se puede enviar al proceso hijo:
+        # las secciones perezosas se producen acá antes de serializar
+        document.materialize_sections()
+        try:
+            future = self._executor.submit(_render_in_worker, document, style)
+            content, pages = future.result()
+        except BrokenProcessPool as e:
+            raise PDFGenerationError(
+                f"El pool de procesos de renderizado no está disponible: {str(e)}",
+                details={"document_id": str(document.id)},
+            )
+        except PDFGenerationError:
+            raise
+        except Exception as e:
+            raise PDFGenerationError(
+                f"Error al generar el PDF: {str(e)}",
+                details={"document_id": str(document.id)},
+            )
+        if pages is not None:
+            report_pages(pages)
+        return content
+
+    def generate_to_file(
+        self,
+        document: PDFDocument,
+        output_path: str,
+        style: PDFStyle | None = None,
+    ) -> str:
+        """
+        Genera un PDF y lo guarda en un archivo.
+
+        Args:
+            document: Documento del dominio
+            output_path: Ruta del archivo de salida
+            style: Estilos opcionales
+
+        Returns:
+            Ruta del archivo generado
+        """
+        try:
+            with open(output_path, "wb") as f:
+                self.generate_to_stream(document, f, style)
+            return output_path
+        except IOError as e:
+            raise PDFGenerationError(
+                f"Error al escribir el archivo: {str(e)}",
+                details={"path": output_path},
+            )
+
+    def generate_to_stream(
+        self,
+        document: PDFDocument,
+        stream: BinaryIO,
+        style: PDFStyle | None = None,
+    ) -> None:
+        """
+        Genera un PDF y lo escribe en un stream.
+
+        El proceso hijo no puede escribir en un stream del proceso padre,
+        así que se renderiza a bytes y luego se escribe de una vez.
+
+        Args:
+            document: Documento del dominio
+            stream: Stream binario de salida
+            style: Estilos opcionales
+        """
+        stream.write(self.generate(document, style))
@@ -14,31 +14,54 @@ Decisiones técnicas:
 - Se usa ReportLab's Platypus para layout de alto nivel
 - Los estilos del dominio se mapean a estilos de ReportLab
 - El PDF se genera en memoria (BytesIO) para eficiencia
-- Los estilos se cachean con @lru_cache para mejor performance
+- Los estilos se compilan una vez por proceso (stylesheet_registry)
+- Modo "invariant" opcional para PDFs byte a byte reproducibles
+- El logo se decodifica una vez por proceso (image_cache)
+- Header/footer estático como Form XObject reutilizado en cada página
+- Modo plantilla opcional: textos fijos parseados una vez (template_cache)
+- Tablas grandes armadas de a una página (paged_table)
+- Estilos de tabla, anchos y espaciadores precompilados (flowables)
+- Flowables construidos sección por sección a medida que avanza el
+  layout (section_feed)
 """
 
-from functools import lru_cache
+import hashlib
+from functools import partial
 from io import BytesIO
 from typing import BinaryIO
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, LETTER, LEGAL, A3, A5, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
 from reportlab.platypus import (
-    SimpleDocTemplate,
     Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
     PageBreak,
 )
 
-from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.domain.entities import ColumnarTable, PDFDocument, PDFSection, PDFTable
 from src.domain.entities.pdf_document import PageSize, PageOrientation
 from src.domain.exceptions import PDFGenerationError
 from src.domain.interfaces import IPDFGenerator
 from src.domain.value_objects import PDFStyle
+from src.infrastructure.pdf.image_cache import draw_cached_image, get_cached_image
+from src.infrastructure.pdf.flowables import (
+    PARAGRAPH_SPACE,
+    PUSH_TO_BOTTOM_SPACE,
+    SECTION_SPACE,
+    TABLE_SPACE,
+    TABLE_TITLE_SPACE,
+    TITLE_SPACE,
+    data_table,
+    paged_data_table,
+    signature_table,
+    spacer,
+)
+from src.infrastructure.pdf.section_feed import SectionFeed, SectionFeedDocTemplate
+from src.infrastructure.pdf.stylesheet_registry import CompiledStylesheet, stylesheet_registry
+from src.infrastructure.pdf.template_cache import TemplateLayoutCache, TemplateParagraph
+from src.infrastructure.metrics.prometheus import report_pages
+from src.application.utils.stage_timing import stage
 
 
 class ReportLabGenerator(IPDFGenerator):
@@ -68,6 +91,38 @@ class ReportLabGenerator(IPDFGenerator):
         PageSize.A5: A5,
     }
     
+    # Márgenes profesionales más amplios
+    TOP_MARGIN = 32 * mm  # Mayor espacio para header con logo
+    BOTTOM_MARGIN = 22 * mm
+    LEFT_MARGIN = 22 * mm
+    RIGHT_MARGIN = 22 * mm
+    
+    # A partir de estas filas las tablas se arman de a una página (PagedTable)
+    LARGE_TABLE_ROWS = 500
+    
+    def __init__(
+        self,
+        invariant: bool = False,
+        layout_cache: TemplateLayoutCache | None = None,
+    ) -> None:
+        """
+        Inicializa el generador.
+        
+        Args:
+            invariant: Si es True, ReportLab corre en modo "invariant":
+                       fecha de creación e ID del archivo fijos, de modo que
+                       el mismo documento produce siempre los mismos bytes
+            layout_cache: Modo plantilla: caché del parseo y corte de líneas
+                          de los textos fijos (ver template_cache)
+        """
+        self._invariant = invariant
+        self._layout_cache = layout_cache
+    
+    @property
+    def layout_cache(self) -> TemplateLayoutCache | None:
+        """Caché de la capa estática de plantillas (None si está desactivada)."""
+        return self._layout_cache
+    
     def generate(
         self, 
         document: PDFDocument, 
@@ -138,23 +193,17 @@ class ReportLabGenerator(IPDFGenerator):
             # Obtener tamaño de página
             page_size = self._get_page_size(document)
             
-            # Márgenes profesionales más amplios
-            from reportlab.lib.units import mm
-            top_margin = 32 * mm  # Mayor espacio para header con logo
-            bottom_margin = 22 * mm
-            left_margin = 22 * mm
-            right_margin = 22 * mm
-            
-            # Crear el documento de ReportLab
-            doc = SimpleDocTemplate(
+            # Crear el documento de ReportLab (expande las secciones a demanda)
+            doc = SectionFeedDocTemplate(
                 stream,
                 pagesize=page_size,
-                topMargin=top_margin,
-                bottomMargin=bottom_margin,
-                leftMargin=left_margin,
-                rightMargin=right_margin,
+                topMargin=self.TOP_MARGIN,
+                bottomMargin=self.BOTTOM_MARGIN,
+                leftMargin=self.LEFT_MARGIN,
+                rightMargin=self.RIGHT_MARGIN,
                 title=document.title,
                 author=document.author,
+                invariant=True if self._invariant else None,
             )
             
             # Construir los elementos del documento
@@ -170,21 +219,24 @@ class ReportLabGenerator(IPDFGenerator):
             
             # Generar el PDF (con o sin header/footer personalizado)
             if logo_path and universidad_nombre:
-                # Usar callbacks para header/footer con logo
-                doc.build(
-                    elements,
-                    onFirstPage=lambda c, d: self._draw_header_footer(
-                        c, d, logo_path, universidad_nombre,
-                        universidad_correo, empresa_nombre, empresa_email, empresa_telefono
-                    ),
-                    onLaterPages=lambda c, d: self._draw_header_footer(
-                        c, d, logo_path, universidad_nombre,
-                        universidad_correo, empresa_nombre, empresa_email, empresa_telefono
-                    ),
+                # Un único callback para todas las páginas: el header/footer
+                # estático se dibuja como Form XObject (ver _draw_header_footer)
+                on_page = partial(
+                    self._draw_header_footer,
+                    logo_path=logo_path,
+                    universidad_nombre=universidad_nombre,
+                    universidad_correo=universidad_correo,
+                    empresa_nombre=empresa_nombre,
+                    empresa_email=empresa_email,
+                    empresa_telefono=empresa_telefono,
                 )
+                with stage("doc_build"):
+                    doc.build(elements, onFirstPage=on_page, onLaterPages=on_page)
             else:
                 # Sin header/footer personalizado
-                doc.build(elements)
+                with stage("doc_build"):
+                    doc.build(elements)
+            report_pages(doc.page)
             
         except Exception as e:
             raise PDFGenerationError(
@@ -192,6 +244,12 @@ class ReportLabGenerator(IPDFGenerator):
                 details={"document_id": str(document.id)},
             )
     
+    def _paragraph(self, text: str, style: ParagraphStyle) -> Paragraph:
+        """Crea un Paragraph, reutilizando la capa de plantilla si hay caché."""
+        if self._layout_cache is None:
+            return Paragraph(text, style)
+        return TemplateParagraph(text, style, layout_cache=self._layout_cache)
+    
     def _get_page_size(self, document: PDFDocument) -> tuple:
         """Obtiene el tamaño de página de ReportLab."""
         base_size = self.PAGE_SIZES.get(document.page_size, A4)
@@ -210,111 +268,54 @@ class ReportLabGenerator(IPDFGenerator):
         
         Platypus es el sistema de layout de alto nivel de ReportLab.
         Los elementos se procesan secuencialmente para generar el PDF.
+        
+        Las secciones no se convierten acá: el SectionFeed final las
+        convierte de a una cuando el layout llega a él, así nunca están
+        todos los flowables del documento en memoria.
         """
-        elements = []
         styles = self._create_styles(style)
         
         # Título del documento
-        title = Paragraph(document.title, styles["title"])
-        elements.append(title)
-        elements.append(Spacer(1, 0.25 * inch))
-        
-        # Procesar cada sección
-        for section in document.sections:
-            section_elements = self._build_section(section, styles)
-            elements.extend(section_elements)
-        
-        return elements
+        title = self._paragraph(document.title, styles["title"])
+        
+        return [
+            title,
+            spacer(TITLE_SPACE),
+            SectionFeed(
+                document.iter_sections(),
+                partial(self._build_section, styles=styles),
+            ),
+        ]
     
-    @lru_cache(maxsize=16)
-    def _create_styles(self, style: PDFStyle) -> dict:
+    def _create_styles(self, style: PDFStyle) -> CompiledStylesheet:
         """
-        Crea los estilos de Paragraph con tipografía profesional.
+        Hoja de estilos compilada del PDFStyle (Paragraph y tablas).
         
-        Usa Times-Roman/Times-Bold para un look más formal y profesional.
-        Los estilos se cachean en memoria para evitar recrearlos en cada request.
+        Las hojas viven en el registro del proceso (stylesheet_registry),
+        compartidas por todos los generadores.
         """
-        base_styles = getSampleStyleSheet()
-        
-        # Color primario como RGB
-        primary_rgb = style.colors.to_rgb("primary")
-        text_rgb = style.colors.to_rgb("text")
-        
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-        
-        return {
-            "title": ParagraphStyle(
-                "CustomTitle",
-                parent=base_styles["Heading1"],
-                fontName="Times-Bold",
-                fontSize=14,
-                textColor=colors.black,
-                alignment=TA_CENTER,
-                spaceAfter=6,
-                leading=17,
-            ),
-            "heading": ParagraphStyle(
-                "CustomHeading",
-                parent=base_styles["Heading2"],
-                fontName="Times-Bold",
-                fontSize=10,
-                textColor=colors.black,
-                alignment=TA_LEFT,
-                spaceBefore=8,
-                spaceAfter=4,
-                leading=12,
-            ),
-            "body": ParagraphStyle(
-                "CustomBody",
-                parent=base_styles["Normal"],
-                fontName="Times-Roman",
-                fontSize=10,
-                textColor=colors.black,
-                leading=14,
-                alignment=TA_JUSTIFY,  # Justificado para cláusulas
-            ),
-            "subtitle": ParagraphStyle(
-                "Subtitle",
-                parent=base_styles["Normal"],
-                fontName="Times-Roman",
-                fontSize=9,
-                textColor=colors.grey,
-                alignment=TA_CENTER,
-                spaceAfter=8,
-                leading=11,
-            ),
-            "footer": ParagraphStyle(
-                "Footer",
-                parent=base_styles["Normal"],
-                fontName="Helvetica",
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=TA_LEFT,
-                leading=10,
-            ),
-        }
+        return stylesheet_registry.get(style)
     
-    def _build_section(self, section: PDFSection, styles: dict) -> list:
+    def _build_section(self, section: PDFSection, styles: CompiledStylesheet) -> list:
         """Construye los elementos de una sección."""
         elements = []
         
         # Si la sección debe empujarse hacia abajo (ej: firmas)
         if section.metadata.get("push_to_bottom"):
             # Agregar un espaciador grande para empujar hacia el final de la página
-            # 6.5 inches es aproximadamente el espacio de una página A4 menos márgenes
-            elements.append(Spacer(1, 6.5 * inch))
+            elements.append(spacer(PUSH_TO_BOTTOM_SPACE))
         
         # Título de la sección según nivel
         if section.title:
             if section.level == 1:
                 # Nivel 1: Título principal (centrado)
-                heading = Paragraph(section.title, styles["title"])
+                heading = self._paragraph(section.title, styles["title"])
             elif section.level == 3:
                 # Nivel 3: Footer (alineado a derecha)
-                heading = Paragraph(section.title, styles["footer"])
+                heading = self._paragraph(section.title, styles["footer"])
             else:
                 # Nivel 2: Subtítulos
-                heading = Paragraph(section.title, styles["heading"])
+                heading = self._paragraph(section.title, styles["heading"])
             elements.append(heading)
         
         # Contenido de texto
@@ -332,91 +333,52 @@ class ReportLabGenerator(IPDFGenerator):
             paragraphs = section.content.split("\n\n")
             for para_text in paragraphs:
                 if para_text.strip():
-                    para = Paragraph(para_text.strip(), style_to_use)
+                    para = self._paragraph(para_text.strip(), style_to_use)
                     elements.append(para)
-                    elements.append(Spacer(1, 6))
+                    elements.append(spacer(PARAGRAPH_SPACE))
         
         # Procesar elementos (tablas, etc.)
         for element in section.elements:
-            if isinstance(element, PDFTable):
+            if isinstance(element, (PDFTable, ColumnarTable)):
                 table_elements = self._build_table(element, styles)
                 elements.extend(table_elements)
         
-        elements.append(Spacer(1, 12))
+        elements.append(spacer(SECTION_SPACE))
         return elements
     
-    def _build_table(self, table: PDFTable, styles: dict) -> list:
+    def _build_table(self, table: PDFTable | ColumnarTable, styles: CompiledStylesheet) -> list:
         """Construye una tabla de ReportLab con estilo profesional."""
-        from reportlab.lib.units import mm
-        
         elements = []
         
         # Título de la tabla (si existe)
         if table.title:
-            title = Paragraph(table.title, styles["heading"])
+            title = self._paragraph(table.title, styles["heading"])
             elements.append(title)
-            elements.append(Spacer(1, 4))
+            elements.append(spacer(TABLE_TITLE_SPACE))
         
         # Detectar si es tabla de firmas (headers vacíos)
         is_signature_table = all(not h.strip() for h in table.headers)
         
         if is_signature_table:
             # Tabla de firmas: solo las filas, sin headers
-            data = table.rows
-            # Anchos iguales para ambas columnas de firma
-            col_widths = [77.5*mm, 77.5*mm] if len(table.headers) == 2 else None
-            reportlab_table = Table(data, colWidths=col_widths, hAlign='CENTER')
-            
-            # Estilo limpio para firmas: sin líneas, centrado
-            table_style = TableStyle([
-                # Tipografía
-                ("FONTNAME", (0, 0), (-1, -1), "Times-Roman"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                
-                # Alineación centrada
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                
-                # Sin líneas
-                ("GRID", (0, 0), (-1, -1), 0, colors.white),
-                
-                # Padding generoso para separación
-                ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                ("TOPPADDING", (0, 0), (-1, -1), 8),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ])
+            reportlab_table = signature_table(
+                table.rows, len(table.headers), styles.tables["signature"]
+            )
+        elif len(table.rows) > self.LARGE_TABLE_ROWS:
+            # Tabla grande: una página a la vez, header repetido en cada una
+            reportlab_table = paged_data_table(
+                table.headers,
+                table.rows,
+                styles.tables["data"],
+                font_name=styles.table_font,
+                font_size=styles.table_font_size,
+            )
         else:
             # Tabla normal de datos
-            data = [table.headers] + table.rows
-            
-            # Anchos de columna profesionales
-            col_widths = [45*mm, 110*mm] if len(table.headers) == 2 else None
-            reportlab_table = Table(data, colWidths=col_widths, hAlign='LEFT')
-            
-            # Estilo profesional: líneas sutiles, sin fondo en header
-            table_style = TableStyle([
-                # Tipografía
-                ("FONTNAME", (0, 0), (-1, -1), "Times-Roman"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                
-                # Alineación
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                
-                # Líneas sutiles con whitesmoke
-                ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.whitesmoke),
-                
-                # Padding reducido para look más compacto
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ])
-        
-        reportlab_table.setStyle(table_style)
+            reportlab_table = data_table(table.headers, table.rows, styles.tables["data"])
+        
         elements.append(reportlab_table)
-        elements.append(Spacer(1, 8))
+        elements.append(spacer(TABLE_SPACE))
         
         return elements
     
@@ -440,6 +402,11 @@ class ReportLabGenerator(IPDFGenerator):
         - Información de contacto en footer izquierdo
         - Número de página en footer derecho
         
+        Todo lo que no cambia entre páginas (logo, línea, contactos) se
+        dibuja una sola vez por documento como Form XObject, identificado
+        por la tupla de branding. Cada página solo lo referencia y agrega
+        su número de página.
+        
         Args:
             canvas: Canvas de ReportLab para dibujar
             doc: Documento SimpleDocTemplate
@@ -450,32 +417,94 @@ class ReportLabGenerator(IPDFGenerator):
             empresa_email: Email de la empresa
             empresa_telefono: Teléfono de la empresa
         """
-        from reportlab.lib.units import mm
-        import os
+        width, height = A4
+        margin_right = doc.rightMargin
+        
+        branding = (
+            logo_path,
+            universidad_nombre,
+            universidad_correo,
+            empresa_nombre,
+            empresa_email,
+            empresa_telefono,
+            doc.leftMargin,
+            doc.rightMargin,
+            doc.topMargin,
+            doc.bottomMargin,
+        )
+        form_name = self._header_footer_form_name(branding)
+        
+        # Primera página del documento: definir el Form XObject
+        if not canvas.hasForm(form_name):
+            canvas.beginForm(form_name)
+            self._draw_static_header_footer(
+                canvas, doc, logo_path,
+                universidad_correo, empresa_nombre, empresa_email, empresa_telefono,
+            )
+            canvas.endForm()
+        
+        canvas.doForm(form_name)
+        
+        # Mismo estado gráfico que deja el header/footer dibujado inline
+        canvas.setStrokeColor(colors.lightgrey)
+        canvas.setLineWidth(0.4)
+        canvas.setFillColor(colors.grey)
+        
+        # Número de página (derecha)
+        canvas.setFont("Helvetica", 8)
+        canvas.drawRightString(
+            width - margin_right,
+            doc.bottomMargin - 8,
+            f"Página {doc.page}"
+        )
+    
+    @staticmethod
+    def _header_footer_form_name(branding: tuple) -> str:
+        """Nombre del Form XObject para una tupla de branding."""
+        digest = hashlib.sha1(repr(branding).encode("utf-8")).hexdigest()[:16]
+        return f"HeaderFooter{digest}"
+    
+    def _draw_static_header_footer(
+        self,
+        canvas,
+        doc,
+        logo_path: str,
+        universidad_correo: str = "",
+        empresa_nombre: str = "",
+        empresa_email: str = "",
+        empresa_telefono: str = "",
+    ) -> None:
+        """
+        Dibuja la parte estática del header/footer (logo, línea, contactos).
         
+        Se invoca dentro de beginForm/endForm, una vez por documento.
+        """
         width, height = A4
         margin_left = doc.leftMargin
         margin_right = doc.rightMargin
         
         # Dibuja logo UTN alineado a la izquierda en la parte superior
-        if logo_path and os.path.exists(logo_path):
-            try:
+        # (decodificado una sola vez por proceso, ver image_cache)
+        try:
+            logo = get_cached_image(logo_path)
+            if logo is not None:
                 logo_w = 42 * mm
                 logo_h = 14 * mm
                 # Alinear a la izquierda
                 x_logo = margin_left
                 y_logo = height - doc.topMargin + 6 * mm
-                canvas.drawImage(
-                    logo_path,
+                draw_cached_image(
+                    canvas,
+                    logo,
                     x_logo, y_logo,
                     width=logo_w,
                     height=logo_h,
                     preserveAspectRatio=True,
                     anchor='nw'
                 )
-            except Exception:
-                # Si falla cargar el logo, continuar sin él
-                pass
+        except Exception:
+            # Si falla cargar el logo, continuar sin él
+            pass
         
         # Línea horizontal sutil bajo header
         canvas.setStrokeColor(colors.lightgrey)
@@ -517,11 +546,3 @@ class ReportLabGenerator(IPDFGenerator):
                 footer_y - 10,
                 f"Contacto empresa: {empresa_info}"
             )
-        
-        # Número de página (derecha)
-        canvas.setFont("Helvetica", 8)
-        canvas.drawRightString(
-            width - margin_right,
-            footer_y,
-            f"Página {doc.page}"
-        )
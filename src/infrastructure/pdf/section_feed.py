@@ -0,0 +1,75 @@
+"""
+Section Feed
+============
+
+Construcción de flowables a demanda, sección por sección.
+
+`SimpleDocTemplate.build` recibe una lista con todos los flowables del
+documento: para un reporte largo eso es el modelo completo más todos
+sus Paragraph/Table en memoria antes de dibujar la primera página.
+
+`SectionFeed` es un marcador que va al final de la lista. Cuando el
+layout llega a él, `SectionFeedDocTemplate` lo reemplaza por los
+flowables de la próxima sección seguidos del mismo marcador. Los
+flowables ya dibujados salen de la lista y se liberan: en memoria vive
+la sección en curso, no el documento.
+"""
+
+from typing import Callable, Iterator
+
+from reportlab.platypus import Flowable, SimpleDocTemplate
+
+from src.domain.entities import PDFSection
+from src.application.utils.stage_timing import stage
+
+
+class SectionFeed(Flowable):
+    """
+    Marcador que produce los flowables de la próxima sección.
+
+    Nunca se dibuja: SectionFeedDocTemplate lo expande antes.
+    """
+
+    def __init__(
+        self,
+        sections: Iterator[PDFSection],
+        build_section: Callable[[PDFSection], list[Flowable]],
+    ) -> None:
+        """
+        Args:
+            sections: Secciones pendientes (se consumen de a una)
+            build_section: Convierte una sección en sus flowables
+        """
+        super().__init__()
+        self._sections = sections
+        self._build_section = build_section
+
+    def next_flowables(self) -> list[Flowable] | None:
+        """Flowables de la próxima sección no vacía (None si no quedan)."""
+        for section in self._sections:
+            with stage("build_elements"):
+                flowables = self._build_section(section)
+            if flowables:
+                return flowables
+        return None
+
+    def wrap(self, availWidth: float, availHeight: float) -> tuple[float, float]:
+        return 0, 0
+
+    def draw(self) -> None:
+        pass
+
+
+class SectionFeedDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate que expande los SectionFeed al llegar a ellos."""
+
+    def handle_flowable(self, flowables: list[Flowable]) -> None:
+        feed = flowables[0]
+        if not isinstance(feed, SectionFeed):
+            return super().handle_flowable(flowables)
+
+        del flowables[0]
+        following = feed.next_flowables()
+        if following is not None:
+            following.append(feed)
+            flowables[0:0] = following
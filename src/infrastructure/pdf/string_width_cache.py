@@ -0,0 +1,170 @@
+"""
+String Width Cache
+==================
+
+Memoización de `stringWidth` para el layout de Platypus.
+
+Problema:
+- El corte de líneas de Paragraph y el auto-ancho de Table miden cada
+  palabra con `pdfmetrics.stringWidth`. Sin la extensión C
+  `_rl_accel` esa medición es Python puro, carácter por carácter
+  (~4µs por palabra), y domina los perfiles del layout
+- Los documentos usan siempre las mismas fuentes estándar (Times-Roman,
+  Times-Bold, Helvetica) y casi las mismas palabras (el texto de las
+  cláusulas) en cada request
+
+Solución:
+- Un dict por proceso con clave (texto, fuente, tamaño) y el ancho
+  medido como valor (~0.2µs por consulta)
+- `install_string_width_cache` reemplaza `stringWidth` en pdfmetrics
+  y en los módulos que lo importaron por nombre (paragraph, tables,
+  etc.); los que se importen después ya toman el reemplazo.
+  `uninstall_string_width_cache` restaura el original
+- Se instala una sola vez por proceso, al arrancar y según
+  `Settings.pdf_string_width_cache_entries` (container y procesos
+  hijos del pool); los generadores no la tocan
+
+Decisiones técnicas:
+- Memoria acotada: solo se cachean textos cortos (palabras, no líneas
+  enteras) y al llegar a `max_entries` el dict se vacía entero, sin
+  contabilidad de LRU en el camino caliente
+- Thread-safe sin lock en las lecturas: get/set de un dict son
+  atómicos con el GIL y los anchos son floats inmutables; solo el
+  vaciado toma un lock. Por lo mismo, los contadores de hits/misses
+  son aproximados bajo concurrencia
+- El ancho solo depende de (texto, fuente, tamaño) mientras no se
+  registre otra fuente con el mismo nombre; si eso pasa, `clear()`
+- El resultado es el mismo que el de `stringWidth`: los PDFs no
+  cambian
+"""
+
+import sys
+import threading
+
+from reportlab.pdfbase import pdfmetrics
+
+
+# stringWidth original de ReportLab (antes de cualquier reemplazo)
+_reportlab_string_width = pdfmetrics.stringWidth
+
+# Módulos que importan `stringWidth` por nombre (se parchean si ya
+# están cargados)
+PATCHED_MODULES = (
+    "reportlab.pdfbase.pdfmetrics",
+    "reportlab.platypus.paragraph",
+    "reportlab.platypus.tables",
+    "reportlab.platypus.flowables",
+    "reportlab.platypus.xpreformatted",
+    "reportlab.lib.textsplit",
+    "src.infrastructure.pdf.paged_table",
+    "src.infrastructure.pdf.canvas_generator",
+)
+
+
+class StringWidthCache:
+    """
+    Anchos de texto memoizados por (texto, fuente, tamaño).
+
+    Ejemplo:
+        >>> cache = StringWidthCache(max_entries=8192)
+        >>> install_string_width_cache(cache)
+        >>> pdfmetrics.stringWidth("cláusula", "Times-Roman", 10)
+    """
+
+    def __init__(self, max_entries: int = 8192, max_text_length: int = 48) -> None:
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries: Máximo de anchos cacheados (al llegar se vacía)
+            max_text_length: Textos más largos se miden sin cachear
+        """
+        self._max_entries = max_entries
+        self._max_text_length = max_text_length
+        self._widths: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._resets = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Máximo de anchos cacheados."""
+        return self._max_entries
+
+    def string_width(self, text, fontName: str, fontSize: float, encoding: str = "utf8") -> float:
+        """Misma firma y resultado que `pdfmetrics.stringWidth`."""
+        if encoding != "utf8" or len(text) > self._max_text_length:
+            return _reportlab_string_width(text, fontName, fontSize, encoding)
+
+        key = (text, fontName, fontSize)
+        width = self._widths.get(key)
+        if width is not None:
+            self._hits += 1
+            return width
+
+        self._misses += 1
+        width = _reportlab_string_width(text, fontName, fontSize)
+        if len(self._widths) >= self._max_entries:
+            with self._lock:
+                if len(self._widths) >= self._max_entries:
+                    self._widths.clear()
+                    self._resets += 1
+        self._widths[key] = width
+        return width
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._widths.clear()
+            self._hits = 0
+            self._misses = 0
+            self._resets = 0
+
+    def stats(self) -> dict:
+        """Estadísticas de uso de la caché (aproximadas, ver docstring del módulo)."""
+        hits, misses = self._hits, self._misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "resets": self._resets,
+            "entries": len(self._widths),
+            "max_entries": self._max_entries,
+        }
+
+
+_installed: StringWidthCache | None = None
+_install_lock = threading.Lock()
+
+
+def install_string_width_cache(cache: StringWidthCache) -> None:
+    """
+    Hace que el layout de ReportLab mida con `cache`.
+
+    Hay un único `stringWidth` por proceso: instalar otra caché
+    reemplaza a la anterior. Se instala una vez al arrancar (ver
+    container y process_pool_generator).
+    """
+    _replace_string_width(cache.string_width, cache)
+
+
+def uninstall_string_width_cache() -> None:
+    """Restaura el `stringWidth` original de ReportLab (idempotente)."""
+    _replace_string_width(_reportlab_string_width, None)
+
+
+def installed_string_width_cache() -> StringWidthCache | None:
+    """Caché instalada en el proceso (None si se mide sin cachear)."""
+    return _installed
+
+
+def _replace_string_width(replacement, cache: StringWidthCache | None) -> None:
+    global _installed
+    with _install_lock:
+        for name in PATCHED_MODULES:
+            module = sys.modules.get(name)
+            if module is not None and hasattr(module, "stringWidth"):
+                module.stringWidth = replacement
+        _installed = cache
@@ -0,0 +1,292 @@
+"""
+Stylesheet Registry
+===================
+
+Hojas de estilo compiladas, compartidas por todo el proceso.
+
+Problema:
+- `ReportLabGenerator._create_styles` era un `lru_cache` sobre un
+  método: la clave incluía `self` (cada generador tenía sus propias
+  entradas y la caché lo mantenía vivo) y cada miss llamaba a
+  `getSampleStyleSheet()`, que arma ~20 estilos para usar 3 como padre
+- Los ParagraphStyle de un generador y los de otro eran objetos
+  distintos, así que la caché de plantillas (template_cache, que usa
+  el estilo como parte de la clave) no se compartía entre ellos
+
+Solución:
+- Un registro del proceso, con clave el `PDFStyle` internado: dos
+  estilos iguales por valor comparten la misma instancia canónica y la
+  misma hoja compilada
+- Cada hoja arma sus ParagraphStyle y TableStyle una sola vez, con la
+  familia, los tamaños y los colores del PDFStyle, a partir de una
+  única hoja base de ReportLab
+- Los presets (`default`, `minimal`, `professional`, `institutional`)
+  se compilan al arrancar (warm-up y procesos hijos del pool)
+
+Decisiones técnicas:
+- LRU acotada: los estilos personalizados llegan del request
+  (/pdf/generate) y no pueden crecer la memoria sin límite. Los
+  presets no se desalojan
+- Los comprobantes usan `PDFStyle.institutional()` (Times, negro,
+  14/10pt), el look de las plantillas
+- Las hojas compiladas son de solo lectura; Table y Paragraph copian
+  lo que necesitan de ellas
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import TableStyle
+
+from src.domain.value_objects import FontFamily, PDFStyle
+from src.infrastructure.pdf.flowables import data_table_style, signature_table_style
+
+
+# Presets que se compilan al arrancar y nunca se desalojan
+PRESETS = {
+    "default": PDFStyle.default,
+    "minimal": PDFStyle.minimal,
+    "professional": PDFStyle.professional,
+    "institutional": PDFStyle.institutional,
+}
+
+
+@dataclass(frozen=True)
+class CompiledStylesheet:
+    """
+    Estilos de ReportLab de un PDFStyle, ya construidos.
+
+    Se indexa como el dict que retornaba `_create_styles`:
+    `sheet["body"]` es el ParagraphStyle del cuerpo.
+
+    Atributos:
+        style: PDFStyle (internado) del que se compiló
+        paragraphs: ParagraphStyle por nombre (title, heading, body,
+                    subtitle, footer)
+        tables: TableStyle por nombre (data, signature)
+        table_font: Fuente de las tablas
+        table_font_size: Tamaño de fuente de las tablas
+    """
+    style: PDFStyle
+    paragraphs: Mapping[str, ParagraphStyle]
+    tables: Mapping[str, TableStyle]
+    table_font: str
+    table_font_size: float
+
+    def __getitem__(self, name: str) -> ParagraphStyle:
+        return self.paragraphs[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.paragraphs
+
+
+# Variante negrita de cada familia estándar
+BOLD_FONTS = {
+    FontFamily.HELVETICA: "Helvetica-Bold",
+    FontFamily.TIMES: "Times-Bold",
+    FontFamily.COURIER: "Courier-Bold",
+}
+
+# Leading de títulos, encabezados y textos chicos (el cuerpo usa
+# el line_height del PDFStyle)
+HEADING_LINE_HEIGHT = 1.2
+
+_base_styles = None
+_base_lock = threading.Lock()
+
+
+def _base_stylesheet():
+    """Hoja de ejemplo de ReportLab (padre de los estilos), creada una vez."""
+    global _base_styles
+    if _base_styles is None:
+        with _base_lock:
+            if _base_styles is None:
+                _base_styles = getSampleStyleSheet()
+    return _base_styles
+
+
+def compile_stylesheet(style: PDFStyle) -> CompiledStylesheet:
+    """
+    Construye los estilos de Paragraph y de tablas de un PDFStyle.
+
+    Títulos y encabezados usan la variante negrita de la familia y el
+    color primario; el cuerpo y las tablas, el color de texto; el
+    subtítulo y el footer, el color secundario.
+    """
+    base_styles = _base_stylesheet()
+    fonts = style.fonts
+    family = FontFamily(fonts.family)
+    regular = family.value
+    bold = BOLD_FONTS[family]
+    primary = colors.HexColor(style.colors.primary)
+    secondary = colors.HexColor(style.colors.secondary)
+    text = colors.HexColor(style.colors.text)
+    subtitle_size = (fonts.size_body + fonts.size_small) / 2
+
+    paragraphs = {
+        "title": ParagraphStyle(
+            "CustomTitle",
+            parent=base_styles["Heading1"],
+            fontName=bold,
+            fontSize=fonts.size_title,
+            textColor=primary,
+            alignment=TA_CENTER,
+            spaceAfter=6,
+            leading=fonts.size_title * HEADING_LINE_HEIGHT,
+        ),
+        "heading": ParagraphStyle(
+            "CustomHeading",
+            parent=base_styles["Heading2"],
+            fontName=bold,
+            fontSize=fonts.size_heading,
+            textColor=primary,
+            alignment=TA_LEFT,
+            spaceBefore=8,
+            spaceAfter=4,
+            leading=fonts.size_heading * HEADING_LINE_HEIGHT,
+        ),
+        "body": ParagraphStyle(
+            "CustomBody",
+            parent=base_styles["Normal"],
+            fontName=regular,
+            fontSize=fonts.size_body,
+            textColor=text,
+            leading=fonts.size_body * fonts.line_height,
+            alignment=TA_JUSTIFY,  # Justificado para cláusulas
+        ),
+        "subtitle": ParagraphStyle(
+            "Subtitle",
+            parent=base_styles["Normal"],
+            fontName=regular,
+            fontSize=subtitle_size,
+            textColor=secondary,
+            alignment=TA_CENTER,
+            spaceAfter=8,
+            leading=subtitle_size * HEADING_LINE_HEIGHT,
+        ),
+        "footer": ParagraphStyle(
+            "Footer",
+            parent=base_styles["Normal"],
+            fontName=regular,
+            fontSize=fonts.size_small,
+            textColor=secondary,
+            alignment=TA_LEFT,
+            leading=fonts.size_small * HEADING_LINE_HEIGHT,
+        ),
+    }
+
+    tables = {
+        "data": data_table_style(regular, fonts.size_body, text),
+        "signature": signature_table_style(regular, fonts.size_body, text),
+    }
+
+    return CompiledStylesheet(
+        style=style,
+        paragraphs=MappingProxyType(paragraphs),
+        tables=MappingProxyType(tables),
+        table_font=regular,
+        table_font_size=fonts.size_body,
+    )
+
+
+class StylesheetRegistry:
+    """
+    Registro thread-safe de hojas compiladas por PDFStyle internado.
+
+    Ejemplo:
+        >>> registry = StylesheetRegistry(max_entries=32)
+        >>> sheet = registry.get(PDFStyle.institutional())
+        >>> sheet["body"].fontName
+        'Times-Roman'
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        """
+        Inicializa el registro.
+
+        Args:
+            max_entries: Máximo de hojas de estilos personalizados (los
+                         presets no cuentan)
+        """
+        self._max_entries = max_entries
+        self._presets: dict[PDFStyle, CompiledStylesheet] = {}
+        self._custom: OrderedDict[PDFStyle, CompiledStylesheet] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, style: PDFStyle) -> CompiledStylesheet:
+        """Hoja compilada del estilo (la compila en el primer uso)."""
+        with self._lock:
+            sheet = self._presets.get(style)
+            if sheet is None:
+                sheet = self._custom.get(style)
+                if sheet is not None:
+                    self._custom.move_to_end(style)
+            if sheet is not None:
+                self._hits += 1
+                return sheet
+            self._misses += 1
+
+        # Se compila fuera del lock; si dos threads compilan el mismo
+        # estilo, queda la primera hoja registrada
+        compiled = compile_stylesheet(style)
+        with self._lock:
+            sheet = self._presets.get(style) or self._custom.get(style)
+            if sheet is not None:
+                return sheet
+            self._custom[style] = compiled
+            while len(self._custom) > self._max_entries:
+                self._custom.popitem(last=False)
+                self._evictions += 1
+            return compiled
+
+    def intern(self, style: PDFStyle) -> PDFStyle:
+        """Instancia canónica de un estilo (la de su hoja compilada)."""
+        return self.get(style).style
+
+    def precompile_presets(self) -> None:
+        """Compila los presets (idempotente)."""
+        for factory in PRESETS.values():
+            style = factory()
+            with self._lock:
+                if style in self._presets:
+                    continue
+                sheet = self._custom.pop(style, None)
+            sheet = sheet or compile_stylesheet(style)
+            with self._lock:
+                self._presets.setdefault(style, sheet)
+
+    def clear(self) -> None:
+        """Descarta todas las hojas (presets incluidos) y las estadísticas."""
+        with self._lock:
+            self._presets.clear()
+            self._custom.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        """Estadísticas de uso del registro."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / total if total else 0.0,
+                "evictions": self._evictions,
+                "presets": len(self._presets),
+                "custom_entries": len(self._custom),
+                "max_entries": self._max_entries,
+            }
+
+
+# Registro del proceso (lo usan todos los generadores)
+stylesheet_registry = StylesheetRegistry()
@@ -0,0 +1,178 @@
+"""
+Template Layout Cache
+=====================
+
+Caché de la "capa estática" de las plantillas de documentos.
+
+Problema:
+- Cada contrato repite el mismo texto de plantilla: encabezados de
+  cláusulas, cláusulas completas sin datos variables, rótulos de
+  firmas. Aun así, cada request vuelve a parsear su markup
+  (`ParaParser`) y a calcular el corte de líneas (`breakLines`)
+
+Solución:
+- Los fragmentos parseados se cachean por (texto, estilo) y el corte
+  de líneas por (texto, estilo, ancho). Un texto de plantilla se
+  procesa una vez por proceso; los párrafos con datos del request
+  entran a la caché pero la LRU los desaloja enseguida
+- Cambiar la plantilla (TEMPLATE_VERSION) cambia el texto y por lo
+  tanto la clave: no hace falta invalidar nada
+
+Decisiones técnicas:
+- Los fragmentos y líneas cacheados se tratan como solo lectura y se
+  comparten entre threads. Si Platypus necesita partir un párrafo
+  (`split`), se recalculan las líneas para no tocar las compartidas
+- El resultado es byte a byte igual al de un Paragraph normal
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+
+class TemplateLayoutCache:
+    """
+    LRU thread-safe de fragmentos y cortes de línea de párrafos.
+
+    Ejemplo:
+        >>> cache = TemplateLayoutCache(max_entries=512)
+        >>> para = TemplateParagraph("<b>PRIMERA</b>", style, layout_cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries: Máximo de entradas por tipo (fragmentos y líneas)
+        """
+        self._max_entries = max_entries
+        self._frags: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lines: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Máximo de entradas por tipo."""
+        return self._max_entries
+
+    def get_frags(self, key: Hashable) -> Any:
+        """Retorna los fragmentos parseados o None."""
+        return self._get(self._frags, key)
+
+    def put_frags(self, key: Hashable, frags: Any) -> None:
+        """Guarda los fragmentos parseados de un texto."""
+        self._put(self._frags, key, frags)
+
+    def get_lines(self, key: Hashable) -> Any:
+        """Retorna el corte de líneas o None."""
+        return self._get(self._lines, key)
+
+    def put_lines(self, key: Hashable, lines: Any) -> None:
+        """Guarda el corte de líneas de un texto para un ancho dado."""
+        self._put(self._lines, key, lines)
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._frags.clear()
+            self._lines.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict:
+        """Estadísticas de uso de la caché."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / total if total else 0.0,
+                "frags_entries": len(self._frags),
+                "lines_entries": len(self._lines),
+                "max_entries": self._max_entries,
+            }
+
+    def _get(self, store: OrderedDict, key: Hashable) -> Any:
+        with self._lock:
+            value = store.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            store.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _put(self, store: OrderedDict, key: Hashable, value: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            store[key] = value
+            store.move_to_end(key)
+            while len(store) > self._max_entries:
+                store.popitem(last=False)
+
+
+class TemplateParagraph(Paragraph):
+    """
+    Paragraph que reutiliza el parseo y el corte de líneas cacheados.
+
+    Mantiene la firma de Paragraph: `split` crea instancias de la
+    misma clase con `frags` ya calculados, que no usan la caché.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        style: ParagraphStyle | None = None,
+        bulletText: str | None = None,
+        frags: list | None = None,
+        caseSensitive: int = 1,
+        encoding: str = "utf8",
+        layout_cache: TemplateLayoutCache | None = None,
+    ) -> None:
+        # Fragmentos ya dados (partes de un split) o sin caché: Paragraph normal
+        if frags is not None or layout_cache is None or bulletText is not None:
+            self._layout_cache = None
+            super().__init__(text, style, bulletText, frags, caseSensitive, encoding)
+            return
+
+        self._layout_cache = layout_cache
+        self._cache_text = text
+        key = (text, style)
+        cached = layout_cache.get_frags(key)
+        if cached is None:
+            super().__init__(text, style, None, None, caseSensitive, encoding)
+            # Un <bullet> en el markup no se puede reconstruir desde frags
+            if self.bulletText is None:
+                layout_cache.put_frags(key, (self.text, self.style, self.frags))
+        else:
+            # El parser puede devolver un estilo derivado (atributos de <para>)
+            clean_text, parsed_style, cached_frags = cached
+            super().__init__(clean_text, parsed_style, None, cached_frags, caseSensitive, encoding)
+
+    def wrap(self, availWidth, availHeight):
+        if self._layout_cache is None:
+            return super().wrap(availWidth, availHeight)
+
+        key = (self._cache_text, self.style, availWidth)
+        cached = self._layout_cache.get_lines(key)
+        if cached is None:
+            width, height = super().wrap(availWidth, availHeight)
+            self._layout_cache.put_lines(key, (self.blPara, self._wrapWidths, height))
+            return width, height
+
+        self.width = availWidth
+        self.blPara, self._wrapWidths, self.height = cached
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        # El split trabaja sobre sus propias líneas, no sobre las compartidas
+        if self._layout_cache is not None and hasattr(self, "_wrapWidths"):
+            self.blPara = self.breakLines(self._wrapWidths)
+        return super().split(availWidth, availHeight)
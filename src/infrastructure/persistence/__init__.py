@@ -2,5 +2,9 @@
 # Infrastructure Persistence
 # ================================
 # Repositorios para persistencia de datos.
-# Actualmente vacío - se implementará cuando sea necesario.
+# - SQLiteJobRepository: jobs de render asíncronos (POST /jobs)
 # ================================
+
+from .sqlite_job_repository import SQLiteJobRepository
+
+__all__ = ["SQLiteJobRepository"]
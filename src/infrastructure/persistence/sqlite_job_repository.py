@@ -0,0 +1,284 @@
+"""
+SQLite Job Repository
+=====================
+
+Implementación de IJobRepository sobre SQLite (módulo `sqlite3` de
+la biblioteca estándar, sin dependencias nuevas).
+
+Decisiones técnicas:
+- Un archivo local por instancia del servicio: los jobs pendientes
+  sobreviven a un reinicio del proceso o del contenedor (si el
+  archivo está en un volumen)
+- Modo WAL + synchronous=NORMAL: las lecturas de estado no bloquean
+  a los workers que escriben y cada commit no paga un fsync completo
+- Una conexión compartida protegida por un lock: las operaciones son
+  cortas (una fila) y así no hay que gestionar un pool
+- El PDF se guarda como BLOB en la misma fila; `get` no lo lee para
+  que consultar el estado sea barato
+- `claim` es un UPDATE condicional: con varios procesos sobre el mismo
+  archivo (workers de gunicorn) cada job lo toma uno solo. Guarda el
+  PID del proceso que lo toma y cuándo
+- `requeue_running` solo devuelve a la cola los jobs cuyo dueño murió
+  o cuyo lease venció: un worker que arranca no le quita los jobs a
+  un hermano vivo. El propio PID cuenta como muerto (el pool anterior
+  de este proceso ya no corre) y el lease cubre los PIDs reusados
+  tras reiniciar el contenedor
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities import JobStatus, RenderJob
+from src.domain.interfaces import IJobRepository
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS render_jobs (
+    id TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    filename TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    owner_pid INTEGER,
+    claimed_at TEXT,
+    result BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_render_jobs_status
+    ON render_jobs (status, created_at);
+"""
+
+# Columnas agregadas después de la primera versión del esquema
+_MIGRATIONS = {
+    "owner_pid": "ALTER TABLE render_jobs ADD COLUMN owner_pid INTEGER",
+    "claimed_at": "ALTER TABLE render_jobs ADD COLUMN claimed_at TEXT",
+}
+
+_COLUMNS = "id, tipo, payload, status, attempts, filename, error, created_at, updated_at"
+
+
+class SQLiteJobRepository(IJobRepository):
+    """
+    Repositorio de jobs de render en un archivo SQLite.
+
+    Ejemplo:
+        >>> repository = SQLiteJobRepository("/tmp/pdf_exports/jobs.db")
+        >>> repository.save(RenderJob(tipo="comprobante_postulacion", payload={...}))
+        >>> repository.pending_ids()
+        ['3f2a...']
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Abre (o crea) la base de datos.
+
+        Args:
+            path: Ruta del archivo SQLite (":memory:" para tests)
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    @property
+    def path(self) -> str:
+        """Ruta del archivo SQLite."""
+        return self._path
+
+    def save(self, job: RenderJob) -> None:
+        """Crea o actualiza un job (sin tocar su resultado)."""
+        with self._lock:
+            self._conn.execute(
+                f"""
+                INSERT INTO render_jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = excluded.attempts,
+                    filename = excluded.filename,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                self._to_row(job),
+            )
+
+    def get(self, job_id: str) -> RenderJob | None:
+        """Retorna el job o None si no existe."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM render_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def claim(self, job_id: str) -> RenderJob | None:
+        """
+        Pasa el job de PENDING a RUNNING e incrementa sus intentos.
+
+        Registra este proceso como dueño del job y el momento del claim.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE render_jobs
+                SET status = ?, attempts = attempts + 1, updated_at = ?,
+                    owner_pid = ?, claimed_at = ?
+                WHERE id = ? AND status = ?
+                """,
+                (
+                    JobStatus.RUNNING.value,
+                    now,
+                    os.getpid(),
+                    now,
+                    job_id,
+                    JobStatus.PENDING.value,
+                ),
+            )
+            if cursor.rowcount == 0:
+                return None
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM render_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._from_row(row)
+
+    def save_result(self, job: RenderJob, content: bytes) -> None:
+        """Guarda el PDF y el estado del job en una sola operación."""
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE render_jobs
+                SET status = ?, attempts = ?, filename = ?, error = ?,
+                    updated_at = ?, result = ?
+                WHERE id = ?
+                """,
+                (
+                    job.status.value,
+                    job.attempts,
+                    job.filename,
+                    json.dumps(job.error) if job.error else None,
+                    job.updated_at.isoformat(),
+                    content,
+                    job.id,
+                ),
+            )
+
+    def get_result(self, job_id: str) -> bytes | None:
+        """Retorna el PDF del job o None si no hay resultado."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM render_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bytes(row[0]) if row and row[0] is not None else None
+
+    def pending_ids(self) -> list[str]:
+        """IDs de los jobs en estado PENDING, del más antiguo al más nuevo."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM render_jobs WHERE status = ? ORDER BY created_at",
+                (JobStatus.PENDING.value,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def requeue_running(self, lease: timedelta) -> int:
+        """
+        Pasa a PENDING los jobs RUNNING abandonados.
+
+        Un job está abandonado si su dueño ya no existe, si el dueño es
+        este mismo proceso o si se tomó hace más de `lease`.
+        """
+        expired = (datetime.now(timezone.utc) - lease).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner_pid, claimed_at FROM render_jobs WHERE status = ?",
+                (JobStatus.RUNNING.value,),
+            ).fetchall()
+            stale = [
+                job_id
+                for job_id, owner_pid, claimed_at in rows
+                if claimed_at is None or claimed_at < expired or not _is_alive(owner_pid)
+            ]
+            requeued = 0
+            for job_id in stale:
+                # Condicional: el dueño pudo haber terminado el job entre medio
+                cursor = self._conn.execute(
+                    "UPDATE render_jobs SET status = ? WHERE id = ? AND status = ?",
+                    (JobStatus.PENDING.value, job_id, JobStatus.RUNNING.value),
+                )
+                requeued += cursor.rowcount
+        return requeued
+
+    def purge_finished(self, older_than: datetime) -> int:
+        """Borra los jobs terminados antes de `older_than`."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM render_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value, older_than.isoformat()),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Cierra la conexión."""
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self) -> None:
+        """Agrega las columnas que le faltan a una base creada con un esquema anterior."""
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(render_jobs)")}
+        for column, statement in _MIGRATIONS.items():
+            if column not in existing:
+                self._conn.execute(statement)
+
+    @staticmethod
+    def _to_row(job: RenderJob) -> tuple:
+        return (
+            job.id,
+            job.tipo,
+            json.dumps(job.payload, ensure_ascii=False),
+            job.status.value,
+            job.attempts,
+            job.filename,
+            json.dumps(job.error) if job.error else None,
+            job.created_at.isoformat(),
+            job.updated_at.isoformat(),
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> RenderJob:
+        id_, tipo, payload, status, attempts, filename, error, created_at, updated_at = row
+        return RenderJob(
+            id=id_,
+            tipo=tipo,
+            payload=json.loads(payload),
+            status=JobStatus(status),
+            attempts=attempts,
+            filename=filename,
+            error=json.loads(error) if error else None,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+
+def _is_alive(pid: int | None) -> bool:
+    """True si `pid` es otro proceso que sigue corriendo en esta máquina."""
+    if pid is None or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Existe pero es de otro usuario
+        return True
+    except OSError:
+        return False
+    return True
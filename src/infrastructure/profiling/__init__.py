@@ -0,0 +1,16 @@
+# ================================
+# Profiling Infrastructure
+# ================================
+# Perfilado a demanda de renders individuales y almacenamiento de
+# los perfiles en un anillo acotado en disco.
+# ================================
+
+from .profiler import ProfileResult, SamplingProfiler, run_profiled
+from .profile_store import ProfileStore
+
+__all__ = [
+    "ProfileResult",
+    "ProfileStore",
+    "SamplingProfiler",
+    "run_profiled",
+]
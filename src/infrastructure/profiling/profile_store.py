@@ -0,0 +1,141 @@
+"""
+Profile Store
+=============
+
+Anillo acotado de perfiles en disco.
+
+Cada perfil son tres archivos en el directorio del anillo:
+- `<id>.json`: metadatos (etiqueta, modo, duración, fecha, formatos)
+- `<id>.pstats`: perfil en formato pstats
+- `<id>.collapsed`: pilas en formato collapsed (flamegraph)
+
+Todo perfil se guarda en los dos formatos, sea cual sea el modo con
+que se tomó (ver profiler).
+
+Los IDs empiezan con la fecha UTC, así que el orden por nombre es el
+orden de llegada. Al guardar se borran los más viejos por encima de
+`max_profiles`. Los archivos se escriben con rename atómico: varios
+workers pueden compartir el directorio.
+"""
+
+import json
+import os
+import re
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.domain.exceptions import DocumentNotFoundError
+from src.infrastructure.profiling.profiler import ProfileResult
+
+
+# Formatos descargables: extensión → media type
+PROFILE_FORMATS = {
+    "pstats": "application/octet-stream",
+    "collapsed": "text/plain; charset=utf-8",
+}
+
+_ID_PATTERN = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+
+
+class ProfileStore:
+    """
+    Perfiles recientes en un directorio.
+
+    Ejemplo:
+        >>> store = ProfileStore("/tmp/pdf_exports/profiles", max_profiles=20)
+        >>> profile_id = store.new_id()
+        >>> store.save(profile_id, result, label="comprobante_postulacion")
+        >>> store.recent()[0]["id"] == profile_id
+        True
+    """
+
+    def __init__(self, directory: str | Path, max_profiles: int = 20) -> None:
+        """
+        Args:
+            directory: Directorio del anillo (se crea si no existe)
+            max_profiles: Perfiles conservados
+        """
+        self._directory = Path(directory)
+        self._max_profiles = max_profiles
+
+    @staticmethod
+    def new_id() -> str:
+        """ID de un perfil nuevo (ordenable por fecha)."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        return f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+    def save(self, profile_id: str, result: ProfileResult, label: str) -> dict[str, Any]:
+        """
+        Guarda un perfil y descarta los más viejos.
+
+        Returns:
+            Metadatos del perfil guardado
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._write(f"{profile_id}.pstats", result.pstats)
+        self._write(f"{profile_id}.collapsed", result.collapsed.encode("utf-8"))
+
+        metadata = {
+            "id": profile_id,
+            "label": label,
+            "mode": result.mode,
+            "duration_ms": round(result.duration * 1000, 3),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "formats": list(PROFILE_FORMATS),
+        }
+        # El .json va último: un perfil listado siempre tiene sus archivos
+        self._write(f"{profile_id}.json", json.dumps(metadata).encode("utf-8"))
+        self._prune()
+        return metadata
+
+    def recent(self) -> list[dict[str, Any]]:
+        """Metadatos de los perfiles guardados, del más nuevo al más viejo."""
+        profiles = []
+        for profile_id in reversed(self._ids()):
+            try:
+                profiles.append(json.loads((self._directory / f"{profile_id}.json").read_bytes()))
+            except (OSError, ValueError):
+                # Borrado por otro worker mientras se listaba
+                continue
+        return profiles
+
+    def path_for(self, profile_id: str, fmt: str) -> Path:
+        """
+        Archivo de un perfil en el formato pedido.
+
+        Raises:
+            DocumentNotFoundError: Si el ID o el formato no existen
+        """
+        if not _ID_PATTERN.match(profile_id) or fmt not in PROFILE_FORMATS:
+            raise DocumentNotFoundError("Perfil no encontrado", details={"profile_id": profile_id})
+        path = self._directory / f"{profile_id}.{fmt}"
+        if not path.is_file():
+            raise DocumentNotFoundError(
+                "Perfil no encontrado",
+                details={"profile_id": profile_id, "format": fmt},
+            )
+        return path
+
+    def _ids(self) -> list[str]:
+        """IDs guardados, del más viejo al más nuevo."""
+        if not self._directory.is_dir():
+            return []
+        return sorted(
+            path.stem for path in self._directory.glob("*.json") if _ID_PATTERN.match(path.stem)
+        )
+
+    def _prune(self) -> None:
+        ids = self._ids()
+        for profile_id in ids[: max(len(ids) - self._max_profiles, 0)]:
+            for extension in ("json", *PROFILE_FORMATS):
+                try:
+                    (self._directory / f"{profile_id}.{extension}").unlink()
+                except FileNotFoundError:
+                    pass
+
+    def _write(self, name: str, data: bytes) -> None:
+        tmp = self._directory / f".{name}.{uuid.uuid4().hex}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, self._directory / name)
@@ -0,0 +1,229 @@
+"""
+Render Profiler
+===============
+
+Ejecuta un render bajo un profiler y devuelve el perfil.
+
+Modos:
+- "cprofile": cProfile determinístico. Cuenta cada llamada (tiempos
+  exactos por función, overhead alto: el render tarda ~2x)
+- "sampling": un thread toma la pila del thread del render cada
+  `interval` segundos. Overhead bajo, ve dónde se pasa el tiempo de
+  pared
+
+Todo perfil se entrega en los dos formatos, derivando el que el modo
+no produce:
+- pstats (`python -m pstats`, snakeviz). En modo sampling se arma
+  con las muestras: cada muestra cuenta como una llamada y suma
+  `interval` segundos a las funciones de su pila
+- "collapsed stacks" (una línea `raíz;...;hoja N` por pila), entrada
+  de flamegraph.pl y speedscope. En modo cprofile se reconstruyen las
+  pilas desde el grafo de llamadas, repartiendo el tiempo de cada
+  función entre sus llamados en proporción a lo que le costó cada uno;
+  N son microsegundos
+
+cProfile solo perfila el thread que lo activa: `run_profiled` se llama
+desde el thread del render (dentro del RenderExecutor).
+"""
+
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+
+ProfileMode = Literal["cprofile", "sampling"]
+
+# Intervalo de muestreo por defecto (segundos)
+SAMPLE_INTERVAL = 0.005
+
+# Pilas reconstruidas desde cProfile: profundidad máxima y peso mínimo
+# (microsegundos) de una pila para aparecer en el collapsed
+MAX_STACK_DEPTH = 128
+MIN_STACK_WEIGHT_US = 1
+
+# Clave de función de pstats: (archivo, línea de la definición, nombre)
+FunctionKey = tuple[str, int, str]
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Perfil de un render."""
+    mode: str
+    duration: float
+    pstats: bytes
+    collapsed: str
+
+
+class SamplingProfiler:
+    """
+    Profiler por muestreo de un único thread.
+
+    Ejemplo:
+        >>> sampler = SamplingProfiler(threading.get_ident())
+        >>> sampler.start()
+        >>> render()
+        >>> sampler.stop()
+        >>> print(sampler.collapsed())
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        # Pila (raíz → hoja) de (función, línea en ejecución) → muestras
+        self._stacks: Counter[tuple[tuple[FunctionKey, int], ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="pdf-profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Pilas muestreadas en formato collapsed (`raíz;...;hoja N`)."""
+        stacks: Counter[str] = Counter()
+        for stack, count in self._stacks.items():
+            stacks[";".join(_frame_label(function, line) for function, line in stack)] += count
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+    def pstats(self) -> bytes:
+        """Muestras como perfil pstats (marshal), ver docstring del módulo."""
+        stats: dict[FunctionKey, list] = {}
+        for stack, count in self._stacks.items():
+            seconds = count * self._interval
+            functions = [function for function, _ in stack]
+            for function in set(functions):
+                entry = stats.setdefault(function, [0, 0, 0.0, 0.0, {}])
+                entry[0] += count
+                entry[1] += count
+                entry[3] += seconds
+            stats[functions[-1]][2] += seconds
+            for caller, callee in set(zip(functions, functions[1:])):
+                edge = stats[callee][4].setdefault(caller, [0, 0, 0.0, 0.0])
+                edge[0] += count
+                edge[1] += count
+                edge[3] += seconds
+                if callee == functions[-1]:
+                    edge[2] += seconds
+        return marshal.dumps({
+            function: (cc, nc, tt, ct, {caller: tuple(edge) for caller, edge in callers.items()})
+            for function, (cc, nc, tt, ct, callers) in stats.items()
+        })
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(((code.co_filename, code.co_firstlineno, code.co_name), frame.f_lineno))
+                frame = frame.f_back
+            self._stacks[tuple(reversed(stack))] += 1
+
+
+def collapsed_from_stats(stats: dict) -> str:
+    """
+    Pilas collapsed a partir del grafo de llamadas de cProfile.
+
+    Recorre el grafo desde las funciones sin llamador: en cada nodo el
+    tiempo que llega por esa pila se reparte entre el tiempo propio de
+    la función y sus llamados, en proporción a sus tiempos en pstats.
+    Las recursiones se cortan en la primera repetición.
+
+    Args:
+        stats: `Profile.stats` (o el dict cargado de un .pstats)
+
+    Returns:
+        Texto collapsed con pesos en microsegundos
+    """
+    callees: dict[FunctionKey, list[tuple[FunctionKey, float]]] = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((function, edge[3]))
+
+    weights: Counter[str] = Counter()
+
+    def walk(function: FunctionKey, seconds: float, path: tuple[FunctionKey, ...]) -> None:
+        _, _, own, total, _ = stats[function]
+        if total <= 0:
+            return
+        path = path + (function,)
+        stack = ";".join(_frame_label(f, f[1]) for f in path)
+        weights[stack] += seconds * own / total * 1_000_000
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_seconds in callees.get(function, ()):
+            share = seconds * edge_seconds / total
+            if callee not in path and callee in stats and share * 1_000_000 >= MIN_STACK_WEIGHT_US:
+                walk(callee, share, path)
+
+    for function, (_, _, _, total, callers) in stats.items():
+        if not callers:
+            walk(function, total, ())
+
+    return "".join(
+        f"{stack} {round(weight)}\n"
+        for stack, weight in weights.most_common()
+        if weight >= MIN_STACK_WEIGHT_US
+    )
+
+
+def _frame_label(function: FunctionKey, line: int) -> str:
+    """Nombre de un frame en las pilas collapsed: `función (archivo:línea)`."""
+    filename, _, name = function
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def run_profiled(
+    fn: Callable[..., Any],
+    *args: Any,
+    mode: ProfileMode = "cprofile",
+    interval: float = SAMPLE_INTERVAL,
+) -> tuple[Any, ProfileResult]:
+    """
+    Ejecuta `fn(*args)` bajo el profiler elegido.
+
+    Si `fn` falla la excepción se propaga (el perfil se descarta).
+
+    Returns:
+        (resultado de fn, perfil)
+    """
+    start = time.perf_counter()
+    if mode == "sampling":
+        sampler = SamplingProfiler(threading.get_ident(), interval)
+        sampler.start()
+        try:
+            result = fn(*args)
+        finally:
+            sampler.stop()
+        return result, ProfileResult(
+            mode=mode,
+            duration=time.perf_counter() - start,
+            pstats=sampler.pstats(),
+            collapsed=sampler.collapsed(),
+        )
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = fn(*args)
+    finally:
+        profiler.disable()
+    duration = time.perf_counter() - start
+    profiler.create_stats()
+    return result, ProfileResult(
+        mode=mode,
+        duration=duration,
+        pstats=marshal.dumps(profiler.stats),
+        collapsed=collapsed_from_stats(profiler.stats),
+    )
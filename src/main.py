@@ -12,17 +12,29 @@ Este archivo:
 5. Configura la documentación OpenAPI
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from src.domain.exceptions import DomainException
 from src.infrastructure.config import get_settings
+from src.infrastructure.metrics import metrics_payload, observe_rate_limited
+from src.presentation.api.v1 import admin_router as v1_admin_router
+from src.presentation.api.v1 import jobs_router as v1_jobs_router
 from src.presentation.api.v1 import router as v1_router
+from src.presentation.middleware import StageTimingMiddleware
+from src.presentation.dependencies.container import (
+    shutdown_pdf_generator,
+    shutdown_render_executor,
+    start_job_worker_pool,
+    stop_job_worker_pool,
+)
+from src.presentation.warmup import WarmUpState, run_warm_up
 
 
 # ================================
@@ -34,7 +46,8 @@ async def lifespan(app: FastAPI):
     """
     Maneja el ciclo de vida de la aplicación.
     
-    - startup: inicialización de recursos
+    - startup: inicialización de recursos y warm-up en segundo plano
+      (GET /ready responde 503 hasta que termina)
     - shutdown: limpieza de recursos
     """
     # Startup
@@ -42,11 +55,26 @@ async def lifespan(app: FastAPI):
     print(f"[*] Starting {settings.app_name} v{settings.app_version}")
     print(f"[*] Environment: {settings.app_env}")
     print(f"[*] Debug: {settings.debug}")
+    print(f"[*] PDF backend: {settings.pdf_backend}")
+    
+    # Warm-up: pool de procesos, fuentes, estilos, logo y validadores
+    # con renders sintéticos; /ready queda en 503 hasta que termina
+    warm_up_task = None
+    if settings.pdf_warmup_enabled:
+        warm_up_task = asyncio.create_task(run_warm_up(app.state.warmup))
+    
+    # Workers de jobs asíncronos (retoman los pendientes de la base)
+    await start_job_worker_pool()
     
     yield  # Aplicación corriendo
     
     # Shutdown
     print("[*] Shutting down...")
+    if warm_up_task is not None and not warm_up_task.done():
+        warm_up_task.cancel()
+    await stop_job_worker_pool()
+    shutdown_render_executor()
+    shutdown_pdf_generator()
 
 
 # ================================
@@ -92,6 +120,9 @@ Este microservicio implementa Clean Architecture:
         lifespan=lifespan,
     )
     
+    # Readiness: lista de entrada solo si no hay warm-up
+    app.state.warmup = WarmUpState(ready=not settings.pdf_warmup_enabled)
+    
     # ================================
     # Middlewares
     # ================================
@@ -105,6 +136,11 @@ Este microservicio implementa Clean Architecture:
         allow_headers=["*"],
     )
     
+    # Tiempos por etapa (Server-Timing); se registra último para envolver
+    # también a CORS y medir el request completo
+    if settings.pdf_stage_timing:
+        app.add_middleware(StageTimingMiddleware)
+    
     # ================================
     # Exception Handlers
     # ================================
@@ -125,13 +161,24 @@ Este microservicio implementa Clean Architecture:
         status_map = {
             "DOCUMENT_NOT_FOUND": 404,
             "PDF_GENERATION_ERROR": 500,
+            "SERVICE_OVERLOADED": 503,
+            "JOB_NOT_READY": 409,
+            "PAYLOAD_TOO_LARGE": 413,
+            "FORBIDDEN": 403,
         }
         
         status_code = status_map.get(exc.code, 400)
         
+        # Los errores de capacidad indican cuándo reintentar
+        headers = None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            headers = {"Retry-After": str(retry_after)}
+        
         return JSONResponse(
             status_code=status_code,
             content=exc.to_dict(),
+            headers=headers,
         )
     
     @app.exception_handler(RateLimitExceeded)
@@ -144,6 +191,10 @@ Este microservicio implementa Clean Architecture:
         
         Retorna HTTP 429 cuando se excede el límite de requests.
         """
+        # Por función del endpoint (como cuenta slowapi los límites): no
+        # depende de los parámetros de la URL, así las series quedan acotadas
+        endpoint = request.scope.get("endpoint")
+        observe_rate_limited(getattr(endpoint, "__name__", request.url.path))
         return JSONResponse(
             status_code=429,
             content={
@@ -158,6 +209,8 @@ Este microservicio implementa Clean Architecture:
     
     # API v1
     app.include_router(v1_router, prefix="/api/v1")
+    app.include_router(v1_jobs_router, prefix="/api/v1")
+    app.include_router(v1_admin_router, prefix="/api/v1")
     
     # ================================
     # Root Endpoints
@@ -182,6 +235,27 @@ Este microservicio implementa Clean Architecture:
             "version": settings.app_version,
         }
     
+    @app.get("/ready", tags=["Health"])
+    async def ready():
+        """
+        Readiness del proceso (para el balanceador).
+        
+        503 mientras corre el warm-up; 200 cuando el proceso ya
+        renderizó los documentos sintéticos.
+        """
+        warmup = app.state.warmup
+        return JSONResponse(
+            status_code=200 if warmup.ready else 503,
+            content={"ready": warmup.ready, "warmup": warmup.to_dict()},
+        )
+    
+    if settings.pdf_metrics_enabled:
+        @app.get("/metrics", tags=["Health"], include_in_schema=False)
+        async def metrics():
+            """Métricas en formato Prometheus (agregadas entre workers, ver prometheus.py)."""
+            content, media_type = metrics_payload()
+            return Response(content=content, media_type=media_type)
+    
     return app
 
 
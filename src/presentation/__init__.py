@@ -9,4 +9,6 @@
 # - api: Endpoints REST
 # - schemas: Validación de requests/responses
 # - dependencies: Contenedor de inyección de dependencias
+# - middleware: Middlewares ASGI (tiempos por etapa)
+# - warmup: Calentamiento del proceso antes de recibir tráfico
 # ================================
@@ -6,5 +6,7 @@
 # ================================
 
 from .router import router
+from .jobs_router import router as jobs_router
+from .admin_router import router as admin_router
 
-__all__ = ["router"]
+__all__ = ["router", "jobs_router", "admin_router"]
@@ -0,0 +1,100 @@
+"""
+API v1 Admin Router
+===================
+
+Endpoints de administración, protegidos por `Settings.pdf_admin_token`
+(header `X-Admin-Token`). Sin token configurado responden 403.
+
+- GET /admin/profiles → perfiles de render recientes
+- GET /admin/profiles/{id}/{formato} → descarga (pstats | collapsed)
+
+Ver profiling.py para cómo se generan los perfiles.
+"""
+
+import hmac
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import FileResponse
+
+from src.domain.exceptions import ForbiddenError
+from src.infrastructure.config import get_settings
+from src.infrastructure.profiling.profile_store import PROFILE_FORMATS
+from src.presentation.api.v1.router import limiter
+from src.presentation.dependencies.container import get_profile_store
+
+
+def require_admin_token(x_admin_token: str | None = Header(default=None)) -> None:
+    """Valida el header X-Admin-Token contra el token configurado."""
+    expected = get_settings().pdf_admin_token
+    if not expected:
+        raise ForbiddenError("Endpoints de administración deshabilitados (PDF_ADMIN_TOKEN vacío)")
+    # Como bytes: compare_digest rechaza (TypeError) los str no ASCII
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise ForbiddenError("Token de administración inválido")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+# ================================
+# Endpoints
+# ================================
+
+
+@router.get(
+    "/profiles",
+    summary="Perfiles de Render Recientes",
+    responses={403: {"description": "Token de administración inválido o no configurado"}},
+)
+@limiter.limit("60/minute")
+async def listar_perfiles(request: Request, store=Depends(get_profile_store)):
+    """
+    Lista los perfiles guardados, del más nuevo al más viejo.
+
+    Returns:
+        Si el perfilado está habilitado y los metadatos de cada perfil
+        (con la URL de descarga de cada formato)
+    """
+    profiles = store.recent()
+    for profile in profiles:
+        profile["downloads"] = {
+            fmt: str(request.url_for("descargar_perfil", profile_id=profile["id"], fmt=fmt))
+            for fmt in profile["formats"]
+        }
+    return {
+        "enabled": get_settings().pdf_profiling_enabled,
+        "profiles": profiles,
+    }
+
+
+@router.get(
+    "/profiles/{profile_id}/{fmt}",
+    response_class=FileResponse,
+    summary="Descargar un Perfil",
+    responses={
+        403: {"description": "Token de administración inválido o no configurado"},
+        404: {"description": "Perfil o formato inexistente"},
+    },
+)
+@limiter.limit("60/minute")
+async def descargar_perfil(
+    request: Request,
+    profile_id: str,
+    fmt: str,
+    store=Depends(get_profile_store),
+):
+    """
+    Descarga un perfil en formato pstats o collapsed (flamegraph).
+
+    Todos los perfiles están en los dos formatos, sin importar el modo
+    (cprofile o sampling) con que se tomaron.
+
+    Returns:
+        El archivo del perfil
+    """
+    path = store.path_for(profile_id, fmt)
+    return FileResponse(path, media_type=PROFILE_FORMATS[fmt], filename=path.name)
@@ -0,0 +1,230 @@
+"""
+Generación por lotes
+====================
+
+Renderiza muchos comprobantes en paralelo y responde un ZIP que se
+escribe a medida que cada PDF termina.
+
+Flujo:
+1. El router valida cada item y arma un `BatchJob` (render listo o
+   error de validación)
+2. Se mantienen en vuelo tantos renders como workers tenga el
+   RenderExecutor; el resto de su cola queda libre para los requests
+   individuales
+3. Cada PDF terminado se agrega al ZIP y sus bytes se envían de
+   inmediato; en memoria solo viven los PDFs en vuelo
+4. Al final se agrega `manifest.json` con el estado de cada item
+   (los errores por item van ahí, no cortan el lote)
+
+Decisiones técnicas:
+- `zipfile` sobre un buffer no posicionable: usa data descriptors y
+  no necesita volver atrás a reescribir headers
+- Entradas ZIP_STORED: los PDFs ya vienen comprimidos, deflate solo
+  gastaría CPU en el event loop
+- Si el executor está saturado al arrancar se responde 503 (todavía
+  no se envió nada); ya empezado el ZIP, un item rechazado sin renders
+  propios en vuelo espera `retry_after` y se reintenta (igual que el
+  bulk NDJSON), sin perder su lugar en la cola del lote
+"""
+
+import asyncio
+import json
+import logging
+import time
+import zipfile
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+
+from src.domain.exceptions import DomainException, ServiceOverloadedError
+from src.infrastructure.concurrency import RenderExecutor
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class BatchJob:
+    """
+    Un item del lote.
+
+    Atributos:
+        index: Posición del item en el request
+        tipo: Tipo de comprobante
+        client_id: Identificador enviado por el cliente
+        render: Función sin argumentos que retorna un resultado con
+                `content` y `filename` (None si el item es inválido)
+        error: Error de validación del item
+    """
+    index: int
+    tipo: str
+    client_id: str | None = None
+    render: Callable[[], Any] | None = None
+    error: dict | None = None
+
+
+@dataclass
+class _Manifest:
+    """Estado de cada item, escrito al final del ZIP."""
+    total: int
+    items: list[dict] = field(default_factory=list)
+
+    def ok(self, job: BatchJob, filename: str, size: int) -> None:
+        self.items.append({
+            **self._base(job), "status": "ok", "filename": filename, "size_bytes": size,
+        })
+
+    def error(self, job: BatchJob, error: dict) -> None:
+        self.items.append({**self._base(job), "status": "error", "error": error})
+
+    def to_json(self) -> bytes:
+        items = sorted(self.items, key=lambda item: item["index"])
+        errors = sum(1 for item in items if item["status"] == "error")
+        return json.dumps(
+            {"total": self.total, "ok": len(items) - errors, "errors": errors, "items": items},
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
+
+    @staticmethod
+    def _base(job: BatchJob) -> dict:
+        return {"index": job.index, "id": job.client_id, "tipo": job.tipo}
+
+
+class _ZipChunkBuffer:
+    """Destino del ZipFile: acumula lo escrito hasta que se drena."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def error_to_dict(exc: BaseException) -> dict:
+    """Serializa la excepción de un item (manifiesto de lotes, líneas NDJSON)."""
+    if isinstance(exc, DomainException):
+        return exc.to_dict()
+    return {"error": "INTERNAL_ERROR", "message": str(exc), "details": {}}
+
+
+async def stream_batch_zip(
+    jobs: list[BatchJob],
+    executor: RenderExecutor,
+    filename: str = "comprobantes.zip",
+    window: int | None = None,
+) -> StreamingResponse:
+    """
+    Renderiza los items en el executor y responde un ZIP en streaming.
+
+    Args:
+        jobs: Items del lote, en el orden del request
+        executor: Executor acotado de renders
+        filename: Nombre del ZIP para Content-Disposition
+        window: Renders en vuelo (None = workers del executor)
+
+    Returns:
+        StreamingResponse con el ZIP
+
+    Raises:
+        ServiceOverloadedError: Si el executor no admite ni el primer render
+    """
+    window = window or executor.workers
+    manifest = _Manifest(total=len(jobs))
+    waiting: deque[BatchJob] = deque()
+    for job in jobs:
+        if job.render is None:
+            manifest.error(job, job.error or {})
+        else:
+            waiting.append(job)
+
+    in_flight: dict[asyncio.Future, BatchJob] = {}
+
+    def fill() -> ServiceOverloadedError | None:
+        """
+        Encola items hasta llenar la ventana.
+
+        Returns:
+            El rechazo del executor si no quedó ningún render propio en
+            vuelo (el item sigue primero en `waiting`), o None
+        """
+        while waiting and len(in_flight) < window:
+            job = waiting[0]
+            try:
+                future = executor.submit(job.render)
+            except ServiceOverloadedError as e:
+                # Con renders propios en vuelo se reintenta cuando termine uno
+                return None if in_flight else e
+            waiting.popleft()
+            in_flight[future] = job
+        return None
+
+    # El primer render se admite antes de responder: saturado → 503
+    if waiting:
+        first = waiting.popleft()
+        in_flight[executor.submit(first.render)] = first
+        fill()
+
+    name_width = len(str(len(jobs)))
+
+    async def body() -> AsyncIterator[bytes]:
+        buffer = _ZipChunkBuffer()
+        archive = zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED)
+        try:
+            while in_flight or waiting:
+                if not in_flight:
+                    blocked = fill()
+                    if blocked is not None:
+                        # Executor ocupado por otros requests: esperar sin perder el item
+                        await asyncio.sleep(blocked.retry_after)
+                    continue
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning("Error en el item %s del lote: %s", job.index, e)
+                        manifest.error(job, error_to_dict(e))
+                        continue
+                    entry_name = f"{job.index:0{name_width}d}_{result.filename}"
+                    archive.writestr(_zip_info(entry_name), result.content)
+                    manifest.ok(job, entry_name, len(result.content))
+                    del result
+                fill()
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+
+            archive.writestr(_zip_info(MANIFEST_NAME), manifest.to_json())
+            archive.close()
+            yield buffer.drain()
+        finally:
+            # Cliente desconectado: descartar lo que todavía no empezó
+            for future in in_flight:
+                future.cancel()
+
+    return StreamingResponse(
+        body(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    return info
@@ -0,0 +1,78 @@
+"""
+HTTP Cache Helpers
+==================
+
+Utilidades de validación condicional HTTP (ETag / If-None-Match)
+para los endpoints de generación.
+
+El ETag se calcula a partir del payload canónico del request y de la
+versión de plantilla del documento, SIN renderizar. Si el cliente ya
+tiene ese PDF, el endpoint responde 304 antes de tocar ReportLab.
+
+- En modo determinístico los bytes son reproducibles: ETag fuerte
+- Fuera de ese modo el PDF es equivalente pero no idéntico byte a
+  byte (fecha/ID internos de ReportLab): ETag débil (W/"...")
+
+If-None-Match usa comparación débil (RFC 9110), así que ambos
+tipos de ETag sirven para responder 304.
+"""
+
+import hashlib
+
+from pydantic import BaseModel
+
+from src.application.utils.hash_utils import canonical_json
+
+
+def compute_etag(
+    payload: BaseModel,
+    template: str,
+    template_version: str,
+    weak: bool = False,
+) -> str:
+    """
+    Calcula el ETag de un request de generación.
+    
+    Args:
+        payload: Request validado por Pydantic
+        template: Identificador del tipo de documento
+        template_version: Versión de la plantilla del documento
+        weak: Si es True, retorna un ETag débil (W/"...")
+        
+    Returns:
+        Valor del header ETag (con comillas)
+    """
+    canonical = canonical_json({
+        "template": template,
+        "template_version": template_version,
+        "payload": payload.model_dump(mode="json"),
+    })
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    etag = f'"{digest}"'
+    return f"W/{etag}" if weak else etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evalúa un header If-None-Match contra un ETag (comparación débil).
+    
+    Soporta listas separadas por coma, ETags débiles y "*".
+    
+    Args:
+        if_none_match: Valor del header If-None-Match (o None)
+        etag: ETag actual del recurso
+        
+    Returns:
+        True si el cliente ya tiene la representación actual
+    """
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,147 @@
+"""
+API v1 Jobs Router
+==================
+
+Generación asíncrona de comprobantes.
+
+Para documentos grandes o lentos el cliente no necesita mantener la
+conexión abierta durante el render:
+
+1. POST /jobs → 202 con el ID del job (el render queda en cola)
+2. GET /jobs/{id} → estado (pending, running, succeeded, failed)
+3. GET /jobs/{id}/result → descarga del PDF cuando terminó
+
+Los jobs se guardan en SQLite (ver SQLiteJobRepository): los
+pendientes se retoman si el servicio se reinicia.
+"""
+
+import json
+
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import ValidationError
+
+from src.domain.entities import JobStatus, RenderJob
+from src.domain.exceptions import InvalidDocumentError
+from src.presentation.api.v1.mappers import DOCUMENT_TYPES
+from src.presentation.api.v1.router import limiter
+from src.presentation.dependencies.container import get_job_worker_pool
+from src.presentation.schemas.job_schemas import JobCreateRequest, JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+# ================================
+# Endpoints
+# ================================
+
+
+@router.post(
+    "",
+    status_code=202,
+    response_model=JobResponse,
+    summary="Crear Job de Generación",
+    description="Encola la generación de un comprobante y responde de inmediato con el ID del job",
+    responses={
+        202: {"description": "Job aceptado; consultar status_url"},
+        400: {"description": "Datos inválidos para el tipo de comprobante"},
+        429: {"description": "Demasiados requests - Rate limit excedido"},
+    },
+)
+@limiter.limit("100/minute")
+async def crear_job(
+    request: Request,
+    response: Response,
+    data: JobCreateRequest,
+    pool=Depends(get_job_worker_pool),
+):
+    """
+    Crea un job de generación de comprobante.
+
+    El payload se valida ahora contra el schema del tipo elegido; el
+    render ocurre en segundo plano.
+
+    Args:
+        request: Request HTTP (rate limit)
+        response: Response (para el header Location)
+        data: Tipo de comprobante y payload
+        pool: Pool de workers de jobs
+
+    Returns:
+        Estado inicial del job (202 Accepted)
+    """
+    schema, _ = DOCUMENT_TYPES[data.tipo]
+    try:
+        validated = schema.model_validate(data.data)
+    except ValidationError as e:
+        raise InvalidDocumentError(
+            "Datos inválidos para el tipo de comprobante",
+            details={"errors": json.loads(e.json(include_url=False))},
+        )
+
+    job = await pool.submit(data.tipo, validated.model_dump(mode="json"))
+
+    payload = _job_response(request, job)
+    response.headers["Location"] = payload.status_url
+    return payload
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Estado de un Job",
+    responses={404: {"description": "Job inexistente"}},
+)
+@limiter.limit("600/minute")
+async def estado_job(
+    request: Request,
+    job_id: str,
+    pool=Depends(get_job_worker_pool),
+):
+    """
+    Consulta el estado de un job.
+
+    Returns:
+        Estado del job; `result_url` está presente cuando terminó bien
+    """
+    return _job_response(request, await pool.get(job_id))
+
+
+@router.get(
+    "/{job_id}/result",
+    response_class=Response,
+    summary="Descargar el PDF de un Job",
+    responses={
+        200: {"description": "PDF generado", "content": {"application/pdf": {}}},
+        404: {"description": "Job inexistente"},
+        409: {"description": "El job todavía no terminó o falló"},
+    },
+)
+@limiter.limit("100/minute")
+async def resultado_job(
+    request: Request,
+    job_id: str,
+    pool=Depends(get_job_worker_pool),
+):
+    """
+    Descarga el PDF de un job terminado.
+
+    Returns:
+        Response con el PDF
+    """
+    job, content = await pool.get_result(job_id)
+    return Response(
+        content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={job.filename}"},
+    )
+
+
+def _job_response(request: Request, job: RenderJob) -> JobResponse:
+    """Arma la respuesta con las URLs de estado y de descarga."""
+    status_url = str(request.url_for("estado_job", job_id=job.id))
+    result_url = (
+        str(request.url_for("resultado_job", job_id=job.id))
+        if job.status == JobStatus.SUCCEEDED
+        else None
+    )
+    return JobResponse(**job.to_dict(), status_url=status_url, result_url=result_url)
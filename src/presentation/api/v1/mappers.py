@@ -0,0 +1,102 @@
+"""
+Schema → DTO Mappers
+====================
+
+Conversión de los schemas HTTP validados a los DTOs de aplicación.
+
+Compartida por los endpoints individuales, los de lotes y los jobs
+asíncronos, para que todos construyan exactamente los mismos DTOs.
+"""
+
+from src.domain.entities.pdf_document import PageOrientation, PageSize
+from src.presentation.schemas.pdf_schemas import PDFGenerateRequest
+
+from src.presentation.schemas.comprobante_postulacion_schemas import (
+    ComprobantePostulacionRequest,
+)
+from src.presentation.schemas.comprobante_contrato_schemas import (
+    ComprobanteContratoRequest,
+)
+from src.application.dto import (
+    ComprobantePostulacionDTO,
+    ComprobanteContratoDTO,
+    EstudianteDTO,
+    UniversidadDTO,
+    CarreraDTO,
+    EmpresaDTO,
+    ProyectoDTO,
+    PuestoDTO,
+    PostulacionDTO,
+    ContratoDTO,
+    PDFRequestDTO,
+    PDFSectionDTO,
+    PDFStyleDTO,
+    PDFTableDTO,
+)
+
+
+def to_comprobante_postulacion_dto(
+    data: ComprobantePostulacionRequest,
+) -> ComprobantePostulacionDTO:
+    """Convierte el request validado en el DTO del comprobante de postulación."""
+    return ComprobantePostulacionDTO(
+        estudiante=EstudianteDTO(**data.estudiante.model_dump()),
+        universidad=UniversidadDTO(**data.universidad.model_dump()),
+        carrera=CarreraDTO(**data.carrera.model_dump()),
+        empresa=EmpresaDTO(**data.empresa.model_dump()),
+        proyecto=ProyectoDTO(**data.proyecto.model_dump()),
+        puesto=PuestoDTO(**data.puesto.model_dump()),
+        postulacion=PostulacionDTO(**data.postulacion.model_dump()),
+    )
+
+
+def to_comprobante_contrato_dto(
+    data: ComprobanteContratoRequest,
+) -> ComprobanteContratoDTO:
+    """Convierte el request validado en el DTO del comprobante de contrato."""
+    return ComprobanteContratoDTO(
+        estudiante=EstudianteDTO(**data.estudiante.model_dump()),
+        universidad=UniversidadDTO(**data.universidad.model_dump()),
+        carrera=CarreraDTO(**data.carrera.model_dump()),
+        empresa=EmpresaDTO(**data.empresa.model_dump()),
+        proyecto=ProyectoDTO(**data.proyecto.model_dump()),
+        puesto=PuestoDTO(**data.puesto.model_dump()),
+        postulacion=PostulacionDTO(**data.postulacion.model_dump()),
+        contrato=ContratoDTO(**data.contrato.model_dump()),
+    )
+
+
+def to_pdf_request_dto(data: PDFGenerateRequest) -> PDFRequestDTO:
+    """Convierte el request genérico validado en el DTO de GeneratePDF."""
+    return PDFRequestDTO(
+        title=data.title,
+        sections=[
+            PDFSectionDTO(
+                title=section.title,
+                content=section.content,
+                level=section.level,
+                tables=[
+                    PDFTableDTO(
+                        headers=table.headers,
+                        rows=table.rows,
+                        title=table.title,
+                        columns=table.columns,
+                    )
+                    for table in section.tables
+                ],
+            )
+            for section in data.sections
+        ],
+        author=data.author,
+        page_size=PageSize(data.page_size),
+        orientation=PageOrientation(data.orientation),
+        style=PDFStyleDTO(**data.style.model_dump()) if data.style else None,
+        metadata=data.metadata or {},
+    )
+
+
+# Schema y mapper de cada tipo de comprobante aceptado por lotes y jobs
+DOCUMENT_TYPES = {
+    "comprobante_postulacion": (ComprobantePostulacionRequest, to_comprobante_postulacion_dto),
+    "comprobante_contrato": (ComprobanteContratoRequest, to_comprobante_contrato_dto),
+}
@@ -0,0 +1,195 @@
+"""
+NDJSON Streaming
+================
+
+Procesamiento de requests NDJSON (un JSON por línea) con respuesta
+NDJSON, sin cargar ni el request ni la respuesta completos en memoria.
+
+Flujo:
+- El body del request se lee por chunks y se parte en líneas
+- Cada línea se valida y se renderiza en el RenderExecutor, con a lo
+  sumo `window` renders en vuelo: mientras la ventana está llena no se
+  lee más del body (backpressure hacia el cliente)
+- Cada resultado se escribe como una línea de la respuesta apenas
+  termina (orden de finalización; cada línea trae su número)
+- La última línea es un resumen (`{"summary": {...}}`): si no llega,
+  el stream se cortó
+
+La memoria queda acotada por `window` PDFs más una línea de entrada,
+sin importar cuántas líneas tenga el request.
+
+IMPORTANTE: el request se lee mientras se escribe la respuesta. El
+cliente tiene que leer la respuesta a la par que envía el body (el
+cliente HTTP de Go lo hace); uno que envía todo antes de leer puede
+trabarse con volúmenes grandes en modo base64.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+
+from src.domain.exceptions import ServiceOverloadedError
+from src.infrastructure.concurrency import RenderExecutor
+from src.presentation.api.v1.batch import error_to_dict
+
+
+logger = logging.getLogger(__name__)
+
+# Resultado de preparar una línea: (render, None) o (None, error)
+PreparedLine = tuple[Callable[[], dict[str, Any]] | None, dict[str, Any] | None]
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse que no consume `receive` mientras responde.
+
+    StreamingResponse escucha `receive` en paralelo para detectar
+    desconexiones (ASGI < 2.4), lo que se comería los chunks del body
+    que el generador todavía está leyendo. Acá el único lector de
+    `receive` es el propio generador; una desconexión aparece como
+    error al leer el body o al enviar.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Parte un stream de bytes en líneas NDJSON.
+
+    Las líneas vacías se ignoran (pero cuentan para la numeración).
+
+    Args:
+        chunks: Chunks del body del request
+        max_line_bytes: Largo máximo de una línea
+
+    Yields:
+        (número de línea desde 1, contenido) o (número, None) si la
+        línea supera `max_line_bytes`
+    """
+    buffer = bytearray()
+    line_no = 0
+    skipping = False  # descartando el resto de una línea demasiado larga
+
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line_no += 1
+            if skipping:
+                skipping = False
+            elif len(buffer) + end - start > max_line_bytes:
+                yield line_no, None
+            else:
+                buffer += chunk[start:end]
+                if buffer.strip():
+                    yield line_no, bytes(buffer)
+            buffer.clear()
+            start = end + 1
+
+        if skipping:
+            continue
+        buffer += chunk[start:]
+        if len(buffer) > max_line_bytes:
+            yield line_no + 1, None
+            buffer.clear()
+            skipping = True
+
+    if buffer.strip() and not skipping:
+        yield line_no + 1, bytes(buffer)
+
+
+async def render_ndjson(
+    lines: AsyncIterator[tuple[int, bytes | None]],
+    prepare: Callable[[int, bytes], PreparedLine],
+    executor: RenderExecutor,
+    window: int,
+) -> AsyncIterator[bytes]:
+    """
+    Renderiza cada línea con concurrencia acotada y produce la respuesta.
+
+    Args:
+        lines: Líneas del request (ver `iter_ndjson_lines`)
+        prepare: Valida una línea; retorna su render (que corre en el
+                 executor y retorna los campos del resultado) o su error
+        executor: Executor acotado de renders
+        window: Renders en vuelo como máximo
+
+    Yields:
+        Líneas NDJSON de resultado y, al final, el resumen
+    """
+    in_flight: dict[asyncio.Future, int] = {}
+    counts = {"lines": 0, "ok": 0, "errors": 0}
+
+    def record(line_no: int, fields: dict[str, Any] | None, error: dict | None) -> bytes:
+        counts["lines"] += 1
+        if error is not None:
+            counts["errors"] += 1
+            payload = {"line": line_no, "status": "error", "error": error}
+        else:
+            counts["ok"] += 1
+            payload = {"line": line_no, "status": "ok", **fields}
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    async def collect(return_when: str) -> list[bytes]:
+        done, _ = await asyncio.wait(in_flight, return_when=return_when)
+        output = []
+        for future in done:
+            line_no = in_flight.pop(future)
+            try:
+                output.append(record(line_no, future.result(), None))
+            except Exception as e:
+                logger.warning("Error en la línea %s del bulk: %s", line_no, e)
+                output.append(record(line_no, None, error_to_dict(e)))
+        return output
+
+    try:
+        async for line_no, raw in lines:
+            if raw is None:
+                yield record(line_no, None, {
+                    "error": "LINE_TOO_LONG",
+                    "message": "La línea supera el largo máximo permitido",
+                    "details": {},
+                })
+                continue
+
+            render, error = prepare(line_no, raw)
+            if error is not None:
+                yield record(line_no, None, error)
+                continue
+
+            while True:
+                if len(in_flight) >= window:
+                    for output in await collect(asyncio.FIRST_COMPLETED):
+                        yield output
+                    continue
+                try:
+                    in_flight[executor.submit(render)] = line_no
+                    break
+                except ServiceOverloadedError as e:
+                    # Executor ocupado por otros requests: esperar sin perder la línea
+                    if in_flight:
+                        for output in await collect(asyncio.FIRST_COMPLETED):
+                            yield output
+                    else:
+                        await asyncio.sleep(e.retry_after)
+
+        while in_flight:
+            for output in await collect(asyncio.FIRST_COMPLETED):
+                yield output
+
+        yield json.dumps({"summary": counts}).encode("utf-8") + b"\n"
+    finally:
+        for future in in_flight:
+            future.cancel()
+
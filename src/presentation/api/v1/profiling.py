@@ -0,0 +1,87 @@
+"""
+Profiling Helpers
+=================
+
+Perfilado a demanda de un render.
+
+Con `Settings.pdf_profiling_enabled`, un request con el header
+`X-PDF-Profile: cprofile` (o `sampling`) se renderiza bajo el profiler
+elegido. El perfil se guarda en el anillo de disco (ProfileStore) y su
+ID vuelve en el header `X-PDF-Profile-Id`; se descarga desde
+/api/v1/admin/profiles.
+
+Sin el setting el header se ignora: un cliente no puede activar un
+render ~2x más lento por su cuenta.
+
+Limitaciones: el profiler mide el thread del render en este proceso,
+así que no se perfila (y la respuesta lo indica en
+`X-PDF-Profile-Skipped`) cuando el perfil no mostraría el render:
+- `pdf_backend=process_pool`: el render corre en un proceso hijo; el
+  perfil solo vería al thread esperando `future.result()`
+- Acierto de CachedComprobanteUseCase: no hay render, solo la copia
+  de los bytes cacheados
+"""
+
+from typing import Any, Callable
+
+from fastapi import Request
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.profiling import run_profiled
+from src.presentation.dependencies.container import get_profile_store
+
+PROFILE_HEADER = "X-PDF-Profile"
+PROFILE_ID_HEADER = "X-PDF-Profile-Id"
+PROFILE_SKIPPED_HEADER = "X-PDF-Profile-Skipped"
+
+
+def profiled_render(
+    request: Request,
+    render: Callable[[Any], Any],
+    label: str,
+    headers: dict[str, str],
+    use_case: Any = None,
+    comprobante: Any = None,
+) -> Callable[[Any], Any]:
+    """
+    Envuelve `render` en el profiler si el request lo pide.
+
+    Args:
+        request: Request HTTP (header X-PDF-Profile)
+        render: Función que escribe el PDF en el stream recibido
+        label: Etiqueta del perfil (tipo de documento)
+        headers: Headers de la respuesta; se agrega X-PDF-Profile-Id
+                 (o X-PDF-Profile-Skipped si no se perfila)
+        use_case: Caso de uso que renderiza (para detectar aciertos de caché)
+        comprobante: DTO que recibe `use_case`
+
+    Returns:
+        `render` sin cambios, o una versión que lo perfila y guarda el perfil
+    """
+    settings = get_settings()
+    requested = request.headers.get(PROFILE_HEADER)
+    if not requested or not settings.pdf_profiling_enabled:
+        return render
+
+    # Import diferido: el módulo del use case no se carga al importar la app
+    from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+
+    if settings.pdf_backend == "process_pool":
+        headers[PROFILE_SKIPPED_HEADER] = "process_pool"
+        return render
+    if isinstance(use_case, CachedComprobanteUseCase) and use_case.is_cached(comprobante):
+        headers[PROFILE_SKIPPED_HEADER] = "cache_hit"
+        return render
+
+    mode = "sampling" if requested.strip().lower() == "sampling" else "cprofile"
+    store = get_profile_store()
+    profile_id = store.new_id()
+    headers[PROFILE_ID_HEADER] = profile_id
+
+    def run(stream: Any) -> Any:
+        # Corre en el thread del render: cProfile solo ve el thread que lo activa
+        result, profile = run_profiled(render, stream, mode=mode)
+        store.save(profile_id, profile, label=label)
+        return result
+
+    return run
@@ -15,10 +15,14 @@ Estructura típica de un endpoint:
 6. Retorna response HTTP
 """
 
-import asyncio
-from io import BytesIO
+import base64
+import json
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from fastapi.responses import StreamingResponse
@@ -29,21 +33,38 @@ from src.presentation.schemas.comprobante_postulacion_schemas import (
 from src.presentation.schemas.comprobante_contrato_schemas import (
     ComprobanteContratoRequest,
 )
+from src.presentation.schemas.pdf_schemas import PDFGenerateRequest
+from src.presentation.schemas.batch_schemas import (
+    BatchGenerateRequest,
+    BatchItemSchema,
+)
+from src.application.utils.stage_timing import mark_stage, stage, stage_histograms
+from src.domain.exceptions import InvalidDocumentError, PayloadTooLargeError
+from src.infrastructure.config import get_settings
+from src.presentation.api.v1.batch import BatchJob, stream_batch_zip
+from src.presentation.api.v1.ndjson import (
+    NDJSONStreamingResponse,
+    iter_ndjson_lines,
+    render_ndjson,
+)
+from src.presentation.api.v1.http_cache import compute_etag, etag_matches
+from src.presentation.api.v1.mappers import (
+    DOCUMENT_TYPES,
+    to_comprobante_contrato_dto,
+    to_comprobante_postulacion_dto,
+    to_pdf_request_dto,
+)
+from src.presentation.api.v1.profiling import profiled_render
+from src.presentation.api.v1.streaming import stream_pdf_response
 from src.presentation.dependencies.container import (
+    get_generate_pdf_use_case,
     get_generar_comprobante_postulacion_use_case,
     get_generar_comprobante_contrato_use_case,
-)
-from src.application.dto import (
-    ComprobantePostulacionDTO,
-    ComprobanteContratoDTO,
-    EstudianteDTO,
-    UniversidadDTO,
-    CarreraDTO,
-    EmpresaDTO,
-    ProyectoDTO,
-    PuestoDTO,
-    PostulacionDTO,
-    ContratoDTO,
+    get_job_worker_pool,
+    get_pdf_output_cache,
+    get_render_executor,
+    get_string_width_stats,
+    get_stylesheet_stats,
 )
 
 router = APIRouter(prefix="/pdf", tags=["PDF"])
@@ -59,6 +80,107 @@ limiter = Limiter(key_func=get_remote_address)
 # ================================
 
 
+@router.post(
+    "/generate",
+    response_class=StreamingResponse,
+    summary="Generar PDF Genérico",
+    description=(
+        "Genera un PDF con secciones y tablas arbitrarias (reportes). "
+        "El body sigue el schema PDFGenerateRequest."
+    ),
+    responses={
+        200: {
+            "description": "PDF generado exitosamente",
+            "content": {"application/pdf": {}},
+        },
+        400: {
+            "description": "Documento inválido",
+        },
+        413: {
+            "description": "El body o las tablas superan los límites configurados",
+        },
+        422: {
+            "description": "El body no cumple el schema PDFGenerateRequest",
+        },
+        429: {
+            "description": "Demasiados requests - Rate limit excedido",
+        },
+        503: {
+            "description": "Cola de renders llena - reintentar según Retry-After",
+        },
+    },
+)
+@limiter.limit("100/minute")
+async def generate_pdf(
+    request: Request,
+    use_case=Depends(get_generate_pdf_use_case),
+    executor=Depends(get_render_executor),
+):
+    """
+    Genera un PDF genérico a partir de secciones y tablas.
+    
+    Pensado para las herramientas de reportes, que exportan tablas
+    grandes. A diferencia de los comprobantes, el body se lee a mano
+    para cortar antes de cargarlo entero si supera el límite:
+    
+    - Content-Length (o lo leído hasta el momento) mayor a
+      PDF_GENERATE_MAX_BODY_BYTES → 413
+    - Celdas de tabla del documento mayores a
+      PDF_GENERATE_MAX_TABLE_CELLS → 413
+    - El render corre en el executor acotado (503 si está saturado) y
+      el PDF se envía en streaming
+    
+    Args:
+        request: Request HTTP con un PDFGenerateRequest en JSON
+        use_case: Use case de generación genérica
+        executor: Executor acotado de renders
+        
+    Returns:
+        StreamingResponse con el PDF generado
+    """
+    settings = get_settings()
+    with stage("validation"):
+        body = await _read_body_limited(request, settings.pdf_generate_max_body_bytes)
+        
+        # Validar un body de varios MB bloquea: se hace fuera del event loop
+        try:
+            data = await run_in_threadpool(PDFGenerateRequest.model_validate_json, body)
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ["body", *error["loc"]]}
+                for error in json.loads(e.json(include_url=False))
+            ])
+    
+    cells = sum(
+        len(table.headers) * table.row_count
+        for section in data.sections
+        for table in section.tables
+    )
+    if cells > settings.pdf_generate_max_table_cells:
+        raise PayloadTooLargeError(
+            "Las tablas del documento superan el máximo de celdas",
+            details={"cells": cells, "max_cells": settings.pdf_generate_max_table_cells},
+        )
+    
+    with stage("mapping"):
+        pdf_request = to_pdf_request_dto(data)
+    headers: dict[str, str] = {}
+    render = profiled_render(
+        request,
+        lambda stream: use_case.execute_to_stream(pdf_request, stream, style=pdf_request.style),
+        label="generico",
+        headers=headers,
+    )
+    return await stream_pdf_response(
+        render,
+        filename=use_case.filename_for(pdf_request),
+        headers=headers,
+        executor=executor,
+        max_chunks=settings.pdf_stream_max_chunks,
+        chunk_size=settings.pdf_stream_chunk_size,
+    )
+
+
 @router.post(
     "/generate/comprobante_postulacion",
     response_class=StreamingResponse,
@@ -69,6 +191,9 @@ limiter = Limiter(key_func=get_remote_address)
             "description": "PDF generado exitosamente",
             "content": {"application/pdf": {}},
         },
+        304: {
+            "description": "El cliente ya tiene este PDF (If-None-Match coincide con el ETag)",
+        },
         400: {
             "description": "Datos inválidos en el request",
         },
@@ -78,6 +203,9 @@ limiter = Limiter(key_func=get_remote_address)
         500: {
             "description": "Error al generar el PDF",
         },
+        503: {
+            "description": "Cola de renders llena - reintentar según Retry-After",
+        },
     },
 )
 @limiter.limit("100/minute")
@@ -85,6 +213,7 @@ async def generar_comprobante_postulacion(
     request: Request,
     data: ComprobantePostulacionRequest,
     use_case=Depends(get_generar_comprobante_postulacion_use_case),
+    executor=Depends(get_render_executor),
 ):
     """
     Genera el comprobante de postulación en formato PDF.
@@ -98,42 +227,55 @@ async def generar_comprobante_postulacion(
     - Detalles de la postulación (empresa, proyecto, puesto)
     - Estado de la postulación
     
+    Si el header If-None-Match coincide con el ETag del request
+    (payload canónico + versión de plantilla) se responde 304 sin renderizar.
+    
     Args:
         request: Datos validados de la postulación
         use_case: Use case inyectado para generar el comprobante
+        executor: Executor acotado de renders (503 si está saturado)
         
     Returns:
-        StreamingResponse con el PDF generado
+        StreamingResponse con el PDF generado (o 304 Not Modified)
     """
-    # 1. Convertir schemas Pydantic → DTOs de aplicación usando model_dump()
-    comprobante_dto = ComprobantePostulacionDTO(
-        estudiante=EstudianteDTO(**data.estudiante.model_dump()),
-        universidad=UniversidadDTO(**data.universidad.model_dump()),
-        carrera=CarreraDTO(**data.carrera.model_dump()),
-        empresa=EmpresaDTO(**data.empresa.model_dump()),
-        proyecto=ProyectoDTO(**data.proyecto.model_dump()),
-        puesto=PuestoDTO(**data.puesto.model_dump()),
-        postulacion=PostulacionDTO(**data.postulacion.model_dump()),
-    )
+    # FastAPI ya leyó y validó el body antes de llamar al endpoint
+    mark_stage("validation")
     
-    # 2. Ejecutar el use case para generar el PDF (async con thread pool)
-    result = await asyncio.to_thread(
-        use_case.execute,
-        comprobante_dto
+    # 0. Validación condicional: ETag calculado sin renderizar
+    etag = compute_etag(
+        data,
+        template="comprobante_postulacion",
+        template_version=use_case.TEMPLATE_VERSION,
+        weak=not get_settings().pdf_deterministic,
     )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    # 3. Crear stream con el contenido del PDF
-    pdf_stream = BytesIO(result.content)
+    # 1. Convertir schemas Pydantic → DTOs de aplicación
+    with stage("mapping"):
+        comprobante_dto = to_comprobante_postulacion_dto(data)
     
-    # 4. Retornar como streaming response
-    return StreamingResponse(
-        pdf_stream,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-        },
+    # 2. Generar el PDF en un thread, enviando los bytes a medida que se escriben
+    settings = get_settings()
+    headers = {"ETag": etag}
+    render = profiled_render(
+        request,
+        lambda stream: use_case.execute_to_stream(comprobante_dto, stream),
+        label="comprobante_postulacion",
+        headers=headers,
+        use_case=use_case,
+        comprobante=comprobante_dto,
+    )
+    return await stream_pdf_response(
+        render,
+        filename=use_case.filename_for(comprobante_dto),
+        headers=headers,
+        executor=executor,
+        max_chunks=settings.pdf_stream_max_chunks,
+        chunk_size=settings.pdf_stream_chunk_size,
     )
 
+
 @router.post(
     "/generate/comprobante_contrato",
     response_class=StreamingResponse,
@@ -144,6 +286,9 @@ async def generar_comprobante_postulacion(
             "description": "PDF generado exitosamente",
             "content": {"application/pdf": {}},
         },
+        304: {
+            "description": "El cliente ya tiene este PDF (If-None-Match coincide con el ETag)",
+        },
         400: {
             "description": "Datos inválidos en el request",
         },
@@ -153,6 +298,9 @@ async def generar_comprobante_postulacion(
         500: {
             "description": "Error al generar el PDF",
         },
+        503: {
+            "description": "Cola de renders llena - reintentar según Retry-After",
+        },
     },
 )
 @limiter.limit("100/minute")
@@ -160,6 +308,7 @@ async def generar_comprobante_contrato(
     request: Request,
     data: ComprobanteContratoRequest,
     use_case=Depends(get_generar_comprobante_contrato_use_case),
+    executor=Depends(get_render_executor),
 ):
     """
     Genera el comprobante de contrato en formato PDF.
@@ -173,50 +322,272 @@ async def generar_comprobante_contrato(
     - Detalles de la postulación (empresa, proyecto, puesto)
     - Estado de la postulación
     
+    Si el header If-None-Match coincide con el ETag del request
+    (payload canónico + versión de plantilla) se responde 304 sin renderizar.
+    
     Args:
         request: Datos validados de la postulación
         use_case: Use case inyectado para generar el comprobante
+        executor: Executor acotado de renders (503 si está saturado)
         
     Returns:
-        StreamingResponse con el PDF generado
+        StreamingResponse con el PDF generado (o 304 Not Modified)
     """
-    # 1. Convertir schemas Pydantic → DTOs de aplicación usando model_dump()
-    comprobante_dto = ComprobanteContratoDTO(
-        estudiante=EstudianteDTO(**data.estudiante.model_dump()),
-        universidad=UniversidadDTO(**data.universidad.model_dump()),
-        carrera=CarreraDTO(**data.carrera.model_dump()),
-        empresa=EmpresaDTO(**data.empresa.model_dump()),
-        proyecto=ProyectoDTO(**data.proyecto.model_dump()),
-        puesto=PuestoDTO(**data.puesto.model_dump()),
-        postulacion=PostulacionDTO(**data.postulacion.model_dump()),
-        contrato=ContratoDTO(**data.contrato.model_dump()),
+    # FastAPI ya leyó y validó el body antes de llamar al endpoint
+    mark_stage("validation")
+    
+    # 0. Validación condicional: ETag calculado sin renderizar
+    etag = compute_etag(
+        data,
+        template="comprobante_contrato",
+        template_version=use_case.TEMPLATE_VERSION,
+        weak=not get_settings().pdf_deterministic,
     )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # 1. Convertir schemas Pydantic → DTOs de aplicación
+    with stage("mapping"):
+        comprobante_dto = to_comprobante_contrato_dto(data)
     
-    # 2. Ejecutar el use case para generar el PDF (async con thread pool)
-    result = await asyncio.to_thread(
-        use_case.execute,
-        comprobante_dto
+    # 2. Generar el PDF en un thread, enviando los bytes a medida que se escriben
+    settings = get_settings()
+    headers = {"ETag": etag}
+    render = profiled_render(
+        request,
+        lambda stream: use_case.execute_to_stream(comprobante_dto, stream),
+        label="contrato_pasantia",
+        headers=headers,
+        use_case=use_case,
+        comprobante=comprobante_dto,
     )
+    return await stream_pdf_response(
+        render,
+        filename=use_case.filename_for(comprobante_dto),
+        headers=headers,
+        executor=executor,
+        max_chunks=settings.pdf_stream_max_chunks,
+        chunk_size=settings.pdf_stream_chunk_size,
+    )
+
+
+@router.post(
+    "/generate/batch",
+    response_class=StreamingResponse,
+    summary="Generar Comprobantes por Lote",
+    description="Genera muchos comprobantes en paralelo y los devuelve en un ZIP con un manifiesto",
+    responses={
+        200: {
+            "description": "ZIP con un PDF por item válido y manifest.json con el estado de cada item",
+            "content": {"application/zip": {}},
+        },
+        400: {
+            "description": "El lote supera el máximo de items permitido",
+        },
+        429: {
+            "description": "Demasiados requests - Rate limit excedido",
+        },
+        503: {
+            "description": "Cola de renders llena - reintentar según Retry-After",
+        },
+    },
+)
+@limiter.limit("10/minute")
+async def generar_comprobantes_batch(
+    request: Request,
+    data: BatchGenerateRequest,
+    postulacion_use_case=Depends(get_generar_comprobante_postulacion_use_case),
+    contrato_use_case=Depends(get_generar_comprobante_contrato_use_case),
+    executor=Depends(get_render_executor),
+):
+    """
+    Genera un lote de comprobantes (postulación y/o contrato) en un ZIP.
+    
+    Pensado para el inicio de cuatrimestre, cuando el backend necesita
+    miles de comprobantes: un solo request en lugar de miles.
     
-    # 3. Crear stream con el contenido del PDF
-    pdf_stream = BytesIO(result.content)
+    - Cada item se valida por separado contra el schema de su tipo
+    - Los renders corren en paralelo en el executor de renders
+    - Cada PDF se agrega al ZIP (y se envía) apenas termina
+    - `manifest.json` registra el estado de cada item; un item inválido
+      o que falla al renderizar NO corta el lote
+    
+    Args:
+        request: Request HTTP (rate limit)
+        data: Lista de items a generar
+        postulacion_use_case: Use case de comprobantes de postulación
+        contrato_use_case: Use case de comprobantes de contrato
+        executor: Executor acotado de renders
+        
+    Returns:
+        StreamingResponse con el ZIP
+    """
+    max_items = get_settings().pdf_batch_max_items
+    if len(data.items) > max_items:
+        raise InvalidDocumentError(
+            "El lote supera el máximo de documentos permitido",
+            details={"items": len(data.items), "max_items": max_items},
+        )
     
-    # 4. Retornar como streaming response
-    return StreamingResponse(
-        pdf_stream,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
+    use_cases = {
+        "comprobante_postulacion": postulacion_use_case,
+        "comprobante_contrato": contrato_use_case,
+    }
+    jobs = [
+        _build_batch_job(index, item, use_cases[item.tipo])
+        for index, item in enumerate(data.items)
+    ]
+    return await stream_batch_zip(jobs, executor, filename="comprobantes.zip")
+
+
+@router.post(
+    "/generate/comprobante_postulacion/bulk",
+    response_class=NDJSONStreamingResponse,
+    summary="Generar Comprobantes de Postulación (NDJSON)",
+    description="Recibe un comprobante de postulación por línea (NDJSON) y responde una línea de resultado por cada uno",
+    responses={
+        200: {
+            "description": "Una línea por comprobante (status ok/error) y una línea final con el resumen",
+            "content": {"application/x-ndjson": {}},
+        },
+        429: {
+            "description": "Demasiados requests - Rate limit excedido",
         },
+    },
+)
+@limiter.limit("10/minute")
+async def generar_comprobantes_postulacion_bulk(
+    request: Request,
+    output: Literal["base64", "reference"] = Query(
+        default="base64",
+        description="base64: PDF embebido en cada línea; reference: PDF guardado y descargable por job",
+    ),
+    use_case=Depends(get_generar_comprobante_postulacion_use_case),
+    executor=Depends(get_render_executor),
+    pool=Depends(get_job_worker_pool),
+):
+    """
+    Genera comprobantes de postulación a partir de un stream NDJSON.
+    
+    Pensado para la conciliación nocturna: el backend envía las
+    postulaciones de a una por línea, sin armar un array JSON gigante.
+    
+    - El body se lee y se parte en líneas a medida que llega
+    - Cada línea se valida contra ComprobantePostulacionRequest
+    - Los renders corren en el executor de renders, con tantos en
+      vuelo como workers tenga; mientras tanto no se lee más del body
+    - Cada resultado se escribe apenas termina, con su número de línea
+      (`line`), `status` y el PDF en base64 o una referencia a
+      /api/v1/jobs/{id}/result
+    - La última línea es `{"summary": {...}}`
+    
+    La memoria se mantiene acotada sin importar cuántas líneas lleguen.
+    
+    Args:
+        request: Request HTTP (body NDJSON, rate limit)
+        output: Formato del PDF en cada línea de resultado
+        use_case: Use case de comprobantes de postulación
+        executor: Executor acotado de renders
+        pool: Pool de jobs (guarda los PDFs en modo reference)
+        
+    Returns:
+        NDJSONStreamingResponse con una línea por comprobante
+    """
+    max_line_bytes = get_settings().pdf_ndjson_max_line_bytes
+
+    def prepare(line_no: int, raw: bytes):
+        try:
+            validated = ComprobantePostulacionRequest.model_validate_json(raw)
+        except ValidationError as e:
+            return None, {
+                "error": "VALIDATION_ERROR",
+                "message": "Datos inválidos en la línea",
+                "details": {"errors": json.loads(e.json(include_url=False))},
+            }
+        comprobante_dto = to_comprobante_postulacion_dto(validated)
+
+        def render() -> dict:
+            result = use_case.execute(comprobante_dto)
+            fields = {
+                "filename": result.filename,
+                "numero_postulacion": validated.postulacion.numero,
+            }
+            if output == "reference":
+                job = pool.store_result(
+                    "comprobante_postulacion",
+                    validated.model_dump(mode="json"),
+                    result.content,
+                    result.filename,
+                )
+                fields["document"] = {
+                    "job_id": job.id,
+                    "result_url": str(request.url_for("resultado_job", job_id=job.id)),
+                }
+            else:
+                fields["content_base64"] = base64.b64encode(result.content).decode("ascii")
+            return fields
+
+        return render, None
+
+    return NDJSONStreamingResponse(
+        render_ndjson(
+            iter_ndjson_lines(request.stream(), max_line_bytes),
+            prepare,
+            executor,
+            window=executor.workers,
+        )
     )
 
 
+async def _read_body_limited(request: Request, max_bytes: int) -> bytes:
+    """
+    Lee el body cortando apenas supera `max_bytes`.
+    
+    Raises:
+        PayloadTooLargeError: Si Content-Length o lo recibido supera el límite
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise PayloadTooLargeError(details={"bytes": int(declared), "max_bytes": max_bytes})
+    
+    chunks: list[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise PayloadTooLargeError(details={"max_bytes": max_bytes})
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _build_batch_job(index: int, item: BatchItemSchema, use_case) -> BatchJob:
+    """Valida un item del lote y arma su render (o su error de validación)."""
+    schema, to_dto = DOCUMENT_TYPES[item.tipo]
+    job = BatchJob(index=index, tipo=item.tipo, client_id=item.id)
+    try:
+        comprobante_dto = to_dto(schema.model_validate(item.data))
+    except ValidationError as e:
+        job.error = {
+            "error": "VALIDATION_ERROR",
+            "message": "Datos inválidos en el item",
+            "details": {"errors": json.loads(e.json(include_url=False))},
+        }
+        return job
+    job.render = lambda: use_case.execute(comprobante_dto)
+    return job
+
+
 @router.get("/health")
 @limiter.limit("200/minute")
 async def health_check(request: Request):
     """
     Health check del servicio de PDF.
     
+    Incluye las estadísticas de la caché de PDFs (hits/misses), del
+    executor de renders (activos, cola, tiempos de espera), de los
+    workers de jobs asíncronos, del registro de hojas de estilos, de la
+    caché de anchos de texto y los histogramas de tiempo por etapa.
+    
     Returns:
         Estado del servicio
     """
@@ -224,4 +595,10 @@ async def health_check(request: Request):
         "status": "healthy",
         "service": "pdf-generator",
         "version": "1.0.0",
+        "output_cache": get_pdf_output_cache().stats().to_dict(),
+        "render_executor": get_render_executor().stats().to_dict(),
+        "jobs": get_job_worker_pool().stats(),
+        "stylesheets": get_stylesheet_stats(),
+        "string_widths": get_string_width_stats(),
+        "stage_timings": stage_histograms.snapshot(),
     }
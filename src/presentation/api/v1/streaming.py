@@ -0,0 +1,227 @@
+"""
+Streaming de PDFs
+=================
+
+Respuesta HTTP alimentada directamente por `execute_to_stream`.
+
+Antes el router generaba el PDF completo con `execute`, lo copiaba a un
+`BytesIO` y recién entonces respondía: dos copias del PDF en memoria y
+ningún byte enviado hasta el final.
+
+Ahora:
+- El render corre en un thread y escribe en un `ChunkQueueWriter`
+- El writer parte lo escrito en chunks y los pasa a una cola acotada;
+  si la cola está llena el thread de render espera (backpressure)
+- La respuesta drena la cola a medida que se producen los chunks
+
+Manejo de errores:
+- Si el render falla ANTES del primer chunk, la excepción se propaga
+  desde el endpoint y los exception handlers responden 4xx/5xx normales
+- Si falla DESPUÉS de enviar bytes, ya no se puede cambiar el status:
+  se corta la conexión para que el cliente no reciba un PDF truncado
+  como si fuera válido
+- Si el cliente se desconecta (o el request se cancela esperando el
+  primer chunk), el writer se aborta y el render termina con
+  `StreamAbortedError` en su próximo `write`
+- Si el RenderExecutor está saturado, `ServiceOverloadedError` se lanza
+  antes de encolar nada (503 + Retry-After)
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+
+from src.domain.exceptions import PDFGenerationError
+from src.infrastructure.concurrency import RenderExecutor
+
+
+logger = logging.getLogger(__name__)
+
+# Marca de fin de stream dentro de la cola
+_END = object()
+
+
+class StreamAbortedError(IOError):
+    """El consumidor del stream ya no está (cliente desconectado)."""
+
+
+class ChunkQueueWriter:
+    """
+    Stream binario de solo escritura que alimenta una cola asyncio acotada.
+
+    `write` se llama desde el thread de render; los chunks se consumen
+    desde el event loop con `next_chunk`.
+
+    Ejemplo:
+        >>> writer = ChunkQueueWriter(asyncio.get_running_loop())
+        >>> # en un thread: use_case.execute_to_stream(dto, writer)
+        >>> chunk = await writer.next_chunk()
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_chunks: int = 8,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """
+        Inicializa el writer.
+
+        Args:
+            loop: Event loop donde vive el consumidor
+            max_chunks: Capacidad de la cola (memoria máxima en tránsito
+                        = max_chunks * chunk_size)
+            chunk_size: Tamaño máximo de cada chunk en bytes
+        """
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks)
+        self._chunk_size = chunk_size
+        self._aborted = False
+        self._closed = False
+        self.bytes_written = 0
+
+    # ================================
+    # Lado productor (thread de render)
+    # ================================
+
+    def write(self, data: bytes) -> int:
+        """Encola `data` en chunks, bloqueando si la cola está llena."""
+        view = memoryview(data)
+        for start in range(0, len(view), self._chunk_size):
+            self._put(bytes(view[start:start + self._chunk_size]))
+        self.bytes_written += len(view)
+        return len(view)
+
+    def flush(self) -> None:
+        """Los chunks se entregan en cada write; no hay buffer propio."""
+
+    def close(self) -> None:
+        """Marca el fin del stream (lo llama el productor al terminar)."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._aborted:
+            self._put(_END, check_aborted=False)
+
+    def _put(self, item: Any, check_aborted: bool = True) -> None:
+        if self._aborted:
+            if check_aborted:
+                raise StreamAbortedError("El cliente cerró la conexión")
+            return
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop)
+        future.result()
+        if self._aborted and check_aborted:
+            raise StreamAbortedError("El cliente cerró la conexión")
+
+    # ================================
+    # Lado consumidor (event loop)
+    # ================================
+
+    async def next_chunk(self) -> bytes | None:
+        """Retorna el siguiente chunk, o None al final del stream."""
+        item = await self._queue.get()
+        return None if item is _END else item
+
+    def abort(self) -> None:
+        """
+        Descarta lo pendiente y libera al productor si estaba bloqueado.
+
+        Se llama desde el event loop cuando la respuesta termina antes
+        de tiempo (desconexión o error).
+        """
+        self._aborted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    @property
+    def queue_depth(self) -> int:
+        """Chunks esperando ser enviados."""
+        return self._queue.qsize()
+
+
+async def stream_pdf_response(
+    render: Callable[[ChunkQueueWriter], Any],
+    filename: str,
+    headers: dict[str, str] | None = None,
+    executor: RenderExecutor | None = None,
+    max_chunks: int = 8,
+    chunk_size: int = 64 * 1024,
+) -> StreamingResponse:
+    """
+    Ejecuta `render(stream)` en un thread y responde con lo que escribe.
+
+    Espera al primer chunk antes de devolver la respuesta: los errores
+    tempranos (validación, render fallido) siguen llegando a los
+    exception handlers con su status correcto.
+
+    Args:
+        render: Función que escribe el PDF en el stream recibido
+                (típicamente `lambda s: use_case.execute_to_stream(dto, s)`)
+        filename: Nombre del archivo para Content-Disposition
+        headers: Headers adicionales (ETag, etc.)
+        executor: Executor acotado donde renderizar (None = to_thread)
+        max_chunks: Capacidad de la cola de chunks
+        chunk_size: Tamaño máximo de cada chunk
+
+    Returns:
+        StreamingResponse que drena la cola de chunks
+
+    Raises:
+        ServiceOverloadedError: Si el executor no admite más renders
+        La excepción del render si falla antes de producir bytes
+    """
+    loop = asyncio.get_running_loop()
+    writer = ChunkQueueWriter(loop, max_chunks=max_chunks, chunk_size=chunk_size)
+
+    def run() -> Any:
+        try:
+            return render(writer)
+        finally:
+            writer.close()
+
+    if executor is not None:
+        render_task = executor.submit(run)
+    else:
+        render_task = asyncio.ensure_future(asyncio.to_thread(run))
+
+    try:
+        first_chunk = await writer.next_chunk()
+    except BaseException:
+        # Desconexión o cancelación antes del primer chunk: liberar al
+        # thread de render (si no, queda bloqueado en la cola llena)
+        writer.abort()
+        render_task.add_done_callback(_consume_exception)
+        raise
+    if first_chunk is None:
+        # Terminó sin producir bytes: propagar el error del render
+        await render_task
+        raise PDFGenerationError("El generador no produjo contenido")
+
+    async def body() -> AsyncIterator[bytes]:
+        completed = False
+        try:
+            yield first_chunk
+            while (chunk := await writer.next_chunk()) is not None:
+                yield chunk
+            # Errores después del primer byte: cortar la conexión
+            await render_task
+            completed = True
+        except Exception:
+            logger.exception("Error al generar el PDF durante el streaming: %s", filename)
+            raise
+        finally:
+            if not completed:
+                writer.abort()
+                render_task.add_done_callback(_consume_exception)
+
+    response_headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    response_headers.update(headers or {})
+    return StreamingResponse(body(), media_type="application/pdf", headers=response_headers)
+
+
+def _consume_exception(task: asyncio.Future) -> None:
+    """Evita el warning de excepción no recuperada de un render abortado."""
+    if not task.cancelled():
+        task.exception()
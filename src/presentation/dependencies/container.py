@@ -24,19 +24,38 @@ Ejemplo de uso en un endpoint:
 NOTA: En Clean Architecture ortodoxa, NO existe una capa de "services"
 adicional. Los casos de uso (use cases) SON los servicios de aplicación.
 Los controladores/endpoints llaman directamente a los casos de uso.
+
+Los generadores (ReportLab) y los casos de uso se importan dentro de
+cada getter: importar la aplicación no los carga, se cargan con el
+primer request o en el warm-up (ver src/presentation/warmup.py). Así
+un worker recién levantado arranca rápido.
 """
 
+from datetime import timedelta
 from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from src.domain.interfaces import IPDFGenerator
-from src.infrastructure.pdf import ReportLabGenerator
-from src.application.use_cases import GeneratePDFUseCase
-from src.application.use_cases.generar_comprobante_postulacion import (
-    GenerarComprobantePostulacionUseCase,
-)
-from src.application.use_cases.generar_comprobante_contrato import (
-    GenerarComprobanteContratoUseCase,
-)
+from src.infrastructure.config import get_settings
+from src.infrastructure.concurrency import RenderExecutor
+from src.infrastructure.persistence import SQLiteJobRepository
+from src.infrastructure.metrics import InstrumentedPDFGenerator
+from src.infrastructure.profiling import ProfileStore
+from src.application.cache import PDFOutputCache
+from src.application.jobs import JobWorkerPool
+from src.presentation.api.v1.mappers import DOCUMENT_TYPES
+
+if TYPE_CHECKING:
+    from src.application.use_cases import GeneratePDFUseCase
+    from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+    from src.application.use_cases.generar_comprobante_postulacion import (
+        GenerarComprobantePostulacionUseCase,
+    )
+    from src.application.use_cases.generar_comprobante_contrato import (
+        GenerarComprobanteContratoUseCase,
+    )
+    from src.infrastructure.pdf.string_width_cache import StringWidthCache
 
 
 @lru_cache
@@ -45,22 +64,217 @@ def get_pdf_generator() -> IPDFGenerator:
     Obtiene la instancia del generador de PDF.
     
     Usa lru_cache para crear un singleton.
-    Aquí es donde se decide qué implementación usar.
+    Aquí es donde se decide qué implementación usar, según
+    `Settings.pdf_backend`:
+    - "reportlab": ReportLabGenerator en el thread del request
+    - "process_pool": ProcessPoolPDFGenerator (escala con los cores)
+    
+    Con `Settings.pdf_fast_path` se usa CanvasPDFGenerator, que dibuja
+    los documentos de layout fijo directamente sobre el Canvas, y con
+    `Settings.pdf_template_mode` los textos fijos de plantilla se
+    parsean una sola vez (TemplateLayoutCache). Con
+    `Settings.pdf_string_width_cache_entries` > 0 el layout mide los
+    anchos de texto con StringWidthCache.
+    
+    Con `Settings.pdf_metrics_enabled` el generador se envuelve en
+    InstrumentedPDFGenerator (métricas Prometheus de cada render).
     
     Returns:
         Implementación de IPDFGenerator
     """
-    return ReportLabGenerator()
+    settings = get_settings()
+    generator = _create_pdf_generator()
+    if settings.pdf_metrics_enabled:
+        return InstrumentedPDFGenerator(generator)
+    return generator
+
+
+def _create_pdf_generator() -> IPDFGenerator:
+    """Crea el generador de PDF según `Settings.pdf_backend` (sin instrumentar)."""
+    from src.infrastructure.pdf import (
+        CanvasPDFGenerator,
+        ProcessPoolPDFGenerator,
+        ReportLabGenerator,
+        TemplateLayoutCache,
+    )
+    
+    settings = get_settings()
+    template_cache_entries = (
+        settings.pdf_template_cache_entries if settings.pdf_template_mode else 0
+    )
+    string_width_cache_entries = settings.pdf_string_width_cache_entries
+    
+    if settings.pdf_backend == "process_pool":
+        return ProcessPoolPDFGenerator(
+            max_workers=settings.pdf_process_workers,
+            invariant=settings.pdf_deterministic,
+            fast_path=settings.pdf_fast_path,
+            template_cache_entries=template_cache_entries,
+            string_width_cache_entries=string_width_cache_entries,
+        )
+    
+    layout_cache = (
+        TemplateLayoutCache(max_entries=template_cache_entries)
+        if template_cache_entries
+        else None
+    )
+    # Los generadores en thread miden con la caché del proceso
+    get_string_width_cache()
+    generator_class = CanvasPDFGenerator if settings.pdf_fast_path else ReportLabGenerator
+    return generator_class(
+        invariant=settings.pdf_deterministic,
+        layout_cache=layout_cache,
+    )
+
+
+@lru_cache
+def get_string_width_cache() -> "StringWidthCache | None":
+    """
+    Instala la caché de anchos de texto del proceso (una sola vez).
+    
+    Con `Settings.pdf_string_width_cache_entries` = 0 no se instala y
+    el layout mide con el `stringWidth` de ReportLab. Con el backend
+    "process_pool" cada proceso hijo instala la suya.
+    
+    Returns:
+        La caché instalada, o None si está desactivada
+    """
+    from src.infrastructure.pdf.string_width_cache import (
+        StringWidthCache,
+        install_string_width_cache,
+    )
+    
+    entries = get_settings().pdf_string_width_cache_entries
+    if not entries:
+        return None
+    cache = StringWidthCache(max_entries=entries)
+    install_string_width_cache(cache)
+    return cache
+
+
+def warm_up_pdf_generator() -> None:
+    """
+    Prepara el generador de PDF antes de recibir tráfico.
+    
+    Compila las hojas de estilos preset y, con el backend
+    "process_pool", levanta todos los procesos hijos para que el primer
+    request no pague su arranque.
+    """
+    from src.infrastructure.pdf import ProcessPoolPDFGenerator, stylesheet_registry
+    
+    stylesheet_registry.precompile_presets()
+    generator = _unwrap(get_pdf_generator())
+    if isinstance(generator, ProcessPoolPDFGenerator):
+        generator.warm_up()
+
+
+def get_stylesheet_stats() -> dict:
+    """Estadísticas del registro de hojas de estilos compiladas."""
+    from src.infrastructure.pdf import stylesheet_registry
+    
+    return stylesheet_registry.stats()
+
+
+def get_string_width_stats() -> dict | None:
+    """Estadísticas de la caché de anchos de texto (None si no está instalada)."""
+    from src.infrastructure.pdf.string_width_cache import installed_string_width_cache
+    
+    cache = installed_string_width_cache()
+    return cache.stats() if cache is not None else None
+
+
+def shutdown_pdf_generator() -> None:
+    """
+    Libera los recursos del generador de PDF (si fue creado).
+    
+    Se llama en el shutdown de la aplicación para detener
+    el pool de procesos cuando se usa ese backend.
+    """
+    if get_pdf_generator.cache_info().currsize == 0:
+        return
+    from src.infrastructure.pdf import ProcessPoolPDFGenerator
+    
+    generator = _unwrap(get_pdf_generator())
+    if isinstance(generator, ProcessPoolPDFGenerator):
+        generator.shutdown()
+
+
+def _unwrap(generator: IPDFGenerator) -> IPDFGenerator:
+    """Generador concreto detrás del decorator de métricas."""
+    if isinstance(generator, InstrumentedPDFGenerator):
+        return generator.inner
+    return generator
+
+
+@lru_cache
+def get_render_executor() -> RenderExecutor:
+    """
+    Obtiene el executor dedicado a los renders (singleton).
+    
+    Los endpoints renderizan en este executor acotado en lugar del
+    executor por defecto de asyncio: con la cola llena se responde
+    503 en vez de acumular requests.
+    
+    Returns:
+        Instancia de RenderExecutor
+    """
+    settings = get_settings()
+    return RenderExecutor(
+        workers=settings.pdf_render_workers,
+        max_queue=settings.pdf_render_max_queue,
+        retry_after=settings.pdf_render_retry_after,
+    )
+
+
+def shutdown_render_executor() -> None:
+    """Detiene los threads de render (si el executor fue creado)."""
+    if get_render_executor.cache_info().currsize == 0:
+        return
+    get_render_executor().shutdown()
+    get_render_executor.cache_clear()
+
+
+@lru_cache
+def get_pdf_output_cache() -> PDFOutputCache:
+    """
+    Obtiene la caché de PDFs generados (singleton).
+    
+    Es compartida por los casos de uso de comprobantes, así el
+    presupuesto de bytes es global al proceso.
+    
+    Returns:
+        Instancia de PDFOutputCache
+    """
+    return PDFOutputCache(max_bytes=get_settings().pdf_cache_max_bytes)
 
 
 @lru_cache
-def get_generate_pdf_use_case() -> GeneratePDFUseCase:
+def get_profile_store() -> ProfileStore:
+    """
+    Obtiene el anillo de perfiles de render (singleton).
+    
+    Vive en `pdf_temp_dir/profiles`: todos los workers del servidor
+    comparten el directorio.
+    
+    Returns:
+        Instancia de ProfileStore
+    """
+    settings = get_settings()
+    return ProfileStore(
+        Path(settings.pdf_temp_dir) / "profiles",
+        max_profiles=settings.pdf_profile_max_entries,
+    )
+
+
+@lru_cache
+def get_generate_pdf_use_case() -> "GeneratePDFUseCase":
     """
     Obtiene la instancia del caso de uso GeneratePDF.
     
     Construye el grafo de dependencias:
     - GeneratePDFUseCase depende de IPDFGenerator
     - Usamos ReportLabGenerator como implementación
+    - Settings.pdf_deterministic habilita IDs derivados del contenido
     
     En Clean Architecture, los casos de uso son la capa de servicios
     de aplicación. No necesitamos una capa de "services" adicional.
@@ -68,41 +282,150 @@ def get_generate_pdf_use_case() -> GeneratePDFUseCase:
     Returns:
         Instancia de GeneratePDFUseCase
     """
+    from src.application.use_cases import GeneratePDFUseCase
+    
     generator = get_pdf_generator()
-    return GeneratePDFUseCase(generator)
+    return GeneratePDFUseCase(
+        generator,
+        deterministic=get_settings().pdf_deterministic,
+    )
 
 
 @lru_cache
-def get_generar_comprobante_postulacion_use_case() -> GenerarComprobantePostulacionUseCase:
+def get_generar_comprobante_postulacion_use_case() -> (
+    "GenerarComprobantePostulacionUseCase | CachedComprobanteUseCase"
+):
     """
     Obtiene la instancia del caso de uso para generar comprobante de postulación.
     
     Construye el grafo de dependencias:
     - GenerarComprobantePostulacionUseCase depende de IPDFGenerator
     - Usamos ReportLabGenerator como implementación
+    - Si la caché está habilitada, se envuelve con CachedComprobanteUseCase
     
     Returns:
-        Instancia de GenerarComprobantePostulacionUseCase
+        Instancia de GenerarComprobantePostulacionUseCase (posiblemente cacheada)
     """
+    from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+    from src.application.use_cases.generar_comprobante_postulacion import (
+        GenerarComprobantePostulacionUseCase,
+    )
+    
     generator = get_pdf_generator()
-    return GenerarComprobantePostulacionUseCase(generator)
+    use_case = GenerarComprobantePostulacionUseCase(
+        generator,
+        deterministic=get_settings().pdf_deterministic,
+    )
+    if get_settings().pdf_cache_enabled:
+        return CachedComprobanteUseCase(
+            use_case,
+            get_pdf_output_cache(),
+            namespace="comprobante_postulacion",
+        )
+    return use_case
 
 
 @lru_cache
-def get_generar_comprobante_contrato_use_case() -> GenerarComprobanteContratoUseCase:
+def get_generar_comprobante_contrato_use_case() -> (
+    "GenerarComprobanteContratoUseCase | CachedComprobanteUseCase"
+):
     """
     Obtiene la instancia del caso de uso para generar comprobante de contrato.
     
     Construye el grafo de dependencias:
     - GenerarComprobanteContratoUseCase depende de IPDFGenerator
     - Usamos ReportLabGenerator como implementación
+    - Si la caché está habilitada, se envuelve con CachedComprobanteUseCase
     
     Returns:
-        Instancia de GenerarComprobanteContratoUseCase
+        Instancia de GenerarComprobanteContratoUseCase (posiblemente cacheada)
     """
+    from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+    from src.application.use_cases.generar_comprobante_contrato import (
+        GenerarComprobanteContratoUseCase,
+    )
+    
     generator = get_pdf_generator()
-    return GenerarComprobanteContratoUseCase(generator)
+    use_case = GenerarComprobanteContratoUseCase(
+        generator,
+        deterministic=get_settings().pdf_deterministic,
+    )
+    if get_settings().pdf_cache_enabled:
+        return CachedComprobanteUseCase(
+            use_case,
+            get_pdf_output_cache(),
+            namespace="comprobante_contrato",
+        )
+    return use_case
+
 
+@lru_cache
+def get_job_repository() -> SQLiteJobRepository:
+    """
+    Obtiene el repositorio de jobs asíncronos (singleton).
+    
+    Returns:
+        SQLiteJobRepository sobre `Settings.pdf_jobs_db_path`
+    """
+    return SQLiteJobRepository(get_settings().pdf_jobs_db_path)
+
+
+@lru_cache
+def get_job_worker_pool() -> JobWorkerPool:
+    """
+    Obtiene el pool de workers de jobs asíncronos (singleton).
+    
+    Cada tipo de comprobante tiene un handler que valida el payload
+    guardado, lo convierte a DTO y ejecuta el mismo use case (con su
+    caché) que el endpoint síncrono. Los renders pasan por el
+    RenderExecutor compartido.
+    
+    Returns:
+        Instancia de JobWorkerPool (los workers arrancan en el lifespan)
+    """
+    settings = get_settings()
+    use_cases = {
+        "comprobante_postulacion": get_generar_comprobante_postulacion_use_case(),
+        "comprobante_contrato": get_generar_comprobante_contrato_use_case(),
+    }
+    
+    def make_handler(tipo: str):
+        schema, to_dto = DOCUMENT_TYPES[tipo]
+        use_case = use_cases[tipo]
+        
+        def handler(payload: dict[str, Any]):
+            return use_case.execute(to_dto(schema.model_validate(payload)))
+        
+        return handler
+    
+    return JobWorkerPool(
+        get_job_repository(),
+        handlers={tipo: make_handler(tipo) for tipo in use_cases},
+        executor=get_render_executor(),
+        workers=settings.pdf_job_workers,
+        max_attempts=settings.pdf_job_max_attempts,
+        retention=timedelta(hours=settings.pdf_job_retention_hours),
+        lease=timedelta(seconds=settings.pdf_job_lease_seconds),
+        retry_backoff=settings.pdf_job_retry_backoff_seconds,
+    )
+
+
+async def start_job_worker_pool() -> None:
+    """Arranca los workers de jobs y retoma los pendientes de la base."""
+    await get_job_worker_pool().start()
+
+
+async def stop_job_worker_pool() -> None:
+    """
+    Detiene los workers de jobs (si el pool fue creado).
+    
+    Los jobs en curso quedan en la base y se retoman al reiniciar.
+    """
+    if get_job_worker_pool.cache_info().currsize == 0:
+        return
+    await get_job_worker_pool().stop()
+    # El pool referencia al RenderExecutor, que también se detiene
+    get_job_worker_pool.cache_clear()
 
 
 # ================================
@@ -113,7 +436,7 @@ def get_generar_comprobante_contrato_use_case() -> GenerarComprobanteContratoUse
 # def get_mock_generator() -> IPDFGenerator:
 #     return MockPDFGenerator()
 #
-# Para producción con otro generador:
+# Para producción con otro generador (ver get_pdf_generator):
 # def get_pdf_generator() -> IPDFGenerator:
 #     if settings.pdf_backend == "weasyprint":
 #         return WeasyPrintGenerator()
@@ -0,0 +1,9 @@
+# ================================
+# Middlewares
+# ================================
+# Middlewares ASGI propios del servicio.
+# ================================
+
+from .timing import StageTimingMiddleware
+
+__all__ = ["StageTimingMiddleware"]
@@ -0,0 +1,65 @@
+"""
+Stage Timing Middleware
+=======================
+
+Activa el timer de etapas (ver stage_timing) para cada request HTTP.
+
+- Al enviar los headers agrega `Server-Timing` con las etapas medidas
+  hasta ese momento y el total transcurrido. En las respuestas en
+  streaming los headers salen antes de terminar el render: `doc_build`
+  y las etapas siguientes no llegan al header pero sí a los histogramas
+- Al terminar el request (incluido el cuerpo en streaming) vuelca todas
+  las etapas y el total en `stage_histograms`, solo para las rutas de
+  generación de PDFs: los probes (/health, /ready, /metrics), admin y
+  jobs responden en microsegundos y diluirían los percentiles de `total`
+
+Es ASGI puro (no BaseHTTPMiddleware) para no bufferear las respuestas
+en streaming ni cambiar el manejo de desconexiones.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.utils.stage_timing import stage_histograms, start_timer, stop_timer
+
+
+# Rutas cuyos tiempos van a los histogramas (todos los renders síncronos)
+OBSERVED_PREFIX = "/api/v1/pdf/generate"
+
+
+class StageTimingMiddleware:
+    """Mide las etapas de cada request y las publica en Server-Timing."""
+
+    def __init__(self, app: ASGIApp, observed_prefix: str = OBSERVED_PREFIX) -> None:
+        """
+        Args:
+            app: Aplicación ASGI envuelta
+            observed_prefix: Prefijo de las rutas que alimentan los histogramas
+        """
+        self.app = app
+        self.observed_prefix = observed_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = start_timer()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - timer.started_at
+                entries = timer.server_timing()
+                total = f"total;dur={elapsed * 1000:.1f}"
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f"{entries}, {total}" if entries else total)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if scope["path"].startswith(self.observed_prefix):
+                stage_histograms.observe_timer(timer, time.perf_counter() - timer.started_at)
+            stop_timer()
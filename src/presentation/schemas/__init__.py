@@ -13,6 +13,14 @@ from .pdf_schemas import (
     PDFStyleSchema,
     ErrorResponse,
 )
+from .batch_schemas import (
+    BatchGenerateRequest,
+    BatchItemSchema,
+)
+from .job_schemas import (
+    JobCreateRequest,
+    JobResponse,
+)
 
 __all__ = [
     "PDFGenerateRequest",
@@ -21,4 +29,8 @@ __all__ = [
     "PDFTableSchema",
     "PDFStyleSchema",
     "ErrorResponse",
+    "BatchGenerateRequest",
+    "BatchItemSchema",
+    "JobCreateRequest",
+    "JobResponse",
 ]
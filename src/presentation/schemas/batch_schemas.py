@@ -0,0 +1,66 @@
+"""
+Batch Schemas
+=============
+
+Schemas Pydantic del endpoint de generación por lotes.
+
+Cada item trae el tipo de comprobante y su payload SIN validar: el
+payload se valida item por item contra el schema del comprobante, así
+un item inválido queda registrado en el manifiesto del ZIP en lugar
+de rechazar el lote completo.
+"""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+BatchDocumentType = Literal["comprobante_postulacion", "comprobante_contrato"]
+
+
+class BatchItemSchema(BaseModel):
+    """Un documento a generar dentro del lote."""
+
+    tipo: BatchDocumentType = Field(
+        ...,
+        description="Tipo de comprobante a generar",
+    )
+    id: str | None = Field(
+        default=None,
+        max_length=100,
+        description="Identificador del cliente (se copia al manifiesto)",
+    )
+    data: dict[str, Any] = Field(
+        ...,
+        description="Payload del comprobante (mismo formato que el endpoint individual)",
+    )
+
+
+class BatchGenerateRequest(BaseModel):
+    """
+    Request para generar muchos comprobantes en un solo llamado.
+
+    Este es el schema que recibe el endpoint POST /api/v1/pdf/generate/batch.
+    """
+
+    items: list[BatchItemSchema] = Field(
+        ...,
+        min_length=1,
+        description="Documentos a generar",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "items": [
+                        {
+                            "tipo": "comprobante_postulacion",
+                            "id": "postulacion-5432",
+                            "data": {"estudiante": {"nombre": "Juan"}, "...": "..."},
+                        }
+                    ]
+                }
+            ]
+        }
+    }
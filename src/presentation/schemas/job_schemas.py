@@ -0,0 +1,45 @@
+"""
+Job Schemas
+===========
+
+Schemas Pydantic de la API de jobs asíncronos (/api/v1/jobs).
+
+El payload (`data`) tiene el mismo formato que el endpoint síncrono
+del tipo elegido y se valida al crear el job: un job aceptado solo
+puede fallar por errores de render, no de datos.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .batch_schemas import BatchDocumentType
+
+
+class JobCreateRequest(BaseModel):
+    """Request para crear un job de generación."""
+
+    tipo: BatchDocumentType = Field(
+        ...,
+        description="Tipo de comprobante a generar",
+    )
+    data: dict[str, Any] = Field(
+        ...,
+        description="Payload del comprobante (mismo formato que el endpoint síncrono)",
+    )
+
+
+class JobResponse(BaseModel):
+    """Estado de un job."""
+
+    id: str = Field(..., description="ID del job")
+    tipo: str = Field(..., description="Tipo de comprobante")
+    status: str = Field(..., description="pending | running | succeeded | failed")
+    attempts: int = Field(..., description="Intentos de render realizados")
+    filename: str | None = Field(default=None, description="Nombre del PDF (si terminó bien)")
+    error: dict[str, Any] | None = Field(default=None, description="Error (si falló)")
+    created_at: datetime = Field(..., description="Fecha de creación (UTC)")
+    updated_at: datetime = Field(..., description="Último cambio de estado (UTC)")
+    status_url: str = Field(..., description="URL para consultar el estado")
+    result_url: str | None = Field(default=None, description="URL de descarga (si terminó bien)")
@@ -44,7 +44,7 @@ IMPORTANTE: Diferencia entre Schemas y DTOs en Clean Architecture
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class PDFTableSchema(BaseModel):
@@ -65,6 +65,47 @@ class PDFTableSchema(BaseModel):
         default=None,
         description="Título opcional de la tabla",
     )
+    columns: list[list[str]] | None = Field(
+        default=None,
+        description=(
+            "Datos por columna, alternativa compacta a rows para reportes grandes "
+            "(una lista por columna en lugar de una por fila)"
+        ),
+        examples=[[["Producto A", "Producto B"], ["10", "5"], ["$100", "$50"]]],
+    )
+    
+    @property
+    def row_count(self) -> int:
+        """Cantidad de filas (de rows o de columns)."""
+        if self.columns is not None:
+            return len(self.columns[0]) if self.columns else 0
+        return len(self.rows)
+    
+    @field_validator("columns")
+    @classmethod
+    def validate_columns(cls, v: list[list[str]] | None, info) -> list[list[str]] | None:
+        """Valida una columna por header y todas con el mismo largo."""
+        if v is None:
+            return v
+        
+        headers = info.data.get("headers", [])
+        if headers and len(v) != len(headers):
+            raise ValueError(
+                f"Hay {len(v)} columnas, pero los headers tienen {len(headers)}"
+            )
+        lengths = {len(column) for column in v}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Las columnas tienen distinta cantidad de filas: {sorted(lengths)}"
+            )
+        return v
+    
+    @model_validator(mode="after")
+    def validate_rows_or_columns(self) -> "PDFTableSchema":
+        """rows y columns son excluyentes."""
+        if self.columns is not None and self.rows:
+            raise ValueError("Enviar los datos en rows o en columns, no en ambos")
+        return self
     
     @field_validator("rows")
     @classmethod
@@ -0,0 +1,165 @@
+"""
+Warm-up
+=======
+
+Calentamiento del proceso antes de recibir tráfico.
+
+Los primeros renders de un worker recién levantado son mucho más
+lentos: ReportLab carga las métricas de las fuentes a demanda, las
+hojas de estilos se compilan por primera vez, el logo se decodifica y
+pydantic arma sus validadores. El warm-up paga todo eso con un
+comprobante de postulación y uno de contrato sintéticos que recorren
+el camino real (schema → DTO → use case → generador).
+
+Mientras corre, GET /ready responde 503: el balanceador no manda
+tráfico a un worker frío. Un warm-up fallido se registra pero no
+bloquea la readiness (es una optimización, no un chequeo de salud).
+
+Los renders sintéticos no pasan por la caché de PDFs, pero sí cuentan
+en las métricas de render (/metrics) como cualquier otro.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from src.presentation.api.v1.mappers import DOCUMENT_TYPES
+from src.presentation.dependencies.container import (
+    get_generar_comprobante_contrato_use_case,
+    get_generar_comprobante_postulacion_use_case,
+    warm_up_pdf_generator,
+)
+
+
+# ================================
+# Documentos sintéticos
+# ================================
+
+_COMPROBANTE_BASE: dict[str, Any] = {
+    "estudiante": {
+        "nombre": "Warm",
+        "apellido": "Up",
+        "dni": "10000000",
+        "email": "warmup@example.com",
+        "cuil": "20-10000000-1",
+        "fecha_nacimiento": "2000-01-01",
+        "tipo_dni": "DNI",
+    },
+    "universidad": {
+        "nombre": "Universidad",
+        "direccion": "Dirección 123",
+        "codigo_postal": 5000,
+        "correo": "universidad@example.com",
+        "telefono": "+54 351 0000000",
+    },
+    "carrera": {
+        "nombre": "Carrera",
+        "codigo": "C-1",
+        "descripcion": "Carrera",
+        "plan_estudios": "Plan 2020",
+    },
+    "empresa": {
+        "nombre": "Empresa",
+        "direccion": "Dirección 456",
+        "codigo_postal": 5000,
+        "correo": "empresa@example.com",
+        "telefono": "+54 351 0000001",
+        "codigo": 1,
+    },
+    "proyecto": {
+        "nombre": "Proyecto",
+        "descripcion": "Proyecto de pasantía",
+        "numero": 1,
+        "estado": "ACTIVO",
+        "fecha_inicio": "2026-01-01",
+        "fecha_fin": "2026-06-30",
+    },
+    "puesto": {
+        "nombre": "Puesto",
+        "descripcion": "Puesto de pasantía",
+        "codigo": 1,
+        "horas_dedicadas": 20.0,
+    },
+    "postulacion": {
+        "numero": 1,
+        "fecha": "2026-01-01T10:00:00",
+        "estado": "PENDIENTE",
+        "cantidad_materias_aprobadas": 20,
+        "cantidad_materias_regulares": 25,
+    },
+}
+
+SYNTHETIC_PAYLOADS: dict[str, dict[str, Any]] = {
+    "comprobante_postulacion": _COMPROBANTE_BASE,
+    "comprobante_contrato": {
+        **_COMPROBANTE_BASE,
+        "contrato": {
+            "numero": 1,
+            "fecha_inicio": "2026-01-01T00:00:00",
+            "fecha_fin": "2026-06-30T00:00:00",
+            "fecha_emision": "2026-01-01T00:00:00",
+            "estado": "ACTIVO",
+        },
+    },
+}
+
+
+# ================================
+# Estado y ejecución
+# ================================
+
+@dataclass
+class WarmUpState:
+    """Estado del warm-up (readiness del proceso)."""
+    ready: bool = False
+    duration_ms: float | None = None
+    documents_ms: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def warm_up_renderers() -> dict[str, float]:
+    """
+    Renderiza los documentos sintéticos con los use cases reales.
+
+    Bloqueante: se llama desde un thread.
+
+    Returns:
+        Milisegundos de cada render (schema → PDF)
+    """
+    from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+    
+    warm_up_pdf_generator()
+    use_cases = {
+        "comprobante_postulacion": get_generar_comprobante_postulacion_use_case(),
+        "comprobante_contrato": get_generar_comprobante_contrato_use_case(),
+    }
+
+    timings = {}
+    for tipo, payload in SYNTHETIC_PAYLOADS.items():
+        schema, to_dto = DOCUMENT_TYPES[tipo]
+        use_case = use_cases[tipo]
+        if isinstance(use_case, CachedComprobanteUseCase):
+            # El PDF sintético no debe ocupar la caché
+            use_case = use_case.inner
+
+        start = time.perf_counter()
+        use_case.execute(to_dto(schema.model_validate(payload)))
+        timings[tipo] = round((time.perf_counter() - start) * 1000, 3)
+    return timings
+
+
+async def run_warm_up(state: WarmUpState) -> None:
+    """Ejecuta el warm-up fuera del event loop y marca el proceso como listo."""
+    start = time.perf_counter()
+    try:
+        state.documents_ms = await asyncio.to_thread(warm_up_renderers)
+    except Exception as e:
+        state.error = f"{type(e).__name__}: {e}"
+        print(f"[!] Warm-up failed: {state.error}")
+    state.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+    state.ready = True
+    print(f"[*] Warm-up: {state.duration_ms:.0f} ms {state.documents_ms}")
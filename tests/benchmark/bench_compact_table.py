@@ -0,0 +1,76 @@
+"""
+Benchmark - Tabla por Columnas
+==============================
+
+Compara una tabla de reporte enviada por filas (`rows`) contra la misma
+tabla por columnas (`columns`) a lo largo de schema → DTO → entidad:
+
+- Tiempo de validar el JSON y construir la entidad
+- Memoria retenida por la entidad (tracemalloc, sin contar el JSON)
+
+Uso:
+    python tests/benchmark/bench_compact_table.py
+"""
+import json
+import time
+import tracemalloc
+
+from src.application.use_cases import GeneratePDFUseCase
+from src.infrastructure.pdf import ReportLabGenerator
+from src.presentation.api.v1.mappers import to_pdf_request_dto
+from src.presentation.schemas import PDFGenerateRequest
+
+
+ROW_COUNTS = [10_000, 100_000]
+HEADERS = ["Legajo", "Apellido y nombre", "Empresa", "Estado", "Fecha"]
+
+
+def row_values(i: int) -> list[str]:
+    return [str(10_000 + i), f"Apellido{i}, Nombre{i}", f"Empresa {i % 37}", "aceptada", "2024-03-01"]
+
+
+def report_json(rows: int, columnar: bool) -> bytes:
+    """Body de /pdf/generate con una tabla de `rows` filas."""
+    data = [row_values(i) for i in range(rows)]
+    table = {"headers": HEADERS}
+    if columnar:
+        table["columns"] = [list(column) for column in zip(*data)]
+    else:
+        table["rows"] = data
+    return json.dumps({
+        "title": "Reporte",
+        "sections": [{"title": "Detalle", "tables": [table]}],
+    }).encode("utf-8")
+
+
+def build_entity(body: bytes, use_case: GeneratePDFUseCase):
+    """schema → DTO → entidad, como el endpoint."""
+    return use_case._build_document(to_pdf_request_dto(PDFGenerateRequest.model_validate_json(body)))
+
+
+def main() -> None:
+    use_case = GeneratePDFUseCase(ReportLabGenerator())
+
+    print(f"{'Filas':>8}  {'Formato':<9} {'Tiempo':>8} {'Retenido MiB':>13} {'Pico MiB':>9}")
+    for rows in ROW_COUNTS:
+        for name, columnar in (("rows", False), ("columns", True)):
+            body = report_json(rows, columnar)
+
+            start = time.perf_counter()
+            build_entity(body, use_case)
+            elapsed = time.perf_counter() - start
+
+            tracemalloc.start()
+            document = build_entity(body, use_case)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del document
+
+            print(
+                f"{rows:>8}  {name:<9} {elapsed * 1000:>6.0f}ms "
+                f"{retained / 2**20:>13.1f} {peak / 2**20:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark - Fábrica de Flowables
+================================
+
+Cuenta las asignaciones de memoria al armar los flowables de un
+comprobante de contrato y de postulación (todas las secciones, sin
+layout):
+
+- Original: TableStyle, anchos de columna y Spacer nuevos por tabla y
+  por párrafo (como lo hacía `_build_table`)
+- Fábrica: estilos precompilados, anchos constantes y espaciadores
+  compartidos (`flowables`)
+
+Se reporta la cantidad de bloques y los KiB que retienen los
+flowables de un documento (tracemalloc) y el tiempo de armado.
+
+Uso:
+    python tests/benchmark/bench_flowables.py
+"""
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from unittest import mock
+
+from reportlab.lib.units import mm
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from src.application.use_cases.generar_comprobante_contrato import GenerarComprobanteContratoUseCase
+from src.application.use_cases.generar_comprobante_postulacion import GenerarComprobantePostulacionUseCase
+from src.domain.value_objects import PDFStyle
+from src.infrastructure.pdf import ReportLabGenerator, reportlab_generator
+from src.infrastructure.pdf.flowables import DATA_TABLE_STYLE, SIGNATURE_TABLE_STYLE
+from src.infrastructure.pdf.paged_table import PagedTable
+from src.presentation.api.v1.mappers import DOCUMENT_TYPES
+from src.presentation.warmup import SYNTHETIC_PAYLOADS
+
+
+ITERATIONS = 500
+USE_CASES = {
+    "comprobante_contrato": GenerarComprobanteContratoUseCase,
+    "comprobante_postulacion": GenerarComprobantePostulacionUseCase,
+}
+
+
+# ================================
+# Implementación original
+# ================================
+
+def original_spacer(height: float) -> Spacer:
+    return Spacer(1, height)
+
+
+def original_signature_table(rows, columns, style=None) -> Table:
+    table = Table(list(rows), colWidths=[77.5*mm, 77.5*mm] if columns == 2 else None, hAlign="CENTER")
+    table.setStyle(TableStyle(list(SIGNATURE_TABLE_STYLE.getCommands())))
+    return table
+
+
+def original_data_table(headers, rows, style=None) -> Table:
+    data = [headers]
+    data.extend(rows)
+    table = Table(data, colWidths=[45*mm, 110*mm] if len(headers) == 2 else None, hAlign="LEFT")
+    table.setStyle(TableStyle(list(DATA_TABLE_STYLE.getCommands())))
+    return table
+
+
+def original_paged_data_table(headers, rows, style=None) -> PagedTable:
+    return PagedTable(headers, rows, TableStyle(list(DATA_TABLE_STYLE.getCommands())),
+                      font_name="Times-Roman", font_size=10, padding=4)
+
+
+@contextmanager
+def original_factory():
+    """Reemplaza la fábrica por el armado original dentro del generador."""
+    with mock.patch.multiple(
+        reportlab_generator,
+        spacer=original_spacer,
+        signature_table=original_signature_table,
+        data_table=original_data_table,
+        paged_data_table=original_paged_data_table,
+    ):
+        yield
+
+
+# ================================
+# Medición
+# ================================
+
+def build_flowables(generator: ReportLabGenerator, document) -> list:
+    """Todos los flowables del documento (título y secciones)."""
+    styles = generator._create_styles(PDFStyle.default())
+    elements = generator._build_elements(document, styles.style)[:2]  # sin el SectionFeed
+    for section in document.iter_sections():
+        elements.extend(generator._build_section(section, styles))
+    return elements
+
+
+def retained(generator: ReportLabGenerator, document) -> tuple[int, int]:
+    """(bloques, bytes) que retienen los flowables de un documento."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    elements = build_flowables(generator, document)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    del elements
+    blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+    return blocks, size
+
+
+def timing(generator: ReportLabGenerator, document) -> float:
+    """Mediana del armado en µs."""
+    times = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        build_flowables(generator, document)
+        times.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    generator = ReportLabGenerator()
+
+    print("\n" + "=" * 72)
+    print("BENCHMARK - FÁBRICA DE FLOWABLES")
+    print("=" * 72)
+    print(f"{'Documento':<26} {'Armado':<9} {'Bloques':>8} {'KiB':>8} {'Tiempo':>10}")
+
+    for tipo, use_case_class in USE_CASES.items():
+        schema, to_dto = DOCUMENT_TYPES[tipo]
+        dto = to_dto(schema.model_validate(SYNTHETIC_PAYLOADS[tipo]))
+        document = use_case_class(generator)._build_document(dto)
+        build_flowables(generator, document)  # calentamiento
+
+        results = {}
+        for label in ("original", "fábrica"):
+            if label == "original":
+                with original_factory():
+                    results[label] = (*retained(generator, document), timing(generator, document))
+            else:
+                results[label] = (*retained(generator, document), timing(generator, document))
+            blocks, size, micros = results[label]
+            print(f"{tipo:<26} {label:<9} {blocks:>8} {size / 1024:>8.1f} {micros:>8.0f}µs")
+
+        drop = 1 - results["fábrica"][0] / results["original"][0]
+        print(f"{'':<26} bloques retenidos: -{drop:.0%}")
+
+    print("\n✅ Benchmark completado!\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark - Tablas Grandes
+==========================
+
+Mide tiempo de render y pico de memoria de un reporte con una sola
+tabla de 1k, 10k y 100k filas:
+
+- Clásica: un único `Table` de ReportLab con todas las filas
+- Paginada: `PagedTable` (modo por encima de LARGE_TABLE_ROWS)
+
+La tabla clásica con 100k filas tarda varios minutos, así que solo se
+mide con --classic-100k. El pico de memoria (tracemalloc, varias veces
+más lento) se mide con --memory.
+
+Uso:
+    python tests/benchmark/bench_large_table.py [--classic-100k] [--memory]
+"""
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.infrastructure.pdf import ReportLabGenerator
+
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+HEADERS = ["Legajo", "Apellido y nombre", "Empresa", "Estado", "Fecha"]
+
+
+def build_document(rows: int) -> PDFDocument:
+    """Reporte con una sección y una tabla de `rows` filas."""
+    section = PDFSection(title="Detalle de postulaciones")
+    section.elements.append(PDFTable(
+        headers=HEADERS,
+        rows=[
+            [str(10_000 + i), f"Apellido{i}, Nombre{i}", f"Empresa {i % 37}", "aceptada", "2024-03-01"]
+            for i in range(rows)
+        ],
+    ))
+    document = PDFDocument(title="Reporte de Postulaciones")
+    document.add_section(section)
+    return document
+
+
+def render(generator: ReportLabGenerator, document: PDFDocument) -> tuple[float, int]:
+    """Renderiza y retorna (segundos, bytes del PDF)."""
+    buffer = BytesIO()
+    start = time.perf_counter()
+    generator.generate_to_stream(document, buffer)
+    return time.perf_counter() - start, buffer.tell()
+
+
+def peak_memory(generator: ReportLabGenerator, document: PDFDocument) -> float:
+    """Pico de memoria del render en MiB (tracemalloc; corrida aparte, es lenta)."""
+    tracemalloc.start()
+    generator.generate_to_stream(document, BytesIO())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main() -> None:
+    classic_100k = "--classic-100k" in sys.argv
+    with_memory = "--memory" in sys.argv
+
+    paged = ReportLabGenerator()
+    classic = ReportLabGenerator()
+    classic.LARGE_TABLE_ROWS = sys.maxsize
+
+    print(f"{'Filas':>8}  {'Modo':<9} {'Tiempo':>9} {'µs/fila':>12} {'Pico MiB':>9} {'PDF KiB':>8}")
+    for rows in ROW_COUNTS:
+        document = build_document(rows)
+        modes = [("paginada", paged)]
+        if rows < 100_000 or classic_100k:
+            modes.insert(0, ("clásica", classic))
+        for name, generator in modes:
+            elapsed, size = render(generator, document)
+            peak = peak_memory(generator, document) if with_memory else float("nan")
+            print(
+                f"{rows:>8}  {name:<9} {elapsed:>8.2f}s {elapsed * 1e6 / rows:>12.1f} "
+                f"{peak:>9.1f} {size / 1024:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
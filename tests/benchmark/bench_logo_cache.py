@@ -0,0 +1,99 @@
+"""
+Micro-Benchmark - Caché del Logo
+================================
+
+Mide el costo de dibujar el logo del header con `canvas.drawImage(path)`
+(decodifica el PNG en cada documento) contra la imagen precodificada
+de `image_cache` (se decodifica una vez por proceso).
+
+Escenarios:
+- Por documento: un canvas nuevo por iteración, 1 página
+- Por página: un mismo canvas con varias páginas
+
+Uso:
+    python tests/benchmark/bench_logo_cache.py
+"""
+import statistics
+import time
+from io import BytesIO
+from typing import Callable, List
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen.canvas import Canvas
+
+from src.application.utils.assets import get_logo_path
+from src.infrastructure.pdf.image_cache import draw_cached_image, get_cached_image
+
+
+ITERATIONS = 200
+PAGES_PER_DOCUMENT = 10
+
+
+def draw_with_path(canvas: Canvas, logo_path: str) -> None:
+    """Dibuja el logo como lo hacía el header original."""
+    canvas.drawImage(
+        logo_path, 22 * mm, 260 * mm,
+        width=42 * mm, height=14 * mm,
+        preserveAspectRatio=True, anchor="nw",
+    )
+
+
+def draw_with_cache(canvas: Canvas, logo_path: str) -> None:
+    """Dibuja el logo usando la imagen precodificada."""
+    draw_cached_image(
+        canvas, get_cached_image(logo_path), 22 * mm, 260 * mm,
+        width=42 * mm, height=14 * mm,
+        preserveAspectRatio=True, anchor="nw",
+    )
+
+
+def render_document(draw: Callable[[Canvas, str], None], logo_path: str, pages: int) -> float:
+    """Renderiza un documento completo y retorna el tiempo en ms."""
+    start = time.perf_counter()
+    canvas = Canvas(BytesIO(), pagesize=A4)
+    for _ in range(pages):
+        draw(canvas, logo_path)
+        canvas.showPage()
+    canvas.save()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(draw: Callable[[Canvas, str], None], logo_path: str, pages: int) -> List[float]:
+    """Ejecuta ITERATIONS renders (con uno previo de calentamiento)."""
+    render_document(draw, logo_path, pages)
+    return [render_document(draw, logo_path, pages) for _ in range(ITERATIONS)]
+
+
+def print_stats(times: List[float], label: str) -> None:
+    """Imprime estadísticas de los tiempos medidos."""
+    print(f"{label:<40} P50 {statistics.median(times):7.3f}ms   "
+          f"media {statistics.mean(times):7.3f}ms   mín {min(times):7.3f}ms")
+
+
+def main() -> None:
+    """Ejecuta los escenarios y muestra la comparación."""
+    logo_path = get_logo_path()
+    if logo_path is None:
+        print("✗ No se encontró el logo UTN")
+        return
+
+    print("\n" + "=" * 60)
+    print("MICRO-BENCHMARK - CACHÉ DEL LOGO")
+    print("=" * 60)
+
+    for pages in (1, PAGES_PER_DOCUMENT):
+        path_times = run(draw_with_path, logo_path, pages)
+        cache_times = run(draw_with_cache, logo_path, pages)
+
+        print(f"\n📄 Documento de {pages} página(s), {ITERATIONS} iteraciones")
+        print_stats(path_times, "  drawImage(path)")
+        print_stats(cache_times, "  image_cache")
+        speedup = statistics.median(path_times) / statistics.median(cache_times)
+        print(f"  Speedup: {speedup:.1f}x")
+
+    print("\n✅ Benchmark completado!\n")
+
+
+if __name__ == "__main__":
+    main()
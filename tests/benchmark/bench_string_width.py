@@ -0,0 +1,96 @@
+"""
+Benchmark - Caché de Anchos de Texto
+====================================
+
+Mide el render del comprobante de contrato por Platypus (sin fast-path
+ni modo plantilla, así todo el texto pasa por el corte de líneas) con
+el `stringWidth` de ReportLab y con StringWidthCache:
+
+- Tiempo de render (P50 y media)
+- Cantidad de mediciones de texto por documento y hit ratio
+
+Uso:
+    python tests/benchmark/bench_string_width.py
+"""
+import statistics
+import time
+
+from reportlab.pdfbase import pdfmetrics
+
+from src.application.use_cases.generar_comprobante_contrato import GenerarComprobanteContratoUseCase
+from src.infrastructure.pdf import ReportLabGenerator, StringWidthCache
+from src.infrastructure.pdf.string_width_cache import (
+    install_string_width_cache,
+    uninstall_string_width_cache,
+)
+from src.presentation.api.v1.mappers import DOCUMENT_TYPES
+from src.presentation.warmup import SYNTHETIC_PAYLOADS
+
+
+ITERATIONS = 100
+TIPO = "comprobante_contrato"
+
+
+def contract_document(generator: ReportLabGenerator):
+    """Comprobante de contrato sintético (el mismo del warm-up)."""
+    schema, to_dto = DOCUMENT_TYPES[TIPO]
+    dto = to_dto(schema.model_validate(SYNTHETIC_PAYLOADS[TIPO]))
+    return GenerarComprobanteContratoUseCase(generator)._build_document(dto)
+
+
+def run(generator: ReportLabGenerator, document) -> list[float]:
+    """ITERATIONS renders (con uno previo de calentamiento), en ms."""
+    generator.generate(document)
+    times = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        generator.generate(document)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def measurements_per_document(generator: ReportLabGenerator, document) -> int:
+    """Cantidad de llamadas a stringWidth de un render."""
+    cache = StringWidthCache()
+    install_string_width_cache(cache)
+    generator.generate(document)
+    stats = cache.stats()
+    uninstall_string_width_cache()
+    return stats["hits"] + stats["misses"]
+
+
+def print_stats(times: list[float], label: str) -> None:
+    print(f"{label:<28} P50 {statistics.median(times):7.2f}ms   "
+          f"media {statistics.mean(times):7.2f}ms   mín {min(times):7.2f}ms")
+
+
+def main() -> None:
+    generator = ReportLabGenerator()
+    document = contract_document(generator)
+
+    print("\n" + "=" * 70)
+    print("BENCHMARK - CACHÉ DE ANCHOS DE TEXTO (comprobante de contrato)")
+    print("=" * 70)
+    print(f"Mediciones de texto por documento: {measurements_per_document(generator, document)}")
+
+    uninstall_string_width_cache()
+    assert pdfmetrics.stringWidth.__module__ == "reportlab.pdfbase.pdfmetrics"
+    original_times = run(generator, document)
+
+    cache = StringWidthCache()
+    install_string_width_cache(cache)
+    cached_times = run(generator, document)
+    uninstall_string_width_cache()
+
+    print(f"\n📄 {ITERATIONS} renders")
+    print_stats(original_times, "  stringWidth de ReportLab")
+    print_stats(cached_times, "  StringWidthCache")
+    saved = statistics.median(original_times) - statistics.median(cached_times)
+    print(f"  Ahorro: {saved:.2f}ms por documento "
+          f"({saved / statistics.median(original_times):.0%}), hit ratio {cache.stats()['hit_ratio']:.1%}")
+
+    print("\n✅ Benchmark completado!\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,12 @@ from src.domain.entities import PDFDocument, PDFSection, PDFTable
 from src.domain.value_objects import PDFStyle
 from src.domain.interfaces import IPDFGenerator
 from src.application.dto import PDFRequestDTO, PDFSectionDTO, PDFTableDTO
+from src.infrastructure.pdf.string_width_cache import (
+    StringWidthCache,
+    install_string_width_cache,
+    installed_string_width_cache,
+    uninstall_string_width_cache,
+)
 
 
 # ================================
@@ -51,6 +57,27 @@ def sample_table() -> PDFTable:
     )
 
 
+@pytest.fixture(params=["sin_cache", "con_cache"])
+def string_width_cache(request) -> StringWidthCache | None:
+    """
+    Corre el test midiendo textos sin y con StringWidthCache.
+    
+    Al terminar deja el `stringWidth` del proceso como lo encontró.
+    """
+    previous = installed_string_width_cache()
+    cache = None
+    if request.param == "con_cache":
+        cache = StringWidthCache()
+        install_string_width_cache(cache)
+    else:
+        uninstall_string_width_cache()
+    yield cache
+    if previous is None:
+        uninstall_string_width_cache()
+    else:
+        install_string_width_cache(previous)
+
+
 # ================================
 # Application Fixtures
 # ================================
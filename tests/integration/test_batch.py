@@ -0,0 +1,145 @@
+"""
+Test de integración de la generación por lotes
+==============================================
+
+Verifica que POST /api/v1/pdf/generate/batch responde un ZIP con un
+PDF por item válido y un manifiesto que registra los errores por item
+sin cortar el lote.
+"""
+import json
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import Mock
+
+from fastapi.testclient import TestClient
+
+from src.application.use_cases.generar_comprobante_postulacion import (
+    GenerarComprobanteResult,
+)
+from src.domain.exceptions import PDFGenerationError, ServiceOverloadedError
+from src.infrastructure.concurrency import RenderExecutor
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation.api.v1.batch import BatchJob, stream_batch_zip
+from src.presentation.dependencies.container import (
+    get_generar_comprobante_postulacion_use_case,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/pdf/generate/batch"
+
+
+def _item(numero: int, **overrides) -> dict:
+    data = comprobante_postulacion_dict()
+    data["postulacion"]["numero"] = numero
+    return {"tipo": "comprobante_postulacion", "id": f"p-{numero}", "data": data, **overrides}
+
+
+def _open_zip(response) -> tuple[zipfile.ZipFile, dict]:
+    archive = zipfile.ZipFile(BytesIO(response.content))
+    return archive, json.loads(archive.read("manifest.json"))
+
+
+def test_batch_returns_zip_with_pdfs_and_manifest():
+    """Los items válidos se renderizan; el inválido queda en el manifiesto."""
+    items = [_item(1), _item(2), {"tipo": "comprobante_postulacion", "id": "roto", "data": {}}]
+
+    response = TestClient(create_app()).post(URL, json={"items": items})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    archive, manifest = _open_zip(response)
+    assert (manifest["total"], manifest["ok"], manifest["errors"]) == (3, 2, 1)
+
+    ok_items = [item for item in manifest["items"] if item["status"] == "ok"]
+    for item in ok_items:
+        assert archive.read(item["filename"]).startswith(b"%PDF")
+    assert [item["id"] for item in ok_items] == ["p-1", "p-2"]
+
+    invalid = manifest["items"][2]
+    assert (invalid["index"], invalid["id"], invalid["status"]) == (2, "roto", "error")
+    assert invalid["error"]["error"] == "VALIDATION_ERROR"
+
+
+def test_render_error_is_recorded_without_failing_the_batch():
+    """Un render que falla se registra y el resto del lote sigue."""
+    def execute(comprobante, style=None):
+        if comprobante.postulacion.numero == 2:
+            raise PDFGenerationError("fallo de render")
+        return GenerarComprobanteResult(
+            content=b"%PDF-1.4 mock",
+            filename=f"comprobante_postulacion_{comprobante.postulacion.numero}.pdf",
+            document_id="doc",
+            numero_postulacion=comprobante.postulacion.numero,
+        )
+
+    use_case = Mock()
+    use_case.execute.side_effect = execute
+    app = create_app()
+    app.dependency_overrides[get_generar_comprobante_postulacion_use_case] = lambda: use_case
+
+    response = TestClient(app).post(URL, json={"items": [_item(1), _item(2), _item(3)]})
+
+    archive, manifest = _open_zip(response)
+    statuses = [item["status"] for item in manifest["items"]]
+    assert statuses == ["ok", "error", "ok"]
+    assert manifest["items"][1]["error"]["error"] == "PDF_GENERATION_ERROR"
+    assert sorted(archive.namelist()) == [
+        "0_comprobante_postulacion_1.pdf",
+        "2_comprobante_postulacion_3.pdf",
+        "manifest.json",
+    ]
+
+
+def test_batch_over_max_items_is_rejected(monkeypatch):
+    """Un lote más grande que el máximo configurado responde 400."""
+    monkeypatch.setattr(get_settings(), "pdf_batch_max_items", 1)
+
+    response = TestClient(create_app()).post(URL, json={"items": [_item(1), _item(2)]})
+
+    assert response.status_code == 400
+    assert response.json()["details"] == {"items": 2, "max_items": 1}
+
+
+class _RejectingExecutor(RenderExecutor):
+    """Executor que rechaza los próximos `rejections` submits (tráfico ajeno)."""
+
+    def __init__(self, rejections: int) -> None:
+        super().__init__(workers=1, max_queue=0)
+        self.rejections = rejections
+
+    def submit(self, fn, *args):
+        if self.rejections and self.stats().completed:
+            self.rejections -= 1
+            raise ServiceOverloadedError(retry_after=0)
+        return super().submit(fn, *args)
+
+
+async def test_overloaded_executor_with_empty_window_retries_the_item():
+    """Un rechazo sin renders propios en vuelo espera y reintenta; el item se renderiza."""
+    def job(index: int) -> BatchJob:
+        result = GenerarComprobanteResult(
+            content=b"%PDF-1.4 mock",
+            filename=f"comprobante_{index}.pdf",
+            document_id="doc",
+            numero_postulacion=index,
+        )
+        return BatchJob(index=index, tipo="comprobante_postulacion", render=lambda: result)
+
+    executor = _RejectingExecutor(rejections=2)
+    try:
+        response = await stream_batch_zip([job(0), job(1)], executor)
+        content = b"".join([chunk async for chunk in response.body_iterator])
+    finally:
+        executor.shutdown()
+
+    manifest = json.loads(zipfile.ZipFile(BytesIO(content)).read("manifest.json"))
+    assert executor.rejections == 0
+    assert [item["status"] for item in manifest["items"]] == ["ok", "ok"]
@@ -0,0 +1,94 @@
+"""
+Test de integración para ETag / If-None-Match
+==============================================
+
+Verifica que los endpoints de generación responden 304 sin renderizar
+cuando el cliente ya tiene el PDF.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import create_app
+from src.presentation.api.v1.http_cache import etag_matches
+from src.presentation.dependencies.container import (
+    get_generar_comprobante_postulacion_use_case,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/pdf/generate/comprobante_postulacion"
+
+
+@pytest.fixture
+def use_case():
+    """Use case mock: permite verificar si se renderizó o no."""
+    mock = Mock()
+    mock.filename_for.return_value = "comprobante_postulacion_5432.pdf"
+
+    def write_pdf(comprobante, stream, style=None):
+        stream.write(b"%PDF-1.4 mock")
+        return "doc-1"
+
+    mock.execute_to_stream.side_effect = write_pdf
+    return mock
+
+
+@pytest.fixture
+def client(use_case):
+    """Cliente de test con el use case reemplazado por el mock."""
+    app = create_app()
+    app.dependency_overrides[get_generar_comprobante_postulacion_use_case] = lambda: use_case
+    return TestClient(app)
+
+
+def test_response_includes_etag(client):
+    """La respuesta 200 incluye el ETag del request."""
+    response = client.post(URL, json=comprobante_postulacion_dict())
+
+    assert response.status_code == 200
+    assert response.headers["etag"]
+
+
+def test_matching_if_none_match_returns_304_without_rendering(client, use_case):
+    """Con un If-None-Match que coincide se responde 304 sin renderizar."""
+    etag = client.post(URL, json=comprobante_postulacion_dict()).headers["etag"]
+    use_case.execute_to_stream.reset_mock()
+
+    response = client.post(
+        URL,
+        json=comprobante_postulacion_dict(),
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    use_case.execute_to_stream.assert_not_called()
+
+
+def test_different_payload_has_different_etag(client):
+    """Un payload distinto produce otro ETag y se renderiza de nuevo."""
+    etag = client.post(URL, json=comprobante_postulacion_dict()).headers["etag"]
+
+    payload = comprobante_postulacion_dict()
+    payload["postulacion"]["numero"] = 1
+
+    response = client.post(URL, json=payload, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_etag_matches_weak_and_lists():
+    """If-None-Match usa comparación débil y acepta listas y '*'."""
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', 'W/"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
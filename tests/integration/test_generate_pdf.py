@@ -0,0 +1,95 @@
+"""
+Test de integración del endpoint genérico
+=========================================
+
+Verifica que POST /api/v1/pdf/generate renderiza documentos con
+secciones y tablas arbitrarias y aplica los límites de tamaño.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config import get_settings
+from src.main import create_app
+
+URL = "/api/v1/pdf/generate"
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app())
+
+
+def _report(rows: int) -> dict:
+    return {
+        "title": "Reporte de Postulaciones",
+        "sections": [
+            {
+                "title": "Detalle",
+                "content": "Postulaciones del período.",
+                "tables": [
+                    {
+                        "headers": ["Legajo", "Empresa", "Estado"],
+                        "rows": [[str(i), f"Empresa {i % 7}", "aceptada"] for i in range(rows)],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_generate_report_with_table(client):
+    """Un reporte con una tabla larga se renderiza y se envía como PDF."""
+    response = client.post(URL, json=_report(rows=300))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert "Reporte_de_Postulaciones.pdf" in response.headers["content-disposition"]
+    assert response.content.startswith(b"%PDF")
+
+
+def test_generate_report_with_columnar_table(client):
+    """Una tabla enviada por columnas se renderiza igual que por filas."""
+    report = _report(rows=0)
+    table = report["sections"][0]["tables"][0]
+    del table["rows"]
+    table["columns"] = [
+        [str(i) for i in range(600)],
+        [f"Empresa {i % 7}" for i in range(600)],
+        ["aceptada"] * 600,
+    ]
+
+    response = client.post(URL, json=report)
+
+    assert response.status_code == 200
+    assert response.content.startswith(b"%PDF")
+
+
+def test_generate_rejects_large_body_and_too_many_cells(client, monkeypatch):
+    """El body y las celdas por encima del límite se rechazan con 413 sin renderizar."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "pdf_generate_max_body_bytes", 2048)
+    too_large = client.post(URL, json=_report(rows=200))
+    assert too_large.status_code == 413
+    assert too_large.json()["error"] == "PAYLOAD_TOO_LARGE"
+
+    monkeypatch.setattr(settings, "pdf_generate_max_body_bytes", 1024 * 1024)
+    monkeypatch.setattr(settings, "pdf_generate_max_table_cells", 30)
+    too_many_cells = client.post(URL, json=_report(rows=11))
+    assert too_many_cells.status_code == 413
+    assert too_many_cells.json()["details"] == {"cells": 33, "max_cells": 30}
+
+
+@pytest.mark.parametrize("table_update", [
+    {"rows": [["solo una columna"]]},
+    {"rows": [], "columns": [["1", "2"], ["a"], ["x", "y"]]},
+    {"columns": [["1"], ["a"], ["x"]]},
+])
+def test_generate_invalid_body_is_422(client, table_update):
+    """Un body que no cumple el schema responde 422 como el resto de la API."""
+    invalid = _report(rows=1)
+    invalid["sections"][0]["tables"][0].update(table_update)
+
+    response = client.post(URL, json=invalid)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
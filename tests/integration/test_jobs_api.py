@@ -0,0 +1,85 @@
+"""
+Test de integración de la API de jobs
+=====================================
+
+Verifica el flujo POST /jobs → GET /jobs/{id} → GET /jobs/{id}/result
+con el repositorio SQLite y los workers reales.
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation.dependencies.container import (
+    get_job_repository,
+    get_job_worker_pool,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/jobs"
+
+
+@pytest.fixture(autouse=True)
+def jobs_db(tmp_path, monkeypatch):
+    """Base de jobs temporal y singletons nuevos para cada test."""
+    monkeypatch.setattr(get_settings(), "pdf_jobs_db_path", str(tmp_path / "jobs.db"))
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+    yield
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+
+
+def _job_request() -> dict:
+    return {"tipo": "comprobante_postulacion", "data": comprobante_postulacion_dict()}
+
+
+def test_job_lifecycle_until_pdf_download():
+    """El job se acepta con 202, termina en segundo plano y se descarga."""
+    with TestClient(create_app()) as client:
+        created = client.post(URL, json=_job_request())
+        assert created.status_code == 202
+        assert created.headers["location"] == created.json()["status_url"]
+
+        job_id = created.json()["id"]
+        for _ in range(300):
+            status = client.get(f"{URL}/{job_id}").json()
+            if status["status"] in ("succeeded", "failed"):
+                break
+            time.sleep(0.01)
+
+        assert status["status"] == "succeeded"
+        result = client.get(status["result_url"])
+
+    assert result.status_code == 200
+    assert result.content.startswith(b"%PDF")
+    assert "comprobante_postulacion_" in result.headers["content-disposition"]
+
+
+def test_pending_job_result_returns_409_and_unknown_job_404():
+    """Sin workers corriendo el job queda pendiente; un ID inexistente es 404."""
+    client = TestClient(create_app())  # sin lifespan: los workers no arrancan
+
+    job_id = client.post(URL, json=_job_request()).json()["id"]
+
+    assert client.get(f"{URL}/{job_id}").json()["status"] == "pending"
+    assert client.get(f"{URL}/{job_id}/result").status_code == 409
+    assert client.get(f"{URL}/inexistente").status_code == 404
+
+
+def test_invalid_payload_is_rejected_at_submit():
+    """El payload se valida al crear el job, no en el worker."""
+    client = TestClient(create_app())
+
+    response = client.post(URL, json={"tipo": "comprobante_postulacion", "data": {}})
+
+    assert response.status_code == 400
+    assert response.json()["error"] == "INVALID_DOCUMENT"
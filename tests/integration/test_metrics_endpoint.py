@@ -0,0 +1,35 @@
+"""
+Test de integración de GET /metrics
+===================================
+
+Verifica que /metrics expone en formato Prometheus las métricas de los
+renders y los rechazos por rate limit.
+"""
+from fastapi.testclient import TestClient
+
+from src.main import create_app
+from src.presentation.api.v1.router import limiter
+
+
+def test_metrics_endpoint_exposes_render_and_rate_limit_metrics():
+    """Después de un render y de un 429 ambos aparecen en /metrics."""
+    client = TestClient(create_app())
+    limiter.reset()
+    try:
+        render = client.post("/api/v1/pdf/generate", json={"title": "Reporte", "sections": [{"title": "A"}]})
+        assert render.status_code == 200
+
+        statuses = {client.get("/api/v1/pdf/health").status_code for _ in range(201)}
+        assert 429 in statuses
+    finally:
+        limiter.reset()
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'pdf_render_duration_seconds_count{tipo_documento="generico"}' in body
+    assert 'pdf_render_output_bytes_bucket{le="+Inf",tipo_documento="generico"}' in body
+    assert 'pdf_rate_limit_rejections_total{endpoint="health_check"}' in body
+    assert "pdf_render_queue_depth 0.0" in body
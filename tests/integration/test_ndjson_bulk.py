@@ -0,0 +1,111 @@
+"""
+Test de integración de la generación masiva NDJSON
+==================================================
+
+Verifica que POST /api/v1/pdf/generate/comprobante_postulacion/bulk
+responde una línea por comprobante (PDF en base64 o referencia a un
+job) sin cortar el stream por las líneas inválidas, y el parser de
+líneas sobre chunks arbitrarios.
+"""
+import asyncio
+import base64
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation.api.v1.ndjson import iter_ndjson_lines
+from src.presentation.dependencies.container import (
+    get_job_repository,
+    get_job_worker_pool,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/pdf/generate/comprobante_postulacion/bulk"
+
+
+@pytest.fixture(autouse=True)
+def jobs_db(tmp_path, monkeypatch):
+    """Base de jobs temporal para las referencias."""
+    monkeypatch.setattr(get_settings(), "pdf_jobs_db_path", str(tmp_path / "jobs.db"))
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+    yield
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+
+
+def _line(numero: int) -> bytes:
+    data = comprobante_postulacion_dict()
+    data["postulacion"]["numero"] = numero
+    return json.dumps(data).encode("utf-8")
+
+
+def _parse(body: bytes) -> tuple[dict[int, dict], dict]:
+    records = [json.loads(line) for line in body.splitlines()]
+    return {r["line"]: r for r in records[:-1]}, records[-1]["summary"]
+
+
+def _collect_lines(chunks: list[bytes], max_line_bytes: int) -> list:
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def run():
+        return [line async for line in iter_ndjson_lines(source(), max_line_bytes)]
+
+    return asyncio.run(run())
+
+
+def test_iter_ndjson_lines_over_chunk_boundaries():
+    """Las líneas se arman entre chunks; vacías se saltean y las largas se marcan."""
+    chunks = [b'{"a":', b' 1}\n\n{"b"', b": 2}\n" + b"x" * 20, b"x" * 20 + b"\n", b'{"c": 3}']
+
+    assert _collect_lines(chunks, max_line_bytes=16) == [
+        (1, b'{"a": 1}'),
+        (3, b'{"b": 2}'),
+        (4, None),
+        (5, b'{"c": 3}'),
+    ]
+
+
+def test_bulk_base64_reports_each_line():
+    """Cada línea válida trae su PDF; una inválida se reporta sin cortar el stream."""
+    body = b"\n".join([_line(1), b"{no es json", _line(2)]) + b"\n"
+
+    with TestClient(create_app()) as client:
+        response = client.post(URL, content=body, headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines, summary = _parse(response.content)
+    assert summary == {"lines": 3, "ok": 2, "errors": 1}
+    assert lines[2]["status"] == "error"
+    assert lines[2]["error"]["error"] == "VALIDATION_ERROR"
+    for line_no, numero in ((1, 1), (3, 2)):
+        assert lines[line_no]["status"] == "ok"
+        assert lines[line_no]["numero_postulacion"] == numero
+        assert base64.b64decode(lines[line_no]["content_base64"]).startswith(b"%PDF")
+
+
+def test_bulk_reference_is_downloadable():
+    """En modo reference cada línea apunta a un PDF descargable por la API de jobs."""
+    with TestClient(create_app()) as client:
+        response = client.post(f"{URL}?output=reference", content=_line(7))
+        lines, summary = _parse(response.content)
+
+        assert summary == {"lines": 1, "ok": 1, "errors": 0}
+        assert "content_base64" not in lines[1]
+        download = client.get(lines[1]["document"]["result_url"])
+
+    assert download.status_code == 200
+    assert download.content.startswith(b"%PDF")
@@ -0,0 +1,138 @@
+"""
+Test de integración del perfilado a demanda
+===========================================
+
+Verifica que con el perfilado habilitado el header X-PDF-Profile
+guarda un perfil descargable desde /api/v1/admin/profiles, y que los
+endpoints de admin exigen el token.
+"""
+import pstats
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.cache import PDFOutputCache
+from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation.dependencies.container import (
+    get_generar_comprobante_postulacion_use_case,
+    get_profile_store,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/pdf/generate"
+REPORT = {"title": "Reporte", "sections": [{"title": "Detalle", "content": "Texto."}]}
+ADMIN = {"X-Admin-Token": "secreto"}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "pdf_temp_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "pdf_admin_token", "secreto")
+    get_profile_store.cache_clear()
+    yield TestClient(create_app())
+    get_profile_store.cache_clear()
+
+
+def test_profile_header_stores_downloadable_profile(client, monkeypatch, tmp_path):
+    """Un render con X-PDF-Profile deja un perfil pstats listado y descargable."""
+    monkeypatch.setattr(get_settings(), "pdf_profiling_enabled", True)
+
+    response = client.post(URL, json=REPORT, headers={"X-PDF-Profile": "cprofile"})
+    profile_id = response.headers["x-pdf-profile-id"]
+
+    listing = client.get("/api/v1/admin/profiles", headers=ADMIN).json()
+    assert listing["enabled"] is True
+    assert listing["profiles"][0]["id"] == profile_id
+    assert listing["profiles"][0]["label"] == "generico"
+
+    download = client.get(listing["profiles"][0]["downloads"]["pstats"], headers=ADMIN)
+    assert download.status_code == 200
+    path = tmp_path / "descarga.pstats"
+    path.write_bytes(download.content)
+    assert pstats.Stats(str(path)).total_calls > 0
+
+    collapsed = client.get(listing["profiles"][0]["downloads"]["collapsed"], headers=ADMIN)
+    assert collapsed.status_code == 200
+    assert collapsed.text.splitlines()
+
+
+def test_profile_header_ignored_when_disabled(client):
+    """Sin el setting el header no perfila."""
+    response = client.post(URL, json=REPORT, headers={"X-PDF-Profile": "cprofile"})
+
+    assert response.status_code == 200
+    assert "x-pdf-profile-id" not in response.headers
+    assert client.get("/api/v1/admin/profiles", headers=ADMIN).json()["profiles"] == []
+
+
+def test_admin_endpoints_require_token(client, monkeypatch):
+    """Sin token, con token incorrecto o sin token configurado: 403."""
+    assert client.get("/api/v1/admin/profiles").status_code == 403
+    assert client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": "otro"}).status_code == 403
+
+    monkeypatch.setattr(get_settings(), "pdf_admin_token", "")
+    response = client.get("/api/v1/admin/profiles", headers=ADMIN)
+    assert response.status_code == 403
+    assert response.json()["error"] == "FORBIDDEN"
+
+
+def test_non_ascii_admin_token_is_rejected_not_crashing(client, monkeypatch):
+    """Un token con caracteres no ASCII (en el header o configurado) da 403, no 500."""
+    response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": "contraseña".encode("latin-1")})
+    assert response.status_code == 403
+
+    monkeypatch.setattr(get_settings(), "pdf_admin_token", "contraseña")
+    response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": "contrasena"})
+    assert response.status_code == 403
+
+
+def test_process_pool_backend_is_not_profiled(client, monkeypatch):
+    """Con process_pool el render no corre en este proceso: se avisa y no se perfila."""
+    monkeypatch.setattr(get_settings(), "pdf_profiling_enabled", True)
+    monkeypatch.setattr(get_settings(), "pdf_backend", "process_pool")
+
+    response = client.post(URL, json=REPORT, headers={"X-PDF-Profile": "cprofile"})
+
+    assert response.status_code == 200
+    assert response.headers["x-pdf-profile-skipped"] == "process_pool"
+    assert "x-pdf-profile-id" not in response.headers
+
+
+def test_cache_hit_is_not_profiled(client, monkeypatch):
+    """Un acierto de caché no renderiza: solo el primer request deja perfil."""
+    monkeypatch.setattr(get_settings(), "pdf_profiling_enabled", True)
+    inner = Mock()
+    inner.TEMPLATE_VERSION = "1"
+    inner.filename_for.return_value = "comprobante.pdf"
+
+    def write_pdf(comprobante, stream, style=None):
+        stream.write(b"%PDF-1.4 mock")
+        return "doc-1"
+
+    inner.execute_to_stream.side_effect = write_pdf
+    inner.build_result.side_effect = lambda comprobante, content, document_id: SimpleNamespace(
+        content=content, document_id=document_id
+    )
+    use_case = CachedComprobanteUseCase(inner, PDFOutputCache(max_bytes=1024 * 1024), "comprobante_postulacion")
+    client.app.dependency_overrides[get_generar_comprobante_postulacion_use_case] = lambda: use_case
+    url = "/api/v1/pdf/generate/comprobante_postulacion"
+
+    first = client.post(url, json=comprobante_postulacion_dict(), headers={"X-PDF-Profile": "cprofile"})
+    second = client.post(url, json=comprobante_postulacion_dict(), headers={"X-PDF-Profile": "cprofile"})
+
+    assert "x-pdf-profile-id" in first.headers
+    assert second.status_code == 200
+    assert second.headers["x-pdf-profile-skipped"] == "cache_hit"
+    assert "x-pdf-profile-id" not in second.headers
+    assert inner.execute_to_stream.call_count == 1
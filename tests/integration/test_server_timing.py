@@ -0,0 +1,74 @@
+"""
+Test de integración de los tiempos por etapa
+============================================
+
+Verifica que las respuestas traen el header Server-Timing, que los
+histogramas por etapa se alimentan solo con los renders (y se exponen
+en /health) y que con `pdf_stage_timing` desactivado no se mide nada.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.utils.stage_timing import stage_histograms
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation.api.v1.router import limiter
+
+URL = "/api/v1/pdf/generate"
+REPORT = {
+    "title": "Reporte",
+    "sections": [{"title": "Detalle", "tables": [{"headers": ["A", "B"], "rows": [["1", "2"]]}]}],
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_histograms():
+    # /health comparte el límite por minuto con los tests de rate limiting
+    limiter.reset()
+    stage_histograms.clear()
+    yield
+    stage_histograms.clear()
+
+
+def test_server_timing_header_and_histograms():
+    """El header trae las etapas previas al envío y los histogramas todas las del render."""
+    client = TestClient(create_app())
+
+    response = client.post(URL, json=REPORT)
+
+    assert response.status_code == 200
+    entries = {
+        entry.split(";")[0].strip()
+        for entry in response.headers["server-timing"].split(",")
+    }
+    assert {"validation", "mapping", "total"} <= entries
+
+    health = client.get("/api/v1/pdf/health").json()["stage_timings"]
+    assert {"validation", "mapping", "queue_wait", "build_document", "doc_build", "total"} <= set(health)
+    assert health["doc_build"]["count"] == 1
+
+
+def test_probe_endpoints_are_not_observed():
+    """Los probes y admin llevan Server-Timing pero no alimentan los histogramas."""
+    client = TestClient(create_app())
+
+    for path in ("/health", "/ready", "/metrics", "/api/v1/pdf/health", "/api/v1/admin/profiles"):
+        response = client.get(path)
+        assert "server-timing" in response.headers
+
+    assert stage_histograms.snapshot() == {}
+
+    client.post(URL, json=REPORT)
+    assert stage_histograms.snapshot()["total"]["count"] == 1
+
+
+def test_stage_timing_disabled(monkeypatch):
+    """Con la medición desactivada no hay header ni histogramas."""
+    monkeypatch.setattr(get_settings(), "pdf_stage_timing", False)
+    client = TestClient(create_app())
+
+    response = client.post(URL, json=REPORT)
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert stage_histograms.snapshot() == {}
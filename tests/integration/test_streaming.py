@@ -0,0 +1,191 @@
+"""
+Test de integración del streaming de PDFs
+=========================================
+
+Verifica que los endpoints envían el PDF generado por
+`execute_to_stream` en chunks, que la cola de chunks frena al
+productor, que los errores previos al primer byte siguen
+respondiendo con el status del exception handler y que el executor
+de renders saturado responde 503 con Retry-After.
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.domain.exceptions import PDFGenerationError
+from src.infrastructure.concurrency import RenderExecutor
+from src.main import create_app
+from src.presentation.api.v1.streaming import (
+    ChunkQueueWriter,
+    StreamAbortedError,
+    stream_pdf_response,
+)
+from src.presentation.dependencies.container import (
+    get_generar_comprobante_postulacion_use_case,
+    get_render_executor,
+)
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import comprobante_postulacion_dict
+
+URL = "/api/v1/pdf/generate/comprobante_postulacion"
+
+
+def _client_with(use_case) -> TestClient:
+    app = create_app()
+    app.dependency_overrides[get_generar_comprobante_postulacion_use_case] = lambda: use_case
+    return TestClient(app)
+
+
+def test_streams_real_pdf():
+    """El endpoint real responde un PDF completo desde execute_to_stream."""
+    response = TestClient(create_app()).post(URL, json=comprobante_postulacion_dict())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert "comprobante_postulacion_" in response.headers["content-disposition"]
+    assert response.content.startswith(b"%PDF")
+    assert response.content.rstrip().endswith(b"%%EOF")
+
+
+def test_large_write_arrives_complete():
+    """Un write mayor que la cola de chunks llega completo."""
+    payload = b"%PDF-1.4 " + bytes(range(256)) * 2048  # ~512 KiB
+
+    use_case = Mock()
+    use_case.filename_for.return_value = "doc.pdf"
+    use_case.execute_to_stream.side_effect = lambda dto, stream, style=None: stream.write(payload)
+
+    response = _client_with(use_case).post(URL, json=comprobante_postulacion_dict())
+
+    assert response.status_code == 200
+    assert response.content == payload
+
+
+def test_error_before_first_byte_returns_500():
+    """Si el render falla antes de escribir, responde el exception handler."""
+    use_case = Mock()
+    use_case.filename_for.return_value = "doc.pdf"
+    use_case.execute_to_stream.side_effect = PDFGenerationError("fallo de render")
+
+    response = _client_with(use_case).post(URL, json=comprobante_postulacion_dict())
+
+    assert response.status_code == 500
+    assert response.json()["error"] == "PDF_GENERATION_ERROR"
+
+
+def test_saturated_executor_returns_503_with_retry_after():
+    """Con el executor lleno se rechaza de inmediato, sin renderizar."""
+    release = threading.Event()
+    executor = RenderExecutor(workers=1, max_queue=0, retry_after=2)
+
+    use_case = Mock()
+    use_case.filename_for.return_value = "doc.pdf"
+    use_case.execute_to_stream.side_effect = lambda dto, stream, style=None: stream.write(b"%PDF")
+
+    client = _client_with(use_case)
+    client.app.dependency_overrides[get_render_executor] = lambda: executor
+
+    async def occupy_worker():
+        executor.submit(release.wait, 5)
+
+    try:
+        # El portal del cliente corre en el mismo loop que la app
+        with client:
+            client.portal.call(occupy_worker)
+            response = client.post(URL, json=comprobante_postulacion_dict())
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    assert response.json()["error"] == "SERVICE_OVERLOADED"
+    use_case.execute_to_stream.assert_not_called()
+
+
+async def test_writer_splits_writes_into_chunks():
+    """Cada write se parte en chunks de a lo sumo chunk_size bytes."""
+    writer = ChunkQueueWriter(asyncio.get_running_loop(), max_chunks=8, chunk_size=4)
+
+    await asyncio.to_thread(writer.write, b"0123456789")
+    await asyncio.to_thread(writer.close)
+
+    chunks = []
+    while (chunk := await writer.next_chunk()) is not None:
+        chunks.append(chunk)
+
+    assert chunks == [b"0123", b"4567", b"89"]
+    assert writer.bytes_written == 10
+
+
+async def test_writer_applies_backpressure_and_abort():
+    """Con la cola llena el productor espera; abort lo libera con error."""
+    writer = ChunkQueueWriter(asyncio.get_running_loop(), max_chunks=2, chunk_size=4)
+    errors = []
+
+    def produce():
+        try:
+            writer.write(b"x" * 40)  # 10 chunks para una cola de 2
+        except StreamAbortedError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+
+    assert await writer.next_chunk() == b"xxxx"
+    await asyncio.sleep(0.05)
+    assert writer.queue_depth == 2  # el productor está bloqueado
+
+    writer.abort()
+    await asyncio.to_thread(thread.join, 5)
+
+    assert not thread.is_alive()
+    assert errors
+
+
+async def test_cancel_before_first_chunk_releases_worker():
+    """Cancelar el request esperando el primer chunk libera al worker de render."""
+    executor = RenderExecutor(workers=1, max_queue=0)
+    started = threading.Event()
+    gate = threading.Event()
+    errors = []
+
+    def render(stream):
+        started.set()
+        gate.wait(5)
+        try:
+            stream.write(b"x" * 40)  # 10 chunks para una cola de 2
+        except StreamAbortedError as e:
+            errors.append(e)
+            raise
+
+    task = asyncio.ensure_future(
+        stream_pdf_response(render, "doc.pdf", executor=executor, max_chunks=2, chunk_size=4)
+    )
+    try:
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # El render sigue después de la cancelación: no debe quedar
+        # bloqueado en la cola llena
+        gate.set()
+        for _ in range(100):
+            if executor.stats().active == 0:
+                break
+            await asyncio.sleep(0.05)
+
+        assert executor.stats().active == 0
+        assert errors
+    finally:
+        gate.set()
+        executor.shutdown(wait=False)
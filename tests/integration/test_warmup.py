@@ -0,0 +1,82 @@
+"""
+Test de integración del warm-up
+===============================
+
+Verifica que GET /ready responde 503 hasta que el warm-up del lifespan
+termina, que el warm-up renderiza los comprobantes sintéticos con los
+use cases reales y que sin warm-up el proceso está listo de entrada.
+"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config import get_settings
+from src.main import create_app
+from src.presentation import warmup
+from src.presentation.dependencies.container import (
+    get_job_repository,
+    get_job_worker_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def jobs_db(tmp_path, monkeypatch):
+    """Base de jobs temporal para el lifespan."""
+    monkeypatch.setattr(get_settings(), "pdf_jobs_db_path", str(tmp_path / "jobs.db"))
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+    yield
+    get_job_repository.cache_clear()
+    get_job_worker_pool.cache_clear()
+
+
+def _wait_ready(client: TestClient, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/ready")
+        if response.status_code == 200:
+            return response.json()
+        time.sleep(0.02)
+    raise AssertionError("El warm-up no terminó")
+
+
+def test_ready_is_503_until_warm_up_finishes(monkeypatch):
+    """Mientras el warm-up corre /ready responde 503; al terminar, 200."""
+    release = threading.Event()
+
+    def slow_warm_up():
+        release.wait(10)
+        return {"fake": 1.0}
+
+    monkeypatch.setattr(warmup, "warm_up_renderers", slow_warm_up)
+
+    with TestClient(create_app()) as client:
+        pending = client.get("/ready")
+        release.set()
+        body = _wait_ready(client)
+
+    assert pending.status_code == 503
+    assert pending.json()["ready"] is False
+    assert body["warmup"]["documents_ms"] == {"fake": 1.0}
+
+
+def test_warm_up_renders_synthetic_documents():
+    """El warm-up real renderiza postulación y contrato y registra cuánto tardó."""
+    with TestClient(create_app()) as client:
+        body = _wait_ready(client)
+
+    assert body["warmup"]["error"] is None
+    assert set(body["warmup"]["documents_ms"]) == {"comprobante_postulacion", "comprobante_contrato"}
+    assert body["warmup"]["duration_ms"] > 0
+
+
+def test_ready_without_warm_up(monkeypatch):
+    """Con el warm-up desactivado el proceso está listo de entrada."""
+    monkeypatch.setattr(get_settings(), "pdf_warmup_enabled", False)
+
+    response = TestClient(create_app()).get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["warmup"]["duration_ms"] is None
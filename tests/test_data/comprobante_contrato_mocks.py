@@ -0,0 +1,51 @@
+"""
+Comprobante de Contrato - Mocks
+===============================
+
+Datos de prueba (mocks) reutilizables para testing del
+endpoint de comprobante de contrato.
+
+Reutiliza los mocks de postulación y agrega los datos del contrato.
+"""
+
+from src.application.dto import ComprobanteContratoDTO, ContratoDTO
+
+from test_data.comprobante_postulacion_mocks import (
+    mock_estudiante_dto,
+    mock_universidad_dto,
+    mock_carrera_dto,
+    mock_empresa_dto,
+    mock_proyecto_dto,
+    mock_puesto_dto,
+    mock_postulacion_dto,
+)
+
+
+def mock_contrato_dto() -> ContratoDTO:
+    """Mock de datos de contrato."""
+    return ContratoDTO(
+        numero=7001,
+        fecha_inicio="2026-02-01",
+        fecha_fin="2026-08-01",
+        fecha_emision="2026-01-20",
+        estado="VIGENTE",
+    )
+
+
+def mock_comprobante_contrato_dto() -> ComprobanteContratoDTO:
+    """
+    Mock completo de ComprobanteContratoDTO.
+    
+    Retorna un DTO completo con todos los datos necesarios
+    para generar el contrato de pasantía.
+    """
+    return ComprobanteContratoDTO(
+        estudiante=mock_estudiante_dto(),
+        universidad=mock_universidad_dto(),
+        carrera=mock_carrera_dto(),
+        empresa=mock_empresa_dto(),
+        proyecto=mock_proyecto_dto(),
+        puesto=mock_puesto_dto(),
+        postulacion=mock_postulacion_dto(),
+        contrato=mock_contrato_dto(),
+    )
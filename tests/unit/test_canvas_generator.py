@@ -0,0 +1,117 @@
+"""
+Test del fast-path de Canvas
+============================
+
+Verifica que CanvasPDFGenerator dibuja el comprobante de postulación
+igual que Platypus (mismos textos en las mismas posiciones, dentro de
+una tolerancia) y que vuelve a Platypus cuando el layout no aplica.
+"""
+import base64
+import re
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.application.use_cases.generar_comprobante_postulacion import (
+    GenerarComprobantePostulacionUseCase,
+)
+from src.infrastructure.pdf import CanvasPDFGenerator, ReportLabGenerator
+from test_data.comprobante_postulacion_mocks import (
+    mock_comprobante_minimo,
+    mock_comprobante_postulacion_dto,
+)
+
+
+TOLERANCE = 0.5  # puntos
+
+_TOKEN = re.compile(
+    r"(?P<push>^q$)|(?P<pop>^Q$)"
+    r"|1 0 0 1 (?P<cx>[\d.\-]+) (?P<cy>[\d.\-]+) cm"
+    r"|BT 1 0 0 1 (?P<tx>[\d.\-]+) (?P<ty>[\d.\-]+) Tm(?P<body>.*?)ET",
+    re.S | re.M,
+)
+
+
+def _page_streams(pdf: bytes) -> list[str]:
+    """Decodifica los streams ASCII85 + Flate del PDF."""
+    streams = []
+    for raw in re.findall(rb"stream\r?\n(.*?)endstream", pdf, re.S):
+        try:
+            streams.append(zlib.decompress(base64.a85decode(raw.strip(), adobe=True)).decode("latin-1"))
+        except Exception:
+            continue
+    return streams
+
+
+def _text_runs(pdf: bytes) -> list[tuple[str, float, float]]:
+    """Extrae (texto, x, y) de cada bloque de texto, siguiendo q/Q y cm."""
+    runs = []
+    for stream in _page_streams(pdf):
+        origin = [(0.0, 0.0)]
+        for match in _TOKEN.finditer(stream):
+            if match.group("push"):
+                origin.append(origin[-1])
+            elif match.group("pop"):
+                origin.pop()
+            elif match.group("cx") is not None:
+                x, y = origin[-1]
+                origin[-1] = (x + float(match.group("cx")), y + float(match.group("cy")))
+            else:
+                x, y = origin[-1]
+                body = match.group("body")
+                # Paragraph centrado: desplazamiento con Td antes del texto
+                offset = re.match(r"\s*/\w+ [\d.]+ Tf [\d.]+ TL ([\d.\-]+) 0 Td", body)
+                dx = float(offset.group(1)) if offset else 0.0
+                text = "".join(re.findall(r"\((.*?)\) Tj", body))
+                runs.append((text, x + float(match.group("tx")) + dx, y + float(match.group("ty"))))
+    return sorted(runs)
+
+
+def _render(generator, comprobante) -> bytes:
+    use_case = GenerarComprobantePostulacionUseCase(generator, deterministic=True)
+    return use_case.execute(comprobante).content
+
+
+@pytest.mark.parametrize("factory", [mock_comprobante_postulacion_dto, mock_comprobante_minimo])
+def test_fast_path_matches_platypus_layout(factory):
+    """Mismos textos en las mismas posiciones que el render de Platypus."""
+    expected = _text_runs(_render(ReportLabGenerator(invariant=True), factory()))
+    actual = _text_runs(_render(CanvasPDFGenerator(invariant=True), factory()))
+
+    assert [text for text, _, _ in actual] == [text for text, _, _ in expected]
+    for (_, x1, y1), (_, x2, y2) in zip(actual, expected):
+        assert abs(x1 - x2) <= TOLERANCE
+        assert abs(y1 - y2) <= TOLERANCE
+
+
+def test_fast_path_keeps_page_count():
+    """El bloque de firma queda en la misma página que con Platypus."""
+    expected = _render(ReportLabGenerator(invariant=True), mock_comprobante_postulacion_dto())
+    actual = _render(CanvasPDFGenerator(invariant=True), mock_comprobante_postulacion_dto())
+
+    assert actual.count(b"/Type /Page\n") == expected.count(b"/Type /Page\n")
+
+
+def test_fast_path_falls_back_when_content_overflows():
+    """Un narrativo que no entra en la página usa Platypus."""
+    comprobante = mock_comprobante_postulacion_dto()
+    comprobante.proyecto.nombre = "Proyecto con nombre extremadamente largo " * 60
+
+    expected = _render(ReportLabGenerator(invariant=True), comprobante)
+    actual = _render(CanvasPDFGenerator(invariant=True), comprobante)
+
+    assert actual == expected
+
+
+def test_documents_without_fast_path_use_platypus(sample_document, sample_style):
+    """Los documentos genéricos se generan exactamente como antes."""
+    generator = CanvasPDFGenerator(invariant=True)
+
+    assert not generator.has_fast_path(sample_document)
+    assert generator.generate(sample_document, sample_style) == (
+        ReportLabGenerator(invariant=True).generate(sample_document, sample_style)
+    )
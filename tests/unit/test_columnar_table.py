@@ -0,0 +1,52 @@
+"""
+Tests de ColumnarTable
+======================
+
+Verifica la validación de la tabla por columnas, su vista perezosa por
+filas y que el generador la renderiza (incluido el modo de tablas grandes).
+"""
+from io import BytesIO
+
+import pytest
+
+from src.domain.entities import ColumnarTable, PDFDocument, PDFSection
+from src.infrastructure.pdf import ReportLabGenerator
+
+
+def test_rows_view_builds_rows_on_demand():
+    """Las filas se arman desde las columnas por índice, slice o iteración."""
+    table = ColumnarTable(["Legajo", "Nombre"], [["1", "2", "3"], ["Ana", "Juan", "Sol"]])
+
+    assert table.row_count == len(table.rows) == 3
+    assert table.rows[0] == ["1", "Ana"]
+    assert table.rows[-1] == ["3", "Sol"]
+    assert table.rows[1:3] == [["2", "Juan"], ["3", "Sol"]]
+    assert list(table.rows) == [["1", "Ana"], ["2", "Juan"], ["3", "Sol"]]
+
+
+@pytest.mark.parametrize("headers, columns", [
+    ([], []),
+    (["A", "B"], [["1"]]),
+    (["A", "B"], [["1", "2"], ["x"]]),
+])
+def test_invalid_shapes_are_rejected(headers, columns):
+    """Sin headers, columnas de más/de menos o de distinto largo → ValueError."""
+    with pytest.raises(ValueError):
+        ColumnarTable(headers, columns)
+
+
+@pytest.mark.parametrize("rows", [20, ReportLabGenerator.LARGE_TABLE_ROWS + 1])
+def test_generator_renders_columnar_tables(rows):
+    """El generador renderiza la tabla por columnas, chica o grande."""
+    section = PDFSection(title="Detalle")
+    section.elements.append(ColumnarTable(
+        ["Legajo", "Nombre"],
+        [[str(i) for i in range(rows)], [f"Alumno {i}" for i in range(rows)]],
+    ))
+    document = PDFDocument(title="Reporte")
+    document.add_section(section)
+
+    buffer = BytesIO()
+    ReportLabGenerator().generate_to_stream(document, buffer)
+
+    assert buffer.getvalue().startswith(b"%PDF")
@@ -0,0 +1,92 @@
+"""
+Test de renderizado determinístico
+===================================
+
+Verifica que en modo determinístico el mismo DTO produce
+exactamente los mismos bytes de PDF (y el mismo ID de documento).
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.application.use_cases.generar_comprobante_postulacion import (
+    GenerarComprobantePostulacionUseCase,
+)
+from src.application.use_cases.generar_comprobante_contrato import (
+    GenerarComprobanteContratoUseCase,
+)
+from src.infrastructure.pdf import ReportLabGenerator
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import (
+    mock_comprobante_postulacion_dto,
+    mock_comprobante_minimo,
+)
+from test_data.comprobante_contrato_mocks import mock_comprobante_contrato_dto
+
+
+@pytest.fixture
+def postulacion_use_case():
+    """Use case de postulación en modo determinístico."""
+    return GenerarComprobantePostulacionUseCase(
+        ReportLabGenerator(invariant=True),
+        deterministic=True,
+    )
+
+
+@pytest.fixture
+def contrato_use_case():
+    """Use case de contrato en modo determinístico."""
+    return GenerarComprobanteContratoUseCase(
+        ReportLabGenerator(invariant=True),
+        deterministic=True,
+    )
+
+
+def test_postulacion_same_dto_same_bytes(postulacion_use_case):
+    """Dos renders del mismo comprobante son idénticos byte a byte."""
+    first = postulacion_use_case.execute(mock_comprobante_postulacion_dto())
+    second = postulacion_use_case.execute(mock_comprobante_postulacion_dto())
+
+    assert first.content == second.content
+    assert first.document_id == second.document_id
+
+
+def test_contrato_same_dto_same_bytes(contrato_use_case):
+    """Dos renders del mismo contrato (multi-sección) son idénticos."""
+    first = contrato_use_case.execute(mock_comprobante_contrato_dto())
+    second = contrato_use_case.execute(mock_comprobante_contrato_dto())
+
+    assert first.content == second.content
+    assert first.document_id == second.document_id
+
+
+def test_different_dto_different_bytes(postulacion_use_case):
+    """Contenidos distintos producen PDFs e IDs distintos."""
+    first = postulacion_use_case.execute(mock_comprobante_postulacion_dto())
+    second = postulacion_use_case.execute(mock_comprobante_minimo())
+
+    assert first.content != second.content
+    assert first.document_id != second.document_id
+
+
+def test_generator_invariant_mode(sample_document, sample_style):
+    """generate() en modo invariant es reproducible para el mismo documento."""
+    generator = ReportLabGenerator(invariant=True)
+
+    assert generator.generate(sample_document, sample_style) == generator.generate(
+        sample_document, sample_style
+    )
+
+
+def test_default_mode_is_not_deterministic():
+    """Sin modo determinístico cada render tiene un ID de documento nuevo."""
+    use_case = GenerarComprobantePostulacionUseCase(ReportLabGenerator())
+
+    first = use_case.execute(mock_comprobante_postulacion_dto())
+    second = use_case.execute(mock_comprobante_postulacion_dto())
+
+    assert first.document_id != second.document_id
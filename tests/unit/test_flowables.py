@@ -0,0 +1,69 @@
+"""
+Tests de la fábrica de flowables
+================================
+
+Verifica que los estilos de tabla precompilados son inmutables y que
+los espaciadores compartidos se pueden reutilizar entre documentos y
+threads sin arrastrar estado del layout.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from reportlab.platypus import TableStyle
+
+from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.infrastructure.pdf import ReportLabGenerator
+from src.infrastructure.pdf.flowables import (
+    DATA_TABLE_STYLE,
+    KEY_VALUE_COL_WIDTHS,
+    data_table,
+    signature_table,
+    spacer,
+)
+
+
+def _document_with_postponed_spacers() -> PDFDocument:
+    """Documento donde el espaciador de firmas no entra y pasa de página."""
+    document = PDFDocument(title="Contrato")
+    body = PDFSection(title="Cláusulas", content="\n\n".join(["Texto de la cláusula."] * 25))
+    document.add_section(body)
+    for _ in range(2):
+        firmas = PDFSection(title="", metadata={"push_to_bottom": True})
+        firmas.elements.append(PDFTable(headers=["", ""], rows=[["Firma A", "Firma B"]]))
+        document.add_section(firmas)
+    return document
+
+
+def test_table_styles_are_shared_and_frozen():
+    """Las tablas usan el mismo TableStyle y no se lo puede modificar."""
+    table = data_table(["Campo", "Valor"], [["Legajo", "12345"]])
+    firmas = signature_table([["Firma A", "Firma B"]], columns=2)
+
+    assert table._argW == KEY_VALUE_COL_WIDTHS
+    assert len(firmas._argW) == 2
+    with pytest.raises(TypeError):
+        DATA_TABLE_STYLE.add("FONTSIZE", (0, 0), (-1, -1), 12)
+    derived = TableStyle([("FONTSIZE", (0, 0), (-1, -1), 12)], parent=DATA_TABLE_STYLE)
+    assert len(derived.getCommands()) == len(DATA_TABLE_STYLE.getCommands()) + 1
+
+
+def test_spacers_are_singletons_without_layout_state():
+    """Un mismo alto es siempre la misma instancia, y el layout no le deja atributos."""
+    shared = spacer(12)
+    assert spacer(12) is shared
+
+    ReportLabGenerator().generate(_document_with_postponed_spacers())
+
+    assert not any(hasattr(shared, name) for name in ("canv", "_frame", "_postponed"))
+
+
+def test_shared_spacers_across_documents_and_threads():
+    """Varios renders concurrentes con espaciadores postergados dan el mismo PDF."""
+    generator = ReportLabGenerator(invariant=True)
+    document = _document_with_postponed_spacers()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: generator.generate(document), range(8)))
+
+    assert results[0].startswith(b"%PDF")
+    assert all(result == results[0] for result in results)
@@ -0,0 +1,59 @@
+"""
+Test de hashes canónicos
+========================
+
+Verifica que el hash canónico depende solo del contenido, también
+con DTOs anidados en dicts o listas y con fechas.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import pytest
+
+from src.application.utils.hash_utils import canonical_hash, canonical_json
+
+
+@dataclass
+class _PeriodoDTO:
+    inicio: date
+    fin: date
+
+
+@dataclass
+class _ConvenioDTO:
+    numero: int
+    periodo: _PeriodoDTO
+    firmado: datetime
+
+
+def _convenio() -> _ConvenioDTO:
+    return _ConvenioDTO(
+        numero=7,
+        periodo=_PeriodoDTO(inicio=date(2024, 3, 1), fin=date(2024, 12, 20)),
+        firmado=datetime(2024, 2, 15, 10, 30),
+    )
+
+
+def test_nested_dto_hashes_like_its_canonical_dict():
+    """Un DTO dentro de un dict hashea igual que su dict con fechas ISO."""
+    canonical = {
+        "numero": 7,
+        "periodo": {"inicio": "2024-03-01", "fin": "2024-12-20"},
+        "firmado": "2024-02-15T10:30:00",
+    }
+
+    assert canonical_hash({"comprobante": _convenio(), "style": None}) == canonical_hash(
+        {"style": None, "comprobante": canonical}
+    )
+
+
+def test_lists_and_tuples_are_canonicalized():
+    """Dataclasses dentro de listas y tuplas también se convierten."""
+    periodo = _PeriodoDTO(inicio=date(2024, 3, 1), fin=date(2024, 12, 20))
+
+    assert canonical_json((periodo,)) == canonical_json([periodo])
+    assert canonical_json([periodo]) == '[{"fin":"2024-12-20","inicio":"2024-03-01"}]'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
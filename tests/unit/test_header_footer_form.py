@@ -0,0 +1,74 @@
+"""
+Test del header/footer como Form XObject
+========================================
+
+Verifica que el header/footer estático se define una vez por documento
+y que cada página solo lo referencia.
+"""
+import base64
+import re
+import zlib
+
+from src.application.utils.assets import get_logo_path
+from src.domain.entities import PDFDocument, PDFSection
+from src.infrastructure.pdf import ReportLabGenerator
+
+
+def _branded_document(num_sections: int, empresa_nombre: str = "TechCorp SA") -> PDFDocument:
+    """Documento con metadata de branding y varias páginas de contenido."""
+    document = PDFDocument(
+        title="Contrato de prueba",
+        metadata={
+            "logo_path": get_logo_path(),
+            "universidad_nombre": "Universidad Tecnológica Nacional",
+            "universidad_correo": "contacto@utn.edu.ar",
+            "empresa_nombre": empresa_nombre,
+            "empresa_telefono": "+54 351 9876543",
+        },
+    )
+    for i in range(num_sections):
+        document.add_section(
+            PDFSection(title=f"Cláusula {i + 1}", content="Texto legal del contrato. " * 40)
+        )
+    return document
+
+
+def _decoded_streams(pdf: bytes) -> list[bytes]:
+    """Decodifica los streams ASCII85 + Flate del PDF."""
+    streams = []
+    for raw in re.findall(rb"stream\r?\n(.*?)endstream", pdf, re.S):
+        try:
+            streams.append(zlib.decompress(base64.a85decode(raw.strip(), adobe=True)))
+        except Exception:
+            continue
+    return streams
+
+
+def test_header_footer_form_defined_once_per_document():
+    """Verifica que un documento multipágina tiene un único Form XObject."""
+    pdf = ReportLabGenerator(invariant=True).generate(_branded_document(30))
+
+    assert pdf.count(b"/Type /Page\n") > 3
+    assert pdf.count(b"/FormType 1") == 1
+    assert pdf.count(b"/Subtype /Image") == 1
+
+
+def test_header_footer_form_name_depends_on_branding():
+    """Verifica que cada tupla de branding produce un Form distinto."""
+    name = ReportLabGenerator._header_footer_form_name
+
+    assert name(("logo", "UTN", "a@utn.edu.ar")) == name(("logo", "UTN", "a@utn.edu.ar"))
+    assert name(("logo", "UTN", "a@utn.edu.ar")) != name(("logo", "UTN", "b@utn.edu.ar"))
+
+
+def test_header_footer_keeps_page_numbers():
+    """Verifica que el número de página sigue dibujándose en cada página."""
+    pdf = ReportLabGenerator(invariant=True).generate(_branded_document(30))
+    num_pages = pdf.count(b"/Type /Page\n")
+
+    content = b"".join(_decoded_streams(pdf))
+
+    for page in range(1, num_pages + 1):
+        assert f"gina {page})".encode() in content
+    # Los contactos viven en el Form: se emiten una sola vez
+    assert content.count(b"Contacto universidad") == 1
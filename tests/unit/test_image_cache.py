@@ -0,0 +1,72 @@
+"""
+Test de caché de imágenes
+=========================
+
+Verifica que el logo se decodifica una sola vez por proceso y que
+el PDF resultante es idéntico al dibujado con drawImage(path).
+"""
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen.canvas import Canvas
+
+from src.application.utils.assets import get_logo_path
+from src.infrastructure.pdf.image_cache import draw_cached_image, get_cached_image
+
+
+def _render(draw, pages: int = 2) -> bytes:
+    """Renderiza un PDF invariant dibujando el logo en cada página."""
+    buffer = BytesIO()
+    canvas = Canvas(buffer, pagesize=A4, invariant=1)
+    for _ in range(pages):
+        draw(canvas)
+        canvas.showPage()
+    canvas.save()
+    return buffer.getvalue()
+
+
+def test_logo_path_exists():
+    """Verifica que el logo empaquetado se encuentra."""
+    assert get_logo_path() is not None
+
+
+def test_cached_image_decoded_once():
+    """Verifica que la imagen se decodifica una vez por ruta."""
+    get_cached_image.cache_clear()
+    logo_path = get_logo_path()
+
+    first = get_cached_image(logo_path)
+    second = get_cached_image(logo_path)
+
+    assert first is second
+    assert get_cached_image.cache_info().misses == 1
+    assert first.width > 0 and first.height > 0
+
+
+def test_missing_image_returns_none():
+    """Verifica que una ruta inexistente no rompe el header."""
+    assert get_cached_image("/no/existe/logo.png") is None
+    assert get_cached_image(None) is None
+
+
+def test_cached_draw_matches_draw_image():
+    """Verifica que el PDF es byte a byte igual al de drawImage(path)."""
+    logo_path = get_logo_path()
+    logo = get_cached_image(logo_path)
+    kwargs = dict(width=120, height=40, preserveAspectRatio=True, anchor="nw")
+
+    expected = _render(lambda c: c.drawImage(logo_path, 50, 750, **kwargs))
+    actual = _render(lambda c: draw_cached_image(c, logo, 50, 750, **kwargs))
+
+    assert actual == expected
+
+
+def test_cached_image_reused_across_documents():
+    """Verifica que varios documentos comparten la misma plantilla."""
+    logo = get_cached_image(get_logo_path())
+
+    pdf1 = _render(lambda c: draw_cached_image(c, logo, 50, 750, width=120, height=40))
+    pdf2 = _render(lambda c: draw_cached_image(c, logo, 50, 750, width=120, height=40))
+
+    assert pdf1 == pdf2
+    assert pdf1.count(b"/Subtype /Image") == 1
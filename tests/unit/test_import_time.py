@@ -0,0 +1,59 @@
+"""
+Tests del tiempo de import de la aplicación
+===========================================
+
+Un worker de gunicorn recién levantado importa `src.main` antes de
+atender nada. ReportLab y los casos de uso se cargan con el primer
+request o en el warm-up, no al importar: este test mide
+`python -X importtime -c "import src.main"` contra un presupuesto y
+verifica que esos módulos no se importen.
+
+El presupuesto se puede ajustar en máquinas lentas con la variable de
+entorno PDF_IMPORT_BUDGET_MS.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+
+# Presupuesto del import en frío de src.main (FastAPI incluido)
+IMPORT_BUDGET_MS = float(os.environ.get("PDF_IMPORT_BUDGET_MS", 1500))
+
+# Módulos que solo se cargan al renderizar
+LAZY_PREFIXES = ("reportlab", "src.infrastructure.pdf", "src.application.use_cases")
+
+
+def _importtime() -> dict[str, int]:
+    """Tiempo acumulado (µs) de cada módulo importado por `import src.main`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_does_not_load_renderers():
+    """Importar la aplicación no carga ReportLab, los generadores ni los casos de uso."""
+    loaded = [name for name in _importtime() if name.startswith(LAZY_PREFIXES)]
+
+    assert loaded == []
+
+
+def test_import_time_within_budget():
+    """El mejor de tres imports en frío de src.main entra en el presupuesto."""
+    best_ms = min(_importtime()["src.main"] for _ in range(3)) / 1000
+
+    assert best_ms <= IMPORT_BUDGET_MS, f"import src.main: {best_ms:.0f} ms (presupuesto {IMPORT_BUDGET_MS:.0f} ms)"
@@ -0,0 +1,198 @@
+"""
+Test del pool de workers de jobs
+================================
+
+Verifica que los jobs se renderizan en segundo plano, que los errores
+quedan registrados y que los jobs interrumpidos se retoman al arrancar.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.jobs import JobWorkerPool
+from src.domain.entities import JobStatus, RenderJob
+from src.domain.exceptions import InvalidDocumentError, JobNotReadyError
+from src.infrastructure.concurrency import RenderExecutor
+from src.infrastructure.persistence import SQLiteJobRepository
+
+
+def render_ok(payload):
+    return SimpleNamespace(content=b"%PDF " + payload["nombre"].encode(), filename="doc.pdf")
+
+
+def render_invalid(payload):
+    raise InvalidDocumentError("datos inválidos")
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SQLiteJobRepository(str(tmp_path / "jobs.db"))
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def executor():
+    executor = RenderExecutor(workers=2, max_queue=4)
+    yield executor
+    executor.shutdown()
+
+
+def _pool(repository, executor, max_attempts=3) -> JobWorkerPool:
+    return JobWorkerPool(
+        repository,
+        handlers={"ok": render_ok, "invalid": render_invalid},
+        executor=executor,
+        workers=2,
+        max_attempts=max_attempts,
+    )
+
+
+async def _wait_finished(pool: JobWorkerPool, job_id: str) -> RenderJob:
+    for _ in range(200):
+        job = await pool.get(job_id)
+        if job.is_finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("el job no terminó")
+
+
+async def test_submitted_job_is_rendered_in_background(repository, executor):
+    """submit responde enseguida y el PDF queda disponible al terminar."""
+    pool = _pool(repository, executor)
+    await pool.start()
+    try:
+        job = await pool.submit("ok", {"nombre": "Ana"})
+        assert job.status == JobStatus.PENDING
+
+        finished = await _wait_finished(pool, job.id)
+        _, content = await pool.get_result(job.id)
+    finally:
+        await pool.stop()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert content == b"%PDF Ana"
+
+
+async def test_domain_errors_fail_the_job_without_retry(repository, executor):
+    """Un error de datos marca el job FAILED en el primer intento."""
+    pool = _pool(repository, executor)
+    await pool.start()
+    try:
+        job = await pool.submit("invalid", {})
+        finished = await _wait_finished(pool, job.id)
+        with pytest.raises(JobNotReadyError):
+            await pool.get_result(job.id)
+    finally:
+        await pool.stop()
+
+    assert finished.status == JobStatus.FAILED
+    assert finished.attempts == 1
+    assert finished.error["error"] == "INVALID_DOCUMENT"
+
+
+async def test_interrupted_jobs_resume_on_start(repository, executor):
+    """Un job que quedó RUNNING (proceso detenido) se retoma al arrancar."""
+    job = RenderJob(tipo="ok", payload={"nombre": "Beto"})
+    repository.save(job)
+    repository.claim(job.id)  # el proceso anterior lo estaba renderizando
+
+    pool = _pool(repository, executor)
+    await pool.start()
+    try:
+        finished = await _wait_finished(pool, job.id)
+    finally:
+        await pool.stop()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.attempts == 2
+
+
+async def test_job_over_max_attempts_is_failed(repository, executor):
+    """Un job interrumpido demasiadas veces no se reintenta más."""
+    job = RenderJob(tipo="ok", payload={"nombre": "Caro"})
+    repository.save(job)
+    repository.claim(job.id)
+
+    pool = _pool(repository, executor, max_attempts=1)
+    await pool.start()
+    try:
+        finished = await _wait_finished(pool, job.id)
+    finally:
+        await pool.stop()
+
+    assert finished.status == JobStatus.FAILED
+    assert finished.error["error"] == "MAX_ATTEMPTS_EXCEEDED"
+
+
+async def test_failed_job_waits_before_retrying(repository, executor):
+    """Un error transitorio se reintenta recién pasado el backoff."""
+    attempts = []
+
+    def flaky(payload):
+        attempts.append(time.perf_counter())
+        if len(attempts) == 1:
+            raise OSError("disco lleno")
+        return render_ok(payload)
+
+    pool = JobWorkerPool(
+        repository,
+        handlers={"flaky": flaky},
+        executor=executor,
+        max_attempts=3,
+        retry_backoff=0.3,
+    )
+    await pool.start()
+    try:
+        job = await pool.submit("flaky", {"nombre": "Dani"})
+        finished = await _wait_finished(pool, job.id)
+    finally:
+        await pool.stop()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.attempts == 2
+    assert attempts[1] - attempts[0] >= 0.3
+
+
+class SlowResultRepository(SQLiteJobRepository):
+    """Repositorio cuyo save_result tarda como la escritura de un BLOB grande."""
+
+    def save_result(self, job, content):
+        time.sleep(0.3)
+        super().save_result(job, content)
+
+
+async def test_event_loop_stays_responsive_while_saving_large_result(tmp_path, executor):
+    """Guardar el PDF corre fuera del event loop: los demás requests no esperan."""
+    repository = SlowResultRepository(str(tmp_path / "jobs.db"))
+    large = SimpleNamespace(content=b"%PDF " + b"x" * (16 * 1024 * 1024), filename="doc.pdf")
+    pool = JobWorkerPool(repository, handlers={"large": lambda payload: large}, executor=executor)
+
+    gaps = []
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    await pool.start()
+    ticking = asyncio.create_task(ticker())
+    try:
+        job = await pool.submit("large", {})
+        finished = await _wait_finished(pool, job.id)
+        _, content = await pool.get_result(job.id)
+    finally:
+        done.set()
+        await ticking
+        await pool.stop()
+        repository.close()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert content == large.content
+    assert max(gaps) < 0.2
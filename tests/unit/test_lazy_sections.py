@@ -0,0 +1,65 @@
+"""
+Tests de secciones perezosas
+============================
+
+Verifica que PDFDocument acepta un iterable de secciones y que
+ReportLabGenerator las pide de a una a medida que avanza el layout.
+"""
+from io import BytesIO
+
+from src.domain.entities import PDFDocument, PDFSection
+from src.infrastructure.pdf import ReportLabGenerator
+from src.infrastructure.pdf.section_feed import SectionFeedDocTemplate
+
+
+def test_document_keeps_order_of_lazy_and_added_sections():
+    """Las secciones agregadas después van detrás de las perezosas."""
+    document = PDFDocument(
+        title="Reporte",
+        sections=(PDFSection(title=f"S{i}") for i in range(3)),
+    )
+    document.add_section(PDFSection(title="Anexo"))
+
+    assert document.has_lazy_sections
+    assert document.section_count == 0
+    assert [s.title for s in document.iter_sections()] == ["S0", "S1", "S2", "Anexo"]
+    assert not document.has_lazy_sections
+
+
+def test_materialize_sections_keeps_them_in_the_list():
+    """materialize_sections produce las perezosas y las deja en `sections`."""
+    document = PDFDocument(title="Reporte", sections=iter([PDFSection(title="S0")]))
+    document.add_section(PDFSection(title="S1"))
+
+    document.materialize_sections()
+
+    assert [s.title for s in document.sections] == ["S0", "S1"]
+    assert [s.title for s in document.iter_sections()] == ["S0", "S1"]
+
+
+def test_generator_requests_sections_as_layout_advances(monkeypatch):
+    """Cada sección se produce recién cuando las anteriores ya se dibujaron."""
+    pages_started = []
+    original_page_begin = SectionFeedDocTemplate.handle_pageBegin
+
+    def counting_page_begin(self):
+        pages_started.append(self.page + 1)
+        original_page_begin(self)
+
+    monkeypatch.setattr(SectionFeedDocTemplate, "handle_pageBegin", counting_page_begin)
+
+    pages_when_produced = []
+
+    def sections():
+        for i in range(6):
+            pages_when_produced.append(len(pages_started))
+            yield PDFSection(title=f"Sección {i}", content="Texto del reporte. " * 400)
+
+    buffer = BytesIO()
+    ReportLabGenerator().generate_to_stream(PDFDocument(title="Reporte", sections=sections()), buffer)
+
+    assert buffer.getvalue().startswith(b"%PDF")
+    assert len(pages_when_produced) == 6
+    # Cada sección ocupa más de una página: la última se pide varias páginas después
+    assert pages_when_produced == sorted(pages_when_produced)
+    assert pages_when_produced[-1] > pages_when_produced[0] + 4
@@ -0,0 +1,112 @@
+"""
+Tests de las métricas Prometheus
+================================
+
+Verifica que InstrumentedPDFGenerator registra duración, bytes, páginas
+y errores de cada render, y que en modo multi-proceso /metrics agrega
+los valores de todos los workers.
+"""
+import os
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.domain.entities import PDFDocument, PDFSection
+from src.domain.exceptions import PDFGenerationError
+from src.infrastructure.metrics import InstrumentedPDFGenerator
+from src.infrastructure.pdf import ReportLabGenerator
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _document(sections: int) -> PDFDocument:
+    document = PDFDocument(title="Reporte", metadata={"tipo_documento": "reporte_test"})
+    for i in range(sections):
+        document.add_section(PDFSection(title=f"Sección {i}", content="Texto. " * 400))
+    return document
+
+
+def test_instrumented_generator_records_render_metrics():
+    """Cada render suma una observación de duración, bytes y páginas para su tipo."""
+    generator = InstrumentedPDFGenerator(ReportLabGenerator())
+    labels = {"tipo_documento": "reporte_test"}
+    renders_before = _sample("pdf_render_duration_seconds_count", **labels)
+    bytes_before = _sample("pdf_render_output_bytes_sum", **labels)
+    pages_before = _sample("pdf_render_pages_sum", **labels)
+
+    stream = BytesIO()
+    generator.generate_to_stream(_document(sections=6), stream)
+
+    assert _sample("pdf_render_duration_seconds_count", **labels) == renders_before + 1
+    assert _sample("pdf_render_output_bytes_sum", **labels) == bytes_before + len(stream.getvalue())
+    assert _sample("pdf_render_pages_sum", **labels) - pages_before > 1
+    assert _sample("pdf_renders_in_flight") == 0
+
+
+def test_instrumented_generator_counts_errors_by_cause():
+    """Un error envuelto en PDFGenerationError se cuenta con el tipo de la causa original."""
+    class BrokenGenerator(ReportLabGenerator):
+        def generate(self, document, style=None):
+            try:
+                raise KeyError("fuente")
+            except KeyError as e:
+                raise PDFGenerationError(str(e))
+
+    generator = InstrumentedPDFGenerator(BrokenGenerator())
+    labels = {"tipo_documento": "reporte_test", "exception": "KeyError"}
+    before = _sample("pdf_render_errors_total", **labels)
+
+    with pytest.raises(PDFGenerationError):
+        generator.generate(_document(sections=1))
+
+    assert _sample("pdf_render_errors_total", **labels) == before + 1
+
+
+_WORKER = """
+from src.infrastructure.metrics.prometheus import RENDER_QUEUE_DEPTH, RENDER_REJECTED
+RENDER_REJECTED.inc()
+RENDER_QUEUE_DEPTH.inc(2)
+"""
+
+_SCRAPE = """
+import sys
+from prometheus_client import multiprocess
+from src.infrastructure.metrics import metrics_payload
+for pid in sys.argv[1:]:
+    multiprocess.mark_process_dead(int(pid))
+print(metrics_payload()[0].decode())
+"""
+
+
+def test_multiprocess_metrics_are_aggregated(tmp_path):
+    """Con PROMETHEUS_MULTIPROC_DIR el scrape suma los workers y descarta los gauges de los muertos."""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": str(ROOT)}
+
+    def run(code: str, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-c", code, *args],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+
+    workers = [
+        subprocess.Popen([sys.executable, "-c", _WORKER], cwd=ROOT, env=env)
+        for _ in range(2)
+    ]
+    for worker in workers:
+        assert worker.wait() == 0
+
+    metrics = run(_SCRAPE).stdout
+    assert "pdf_render_rejected_total 2.0" in metrics
+    assert "pdf_render_queue_depth 4.0" in metrics
+
+    metrics = run(_SCRAPE, str(workers[0].pid)).stdout
+    assert "pdf_render_rejected_total 2.0" in metrics
+    assert "pdf_render_queue_depth 2.0" in metrics
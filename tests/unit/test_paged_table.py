@@ -0,0 +1,69 @@
+"""
+Tests de PagedTable
+===================
+
+Verifica que las tablas grandes se parten de a una página con el header
+repetido y que el generador usa ese modo por encima de LARGE_TABLE_ROWS.
+"""
+from io import BytesIO
+
+from reportlab.platypus import TableStyle
+
+from src.domain.entities import PDFDocument, PDFSection, PDFTable
+from src.domain.value_objects import PDFStyle
+from src.infrastructure.pdf import ReportLabGenerator
+from src.infrastructure.pdf.paged_table import PagedTable
+
+
+def _paged_table(rows: int) -> PagedTable:
+    return PagedTable(
+        headers=["Legajo", "Nombre"],
+        rows=[[str(i), f"Alumno {i}"] for i in range(rows)],
+        style=TableStyle([("FONTNAME", (0, 0), (-1, -1), "Times-Roman")]),
+        font_name="Times-Roman",
+        font_size=10,
+        padding=4,
+    )
+
+
+def test_split_takes_one_page_of_rows_plus_header():
+    """Cada corte toma las filas que entran (header incluido) y deja el resto."""
+    table = _paged_table(rows=100)
+    row_height = 10 * 1.2 + 2 * 4
+
+    page, rest = table.split(400, row_height * 31)
+
+    assert len(page._cellvalues) == 31  # header + 30 filas
+    assert page._cellvalues[0] == ["Legajo", "Nombre"]
+    assert page._cellvalues[1] == ["0", "Alumno 0"]
+    assert rest.remaining_rows == 70
+    assert rest.wrap(400, 10_000)[1] == row_height * 71
+
+
+def test_split_without_room_for_a_row_moves_to_next_page():
+    """Si no entra ni una fila además del header, la tabla pasa a la página siguiente."""
+    table = _paged_table(rows=10)
+
+    assert table.split(400, 25) == []
+
+
+def test_generator_uses_paged_mode_for_large_tables(monkeypatch):
+    """Por encima del umbral la tabla se arma con PagedTable y el PDF sale completo."""
+    generator = ReportLabGenerator()
+    monkeypatch.setattr(generator, "LARGE_TABLE_ROWS", 50)
+
+    small = PDFTable(headers=["A", "B"], rows=[["1", "2"]] * 50)
+    large = PDFTable(headers=["A", "B"], rows=[["1", "2"]] * 51)
+    styles = generator._create_styles(PDFStyle.default())
+
+    assert not any(isinstance(e, PagedTable) for e in generator._build_table(small, styles))
+    assert any(isinstance(e, PagedTable) for e in generator._build_table(large, styles))
+
+    section = PDFSection(title="Detalle")
+    section.elements.append(PDFTable(headers=["A", "B"], rows=[[str(i), "x"] for i in range(300)]))
+    document = PDFDocument(title="Reporte")
+    document.add_section(section)
+    buffer = BytesIO()
+    generator.generate_to_stream(document, buffer)
+
+    assert buffer.getvalue().startswith(b"%PDF")
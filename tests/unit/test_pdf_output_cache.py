@@ -0,0 +1,174 @@
+"""
+Test de la caché de PDFs generados
+===================================
+
+Verifica la caché direccionada por contenido que envuelve a los
+casos de uso de comprobantes.
+"""
+import sys
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.cache import PDFOutputCache
+from src.application.use_cases.cached_comprobante import CachedComprobanteUseCase
+from src.application.use_cases.generar_comprobante_postulacion import (
+    GenerarComprobantePostulacionUseCase,
+    GenerarComprobanteResult,
+)
+from src.domain.interfaces import IPDFGenerator
+
+tests_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(tests_dir))
+
+from test_data.comprobante_postulacion_mocks import (
+    mock_comprobante_postulacion_dto,
+    mock_comprobante_minimo,
+)
+
+
+def _result(size: int, numero: int = 1) -> GenerarComprobanteResult:
+    """Resultado falso con un contenido de `size` bytes."""
+    return GenerarComprobanteResult(
+        content=b"x" * size,
+        filename=f"comprobante_postulacion_{numero}.pdf",
+        document_id=str(numero),
+        numero_postulacion=numero,
+    )
+
+
+@pytest.fixture
+def mock_pdf_generator():
+    """Generador mock que cuenta las llamadas."""
+    generator = Mock(spec=IPDFGenerator)
+    generator.generate.return_value = b"PDF_CONTENT_MOCK"
+    return generator
+
+
+@pytest.fixture
+def cached_use_case(mock_pdf_generator):
+    """Use case de postulación envuelto con una caché nueva."""
+    return CachedComprobanteUseCase(
+        GenerarComprobantePostulacionUseCase(mock_pdf_generator),
+        PDFOutputCache(max_bytes=1024),
+        namespace="comprobante_postulacion",
+    )
+
+
+# ================================
+# Tests de PDFOutputCache
+# ================================
+
+def test_cache_hit_and_miss_counts():
+    """get() cuenta aciertos y fallos."""
+    cache = PDFOutputCache(max_bytes=100)
+    result = _result(10)
+
+    assert cache.get("a") is None
+    cache.put("a", result)
+    assert cache.get("a") is result
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size_bytes == 10
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    """Al superar el presupuesto se desaloja la entrada menos usada."""
+    cache = PDFOutputCache(max_bytes=100)
+    cache.put("a", _result(40))
+    cache.put("b", _result(40))
+    cache.get("a")  # "a" pasa a ser la más reciente
+
+    cache.put("c", _result(40))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats().evictions == 1
+    assert cache.stats().size_bytes == 80
+
+
+def test_cache_skips_results_larger_than_budget():
+    """Un PDF más grande que el presupuesto total no se cachea."""
+    cache = PDFOutputCache(max_bytes=10)
+    cache.put("a", _result(11))
+
+    assert cache.stats().entries == 0
+
+
+# ================================
+# Tests de CachedComprobanteUseCase
+# ================================
+
+def test_cached_use_case_hit_skips_generator(cached_use_case, mock_pdf_generator):
+    """El segundo request idéntico no vuelve a llamar al generador."""
+    first = cached_use_case.execute(mock_comprobante_postulacion_dto())
+    second = cached_use_case.execute(mock_comprobante_postulacion_dto())
+
+    assert second.content == first.content
+    assert second.filename == first.filename
+    mock_pdf_generator.generate.assert_called_once()
+
+
+def test_cached_use_case_different_dtos_are_different_keys(
+    cached_use_case, mock_pdf_generator
+):
+    """DTOs con contenido distinto no comparten entrada."""
+    cached_use_case.execute(mock_comprobante_postulacion_dto())
+    cached_use_case.execute(mock_comprobante_minimo())
+
+    assert mock_pdf_generator.generate.call_count == 2
+
+
+def test_cached_use_case_stream_hit_writes_cached_bytes(
+    cached_use_case, mock_pdf_generator
+):
+    """execute_to_stream sirve los bytes cacheados en un acierto."""
+    result = cached_use_case.execute(mock_comprobante_postulacion_dto())
+
+    stream = BytesIO()
+    document_id = cached_use_case.execute_to_stream(
+        mock_comprobante_postulacion_dto(), stream
+    )
+
+    assert stream.getvalue() == result.content
+    assert document_id == result.document_id
+    mock_pdf_generator.generate_to_stream.assert_not_called()
+
+
+def test_cached_use_case_stream_miss_populates_cache(
+    cached_use_case, mock_pdf_generator
+):
+    """Un fallo por streaming guarda lo escrito para el próximo request."""
+    mock_pdf_generator.generate_to_stream.side_effect = (
+        lambda document, stream, style: stream.write(b"PDF_STREAMED")
+    )
+
+    stream = BytesIO()
+    cached_use_case.execute_to_stream(mock_comprobante_postulacion_dto(), stream)
+    result = cached_use_case.execute(mock_comprobante_postulacion_dto())
+
+    assert stream.getvalue() == b"PDF_STREAMED"
+    assert result.content == b"PDF_STREAMED"
+    assert result.filename == cached_use_case.filename_for(mock_comprobante_postulacion_dto())
+    mock_pdf_generator.generate.assert_not_called()
+
+
+def test_cached_use_case_stream_miss_skips_oversized_pdf(
+    cached_use_case, mock_pdf_generator
+):
+    """Un PDF más grande que una entrada se envía completo pero no se copia ni cachea."""
+    payload = b"x" * 600
+    mock_pdf_generator.generate_to_stream.side_effect = (
+        lambda document, stream, style: (stream.write(payload), stream.write(payload))
+    )
+
+    stream = BytesIO()
+    cached_use_case.execute_to_stream(mock_comprobante_postulacion_dto(), stream)
+
+    assert stream.getvalue() == payload * 2
+    assert cached_use_case._cache.stats().entries == 0
@@ -0,0 +1,60 @@
+"""
+Test del generador con pool de procesos
+========================================
+
+Verifica que ProcessPoolPDFGenerator renderiza en procesos hijos
+y se comporta igual que ReportLabGenerator desde afuera.
+"""
+from io import BytesIO
+
+import pytest
+
+from src.domain.entities import PDFDocument, PDFSection
+from src.domain.exceptions import PDFGenerationError
+from src.infrastructure.pdf import ProcessPoolPDFGenerator
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Pool con un único proceso hijo (compartido por el módulo)."""
+    pool = ProcessPoolPDFGenerator(max_workers=1)
+    pool.warm_up()
+    yield pool
+    pool.shutdown()
+
+
+def test_generate_returns_pdf_bytes(generator, sample_document, sample_style):
+    """El PDF renderizado en el proceso hijo llega completo al padre."""
+    content = generator.generate(sample_document, sample_style)
+
+    assert content.startswith(b"%PDF")
+    assert content.rstrip().endswith(b"%%EOF")
+
+
+def test_generate_to_stream_writes_pdf(generator, sample_document):
+    """generate_to_stream escribe los bytes del hijo en el stream."""
+    stream = BytesIO()
+    generator.generate_to_stream(sample_document, stream)
+
+    assert stream.getvalue().startswith(b"%PDF")
+
+
+def test_lazy_sections_are_rendered_in_worker(generator):
+    """Las secciones perezosas se producen en el padre antes de enviar el documento."""
+    document = PDFDocument(
+        title="Reporte",
+        sections=(PDFSection(title=f"S{i}", content="Texto") for i in range(3)),
+    )
+
+    content = generator.generate(document)
+
+    assert content.startswith(b"%PDF")
+    assert [s.title for s in document.sections] == ["S0", "S1", "S2"]
+
+
+def test_worker_error_is_pdf_generation_error(generator, sample_document):
+    """Los errores del proceso hijo se traducen a PDFGenerationError."""
+    sample_document.sections[0].content = "<b>markup sin cerrar"
+
+    with pytest.raises(PDFGenerationError):
+        generator.generate(sample_document)
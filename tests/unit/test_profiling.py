@@ -0,0 +1,82 @@
+"""
+Tests del perfilado de renders
+==============================
+
+Verifica que los dos modos de `run_profiled` entregan pstats y pilas
+collapsed, y el anillo acotado de ProfileStore.
+"""
+import pstats
+import time
+
+import pytest
+
+from src.domain.exceptions import DocumentNotFoundError
+from src.infrastructure.profiling import ProfileResult, ProfileStore, run_profiled
+
+
+def _busy_render(seconds: float) -> str:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return "ok"
+
+
+def _pstats_functions(tmp_path, profile: ProfileResult) -> set[str]:
+    path = tmp_path / "render.pstats"
+    path.write_bytes(profile.pstats)
+    return {name for _, _, name in pstats.Stats(str(path)).stats}
+
+
+def _assert_collapsed(profile: ProfileResult) -> None:
+    lines = profile.collapsed.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_busy_render (test_profiling.py" in line for line in lines)
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "sampling"])
+def test_both_modes_produce_pstats_and_collapsed(tmp_path, mode):
+    """Cada modo entrega un pstats que carga con pstats.Stats y pilas `raíz;...;hoja N`."""
+    result, profile = run_profiled(_busy_render, 0.1, mode=mode, interval=0.002)
+
+    assert result == "ok"
+    assert profile.mode == mode
+    assert "_busy_render" in _pstats_functions(tmp_path, profile)
+    _assert_collapsed(profile)
+
+
+def test_cprofile_collapsed_stacks_follow_the_call_graph():
+    """Las pilas derivadas de cProfile pasan por el llamador y suman su tiempo."""
+    def outer_render():
+        return _busy_render(0.05)
+
+    _, profile = run_profiled(outer_render, mode="cprofile")
+
+    weights = {
+        stack: int(weight)
+        for stack, weight in (line.rsplit(" ", 1) for line in profile.collapsed.splitlines())
+    }
+    nested = [stack for stack in weights if "outer_render (" in stack and "_busy_render (" in stack]
+    assert nested
+    assert sum(weights.values()) == pytest.approx(profile.duration * 1_000_000, rel=0.5)
+
+
+def test_store_keeps_only_the_newest_profiles(tmp_path):
+    """Por encima de max_profiles se borran los más viejos, con todos sus archivos."""
+    store = ProfileStore(tmp_path, max_profiles=2)
+    profile = ProfileResult(
+        mode="sampling", duration=0.5, pstats=b"", collapsed="main;render 3\n"
+    )
+    ids = [f"20240301T10000{i}-0000000{i}" for i in range(3)]
+
+    for profile_id in ids:
+        store.save(profile_id, profile, label="generico")
+
+    assert [p["id"] for p in store.recent()] == [ids[2], ids[1]]
+    assert store.path_for(ids[2], "collapsed").read_text() == "main;render 3\n"
+    assert store.recent()[0]["formats"] == ["pstats", "collapsed"]
+    assert store.path_for(ids[2], "pstats").is_file()
+    assert not list(tmp_path.glob(f"{ids[0]}.*"))
+    with pytest.raises(DocumentNotFoundError):
+        store.path_for(ids[2], "flamegraph")
+    with pytest.raises(DocumentNotFoundError):
+        store.path_for("../settings", "collapsed")
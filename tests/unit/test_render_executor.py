@@ -0,0 +1,89 @@
+"""
+Test del executor de renders
+============================
+
+Verifica el control de admisión (rechazo inmediato con la cola llena)
+y las métricas de cola, espera y renders activos.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.domain.exceptions import ServiceOverloadedError
+from src.infrastructure.concurrency import RenderExecutor
+
+
+@pytest.fixture
+def executor():
+    """Executor con un worker y un lugar en cola."""
+    executor = RenderExecutor(workers=1, max_queue=1, retry_after=3)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+async def test_rejects_when_workers_and_queue_are_full(executor):
+    """Con el worker ocupado y la cola llena se rechaza sin esperar."""
+    release = threading.Event()
+
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(lambda: "queued")
+
+    with pytest.raises(ServiceOverloadedError) as exc_info:
+        executor.submit(lambda: "rejected")
+
+    assert exc_info.value.retry_after == 3
+    assert exc_info.value.code == "SERVICE_OVERLOADED"
+
+    release.set()
+    await running
+    assert await queued == "queued"
+    assert executor.stats().rejected == 1
+
+
+async def test_stats_track_active_queue_and_wait(executor):
+    """Las métricas reflejan renders activos, en cola y la espera."""
+    release = threading.Event()
+
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(lambda: None)
+    await asyncio.sleep(0.05)
+
+    stats = executor.stats()
+    assert (stats.active, stats.queued) == (1, 1)
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+    stats = executor.stats()
+    assert (stats.active, stats.queued, stats.completed) == (0, 0, 2)
+    assert stats.wait_max_ms >= 40  # el segundo esperó al primero
+    assert stats.wait_p95_ms == stats.wait_max_ms
+
+
+async def test_exceptions_propagate_and_free_the_worker(executor):
+    """Un render que falla libera su lugar y propaga el error."""
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+
+    assert await executor.run(lambda: 42) == 42
+    assert executor.stats().active == 0
+
+
+async def test_cancelled_before_start_releases_queue_slot(executor):
+    """Cancelar un render que esperaba en cola libera su lugar."""
+    release = threading.Event()
+
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(lambda: "never")
+    queued.cancel()
+    await asyncio.sleep(0)
+
+    assert executor.stats().queued == 0
+    executor.submit(lambda: None)  # hay lugar otra vez
+
+    release.set()
+    await running
@@ -0,0 +1,182 @@
+"""
+Test del repositorio SQLite de jobs
+===================================
+
+Verifica la persistencia de jobs y resultados, la toma atómica de
+jobs pendientes y la recuperación tras un reinicio.
+"""
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.entities import JobStatus, RenderJob
+from src.infrastructure.persistence import SQLiteJobRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repositorio sobre un archivo temporal."""
+    repository = SQLiteJobRepository(str(tmp_path / "jobs.db"))
+    yield repository
+    repository.close()
+
+
+def test_save_and_get_roundtrip(repository):
+    """El job se recupera con su payload y estado."""
+    job = RenderJob(tipo="comprobante_postulacion", payload={"numero": 5432, "nombre": "Ñandú"})
+    repository.save(job)
+
+    loaded = repository.get(job.id)
+
+    assert loaded == job
+    assert repository.get("inexistente") is None
+
+
+def test_claim_is_exclusive(repository):
+    """Solo el primer claim toma el job e incrementa sus intentos."""
+    job = RenderJob(tipo="comprobante_postulacion", payload={})
+    repository.save(job)
+
+    claimed = repository.claim(job.id)
+
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.attempts == 1
+    assert repository.claim(job.id) is None
+
+
+def test_result_is_stored_with_final_state(repository):
+    """save_result guarda el PDF y el estado en la misma fila."""
+    job = RenderJob(tipo="comprobante_postulacion", payload={})
+    repository.save(job)
+    job = repository.claim(job.id)
+    job.mark_succeeded("comprobante.pdf")
+
+    repository.save_result(job, b"%PDF-1.4 contenido")
+
+    assert repository.get(job.id).status == JobStatus.SUCCEEDED
+    assert repository.get(job.id).filename == "comprobante.pdf"
+    assert repository.get_result(job.id) == b"%PDF-1.4 contenido"
+
+
+def test_pending_and_running_jobs_survive_reopen(tmp_path):
+    """Al reabrir la base, los jobs interrumpidos vuelven a pendientes."""
+    path = str(tmp_path / "jobs.db")
+    first = SQLiteJobRepository(path)
+    pending = RenderJob(tipo="comprobante_postulacion", payload={})
+    running = RenderJob(tipo="comprobante_contrato", payload={})
+    first.save(running)
+    first.save(pending)
+    first.claim(running.id)
+    first.close()
+
+    reopened = SQLiteJobRepository(path)
+    assert reopened.requeue_running(timedelta(minutes=15)) == 1
+    assert set(reopened.pending_ids()) == {pending.id, running.id}
+    assert reopened.get(running.id).attempts == 1
+    reopened.close()
+
+
+def _running_job(path: str, owner_pid: int, claimed_at: datetime) -> RenderJob:
+    """Job RUNNING tomado por `owner_pid` (otro proceso) en `claimed_at`."""
+    repository = SQLiteJobRepository(path)
+    job = RenderJob(tipo="comprobante_postulacion", payload={})
+    repository.save(job)
+    repository.claim(job.id)
+    repository.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "UPDATE render_jobs SET owner_pid = ?, claimed_at = ? WHERE id = ?",
+            (owner_pid, claimed_at.isoformat(), job.id),
+        )
+    return job
+
+
+@pytest.fixture
+def sibling():
+    """Proceso vivo que hace de otro worker de gunicorn."""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    yield process.pid
+    process.kill()
+    process.wait()
+
+
+def test_jobs_of_a_live_owner_are_not_requeued(tmp_path, sibling):
+    """Un worker que arranca no le quita los jobs a un hermano vivo."""
+    path = str(tmp_path / "jobs.db")
+    job = _running_job(path, sibling, datetime.now(timezone.utc))
+
+    repository = SQLiteJobRepository(path)
+    assert repository.requeue_running(timedelta(minutes=15)) == 0
+    assert repository.get(job.id).status == JobStatus.RUNNING
+    repository.close()
+
+
+def test_jobs_of_a_dead_owner_are_requeued(tmp_path):
+    """Si el proceso dueño murió, el job vuelve a pendientes."""
+    path = str(tmp_path / "jobs.db")
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    job = _running_job(path, process.pid, datetime.now(timezone.utc))
+
+    repository = SQLiteJobRepository(path)
+    assert repository.requeue_running(timedelta(minutes=15)) == 1
+    assert repository.pending_ids() == [job.id]
+    repository.close()
+
+
+def test_jobs_with_expired_lease_are_requeued(tmp_path, sibling):
+    """Pasado el lease el job se retoma aunque el PID siga vivo (PID reusado)."""
+    path = str(tmp_path / "jobs.db")
+    job = _running_job(path, sibling, datetime.now(timezone.utc) - timedelta(hours=1))
+
+    repository = SQLiteJobRepository(path)
+    assert repository.requeue_running(timedelta(minutes=15)) == 1
+    assert repository.pending_ids() == [job.id]
+    repository.close()
+
+
+def test_database_without_owner_columns_is_migrated(tmp_path):
+    """Una base del esquema anterior gana las columnas y sus jobs RUNNING se retoman."""
+    path = str(tmp_path / "jobs.db")
+    now = datetime.now(timezone.utc).isoformat()
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE render_jobs (
+                id TEXT PRIMARY KEY, tipo TEXT NOT NULL, payload TEXT NOT NULL,
+                status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,
+                filename TEXT, error TEXT, created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL, result BLOB
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO render_jobs VALUES ('viejo', 'comprobante_postulacion', '{}', ?, 1, NULL, NULL, ?, ?, NULL)",
+            (JobStatus.RUNNING.value, now, now),
+        )
+    conn.close()
+
+    repository = SQLiteJobRepository(path)
+    assert repository.requeue_running(timedelta(minutes=15)) == 1
+    assert repository.pending_ids() == ["viejo"]
+    repository.close()
+
+
+def test_purge_only_removes_old_finished_jobs(repository):
+    """Se borran los jobs terminados antiguos, no los pendientes."""
+    old = RenderJob(tipo="comprobante_postulacion", payload={})
+    old.mark_failed({"error": "X"})
+    old.updated_at = datetime.now(timezone.utc) - timedelta(days=2)
+    pending = RenderJob(tipo="comprobante_postulacion", payload={})
+    pending.updated_at = old.updated_at
+    repository.save(old)
+    repository.save(pending)
+
+    purged = repository.purge_finished(datetime.now(timezone.utc) - timedelta(days=1))
+
+    assert purged == 1
+    assert repository.get(old.id) is None
+    assert repository.get(pending.id) is not None
@@ -0,0 +1,81 @@
+"""
+Tests del timer de etapas
+=========================
+
+Verifica que las etapas se acumulan en el timer del contexto, que sin
+timer activo la medición no hace nada, los histogramas y que los renders
+del RenderExecutor registran en el timer del request.
+"""
+import asyncio
+
+from src.application.utils.stage_timing import (
+    StageHistograms,
+    current_timer,
+    record_stage,
+    stage,
+    start_timer,
+    stop_timer,
+)
+from src.infrastructure.concurrency import RenderExecutor
+
+
+def test_stages_accumulate_in_active_timer():
+    """Una etapa medida varias veces acumula y aparece en Server-Timing."""
+    timer = start_timer()
+    try:
+        with stage("build_elements"):
+            pass
+        record_stage("build_elements", 0.010)
+        record_stage("doc_build", 0.0255)
+    finally:
+        stop_timer()
+
+    stages = timer.stages()
+    assert stages["build_elements"] >= 0.010
+    assert "doc_build;dur=25.5" in timer.server_timing()
+    assert current_timer() is None
+
+
+def test_stage_without_timer_is_noop():
+    """Con la medición desactivada stage() es un context manager vacío compartido."""
+    assert current_timer() is None
+    assert stage("a") is stage("b")
+    with stage("a"):
+        record_stage("a", 1.0)
+
+
+def test_histograms_cumulative_buckets():
+    """Los buckets son acumulativos y el último (+Inf) cuenta todas las observaciones."""
+    histograms = StageHistograms()
+    for seconds in (0.0005, 0.003, 0.003, 20.0):
+        histograms.observe("doc_build", seconds)
+
+    snapshot = histograms.snapshot()["doc_build"]
+    buckets = {bucket["le_ms"]: bucket["count"] for bucket in snapshot["buckets"]}
+
+    assert snapshot["count"] == 4
+    assert buckets[1] == 1
+    assert buckets[5] == 3
+    assert buckets[10000] == 3
+    assert buckets["+Inf"] == 4
+
+
+def test_render_executor_propagates_timer():
+    """El render corre en otro thread pero registra queue_wait y sus etapas en el timer del request."""
+    executor = RenderExecutor(workers=1, max_queue=1)
+
+    def render():
+        with stage("doc_build"):
+            return current_timer()
+
+    async def request():
+        timer = start_timer()
+        return timer, await executor.run(render)
+
+    try:
+        timer, seen = asyncio.run(request())
+    finally:
+        executor.shutdown()
+
+    assert seen is timer
+    assert set(timer.stages()) == {"queue_wait", "doc_build"}
@@ -0,0 +1,89 @@
+"""
+Tests de la caché de anchos de texto
+====================================
+
+Verifica que StringWidthCache mide igual que `stringWidth`, que su
+memoria es acotada, que se instala y desinstala para todo el layout y
+que el PDF sale igual con y sin ella.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import paragraph
+
+from src.domain.entities import PDFDocument, PDFSection
+from src.infrastructure.pdf import ReportLabGenerator, StringWidthCache
+from src.infrastructure.pdf.string_width_cache import (
+    install_string_width_cache,
+    installed_string_width_cache,
+    uninstall_string_width_cache,
+)
+
+CLAUSULA = (
+    "Las partes acuerdan que el estudiante realizará las prácticas profesionales "
+    "supervisadas en las instalaciones de la empresa, bajo la dirección del tutor designado."
+)
+
+
+def _document() -> PDFDocument:
+    document = PDFDocument(title="Convenio")
+    document.add_section(PDFSection(title="PRIMERA", content="\n\n".join([CLAUSULA] * 40)))
+    return document
+
+
+def test_widths_match_reportlab_and_are_cached():
+    """Los anchos son los de ReportLab; la segunda medición es un hit."""
+    cache = StringWidthCache()
+    original = pdfmetrics.getFont("Times-Roman").stringWidth("prácticas", 10)
+
+    assert cache.string_width("prácticas", "Times-Roman", 10) == original
+    assert cache.string_width("prácticas", "Times-Roman", 10) == original
+    assert cache.string_width("prácticas", "Times-Bold", 10) != original
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+
+
+def test_memory_is_bounded():
+    """Al llegar a max_entries la caché se vacía, y los textos largos no entran."""
+    cache = StringWidthCache(max_entries=100, max_text_length=20)
+
+    for i in range(250):
+        cache.string_width(f"palabra{i}", "Helvetica", 10)
+    cache.string_width(CLAUSULA, "Helvetica", 10)
+
+    stats = cache.stats()
+    assert stats["entries"] <= 100
+    assert stats["resets"] == 2
+    assert (CLAUSULA, "Helvetica", 10) not in cache._widths
+
+
+def test_install_and_uninstall_patch_the_layout(string_width_cache):
+    """Instalar reemplaza stringWidth en el layout; desinstalar restaura el original."""
+    cache = StringWidthCache()
+    install_string_width_cache(cache)
+    assert paragraph.stringWidth == cache.string_width
+    assert installed_string_width_cache() is cache
+
+    uninstall_string_width_cache()
+    assert paragraph.stringWidth is pdfmetrics.stringWidth
+    assert installed_string_width_cache() is None
+
+
+def test_output_is_the_same_with_and_without_cache(string_width_cache):
+    """El PDF sale igual byte a byte midiendo con o sin la caché."""
+    uninstall_string_width_cache()
+    expected = ReportLabGenerator(invariant=True).generate(_document())
+    if string_width_cache is not None:
+        install_string_width_cache(string_width_cache)
+
+    generator = ReportLabGenerator(invariant=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: generator.generate(_document()), range(6)))
+
+    assert all(result == expected for result in results)
+    if string_width_cache is not None:
+        assert string_width_cache.stats()["hit_ratio"] > 0.9
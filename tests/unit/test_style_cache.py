@@ -2,10 +2,12 @@
 Test de caché de estilos PDF
 =============================
 
-Verifica que los estilos se cacheen correctamente con @lru_cache.
+Verifica que las hojas de estilos compiladas se compartan por proceso
+(stylesheet_registry) y se reutilicen por valor del PDFStyle.
 """
 import pytest
 from src.infrastructure.pdf.reportlab_generator import ReportLabGenerator
+from src.infrastructure.pdf.stylesheet_registry import StylesheetRegistry, stylesheet_registry
 from src.domain.value_objects import PDFStyle
 
 
@@ -41,46 +43,72 @@ def test_style_cache_different_styles():
     assert generator._create_styles(professional_style) is styles_professional
 
 
-def test_style_cache_info():
-    """Verifica las estadísticas del cache."""
-    generator = ReportLabGenerator()
+def test_style_cache_shared_between_generators_and_equal_styles():
+    """Generadores distintos y estilos iguales por valor comparten la hoja compilada."""
+    styles1 = ReportLabGenerator()._create_styles(PDFStyle.default())
+    styles2 = ReportLabGenerator(invariant=True)._create_styles(PDFStyle.default())
     
-    # Limpiar cache
-    generator._create_styles.cache_clear()
+    assert styles1 is styles2
+    assert stylesheet_registry.intern(PDFStyle.default()) is styles1.style
+    assert styles1["body"].fontName == "Helvetica"
+    assert set(styles1.tables) == {"data", "signature"}
+
+
+def test_compiled_styles_follow_pdf_style():
+    """Dos PDFStyle distintos compilan fuentes, tamaños y colores distintos."""
+    registry = StylesheetRegistry()
+    default_sheet = registry.get(PDFStyle.default())
+    institutional_sheet = registry.get(PDFStyle.institutional())
     
+    assert default_sheet["title"].fontName == "Helvetica-Bold"
+    assert default_sheet["title"].fontSize == 24
+    assert default_sheet["title"].textColor.hexval() == "0x1a73e8"
+    assert institutional_sheet["title"].fontName == "Times-Bold"
+    assert institutional_sheet["title"].fontSize == 14
+    assert institutional_sheet["body"].leading == 14
+    assert institutional_sheet["body"].textColor.hexval() == "0x000000"
+    assert default_sheet.table_font == "Helvetica"
+    assert institutional_sheet.table_font == "Times-Roman"
+    assert default_sheet.tables["data"].getCommands() != institutional_sheet.tables["data"].getCommands()
+
+
+def test_style_cache_info():
+    """Verifica las estadísticas del registro."""
+    registry = StylesheetRegistry()
     style = PDFStyle.default()
     
     # Primera llamada
-    generator._create_styles(style)
-    cache_info = generator._create_styles.cache_info()
-    assert cache_info.hits == 0
-    assert cache_info.misses == 1
+    registry.get(style)
+    stats = registry.stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 1
     
-    # Segunda llamada (cache hit)
-    generator._create_styles(style)
-    cache_info = generator._create_styles.cache_info()
-    assert cache_info.hits == 1
-    assert cache_info.misses == 1
+    # Segunda llamada (hit)
+    registry.get(style)
+    stats = registry.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
 
 
 def test_style_cache_maxsize():
-    """Verifica que el cache respeta el maxsize."""
-    generator = ReportLabGenerator()
-    generator._create_styles.cache_clear()
+    """Verifica que el registro respeta max_entries sin desalojar los presets."""
+    registry = StylesheetRegistry(max_entries=16)
+    registry.precompile_presets()
+    preset_sheet = registry.get(PDFStyle.professional())
     
-    # Crear más de 16 estilos únicos (maxsize=16)
-    # Esto debería causar eviction de los primeros estilos
-    from src.domain.value_objects import ColorConfig, FontConfig, MarginConfig
+    # Crear más de 16 estilos únicos: se desalojan los primeros
+    from src.domain.value_objects import ColorConfig
     
-    styles_list = []
     for i in range(20):
         custom_color = ColorConfig(primary=f"#{i:02x}0000")  # Diferentes colores
-        custom_style = PDFStyle(colors=custom_color)
-        styles_list.append(generator._create_styles(custom_style))
+        registry.get(PDFStyle(colors=custom_color))
     
-    cache_info = generator._create_styles.cache_info()
-    # Debe haber evictions debido al maxsize
-    assert cache_info.currsize <= 16, "Cache size should not exceed maxsize"
+    stats = registry.stats()
+    assert stats["custom_entries"] == 16
+    assert stats["evictions"] == 4
+    assert stats["presets"] == 4
+    assert registry.get(PDFStyle.professional()) is preset_sheet
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+"""
+Test del modo plantilla
+=======================
+
+Verifica que la caché de textos de plantilla produce PDFs idénticos
+a los de Paragraph normal y que los textos fijos se reutilizan entre
+documentos distintos.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.application.use_cases.generar_comprobante_contrato import (
+    GenerarComprobanteContratoUseCase,
+)
+from src.domain.entities import PDFDocument, PDFSection
+from src.infrastructure.pdf import ReportLabGenerator, TemplateLayoutCache
+from test_data.comprobante_contrato_mocks import mock_comprobante_contrato_dto
+
+
+def _contrato(nombre: str = "Juan"):
+    comprobante = mock_comprobante_contrato_dto()
+    comprobante.estudiante.nombre = nombre
+    return comprobante
+
+
+def _render(generator, comprobante) -> bytes:
+    use_case = GenerarComprobanteContratoUseCase(generator, deterministic=True)
+    return use_case.execute(comprobante).content
+
+
+def test_template_mode_output_is_identical():
+    """El modo plantilla no cambia ni un byte del PDF."""
+    plain = ReportLabGenerator(invariant=True)
+    cached = ReportLabGenerator(invariant=True, layout_cache=TemplateLayoutCache())
+
+    expected = _render(plain, _contrato())
+
+    assert _render(cached, _contrato()) == expected
+    # Segunda vez: todo sale de la caché
+    assert _render(cached, _contrato()) == expected
+
+
+def test_static_text_reused_across_students():
+    """Los textos fijos del contrato se reutilizan con otro estudiante."""
+    cache = TemplateLayoutCache()
+    generator = ReportLabGenerator(invariant=True, layout_cache=cache)
+
+    _render(generator, _contrato("Juan"))
+    cache_after_first = cache.stats()
+    pdf = _render(generator, _contrato("María"))
+
+    assert cache.stats()["hits"] > cache_after_first["hits"]
+    assert pdf == _render(ReportLabGenerator(invariant=True), _contrato("María"))
+
+
+def test_split_paragraphs_do_not_corrupt_cache():
+    """Un párrafo partido entre páginas no altera las líneas compartidas."""
+    document = PDFDocument(title="Documento largo")
+    for i in range(3):
+        document.add_section(PDFSection(title=f"Sección {i}", content="Texto de plantilla. " * 400))
+
+    plain = ReportLabGenerator(invariant=True).generate(document)
+    generator = ReportLabGenerator(invariant=True, layout_cache=TemplateLayoutCache())
+
+    assert generator.generate(document) == plain
+    assert generator.generate(document) == plain
+
+
+def test_concurrent_renders_share_cache():
+    """Renders concurrentes con la misma caché producen el mismo PDF."""
+    generator = ReportLabGenerator(invariant=True, layout_cache=TemplateLayoutCache())
+    expected = _render(ReportLabGenerator(invariant=True), _contrato())
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: _render(generator, _contrato()), range(16)))
+
+    assert all(result == expected for result in results)
+
+
+def test_cache_is_bounded():
+    """La LRU no supera max_entries."""
+    cache = TemplateLayoutCache(max_entries=2)
+    for i in range(5):
+        cache.put_lines(("texto", i), object())
+
+    assert cache.stats()["lines_entries"] == 2
+    assert cache.get_lines(("texto", 0)) is None
+    assert cache.get_lines(("texto", 4)) is not None